@@ -18,63 +18,272 @@ Integration Points:
 - Lays pheromone trails for swarm intelligence
 """
 
-import json
+import asyncio
+import operator
 import os
 import sys
 import sqlite3
 import hashlib
+import queue
+import threading
 import time
+from collections import ChainMap, OrderedDict, defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any, Callable, Tuple, Union
+from typing import Optional, Dict, List, Any, Callable, Iterator, Tuple, Union
 from contextlib import contextmanager
+from functools import lru_cache
 from dataclasses import dataclass
 from enum import Enum
 import re
 
 from elf_paths import get_base_path
+from json_compat import dumps as json_dumps, loads as json_loads
+from migrations import (SQL_CLEAR_HOTSPOTS as _SQL_CLEAR_HOTSPOTS,
+                        SQL_REBUILD_HOTSPOTS as _SQL_REBUILD_HOTSPOTS,
+                        migrate, needs_migration)
 
 
-def safe_eval_condition(condition: str, context: dict) -> bool:
-    """Safely evaluate a condition string against a context dictionary."""
+_OPS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+}
+_LITERALS = {'true': True, 'false': False, 'none': None}
+_RE_NOT_IN = re.compile(r"['\"](\w+)['\"]\s+not\s+in\s+context")
+_RE_IN = re.compile(r"['\"](\w+)['\"]\s+in\s+context")
+_RE_CTX_GET = re.compile(r"context\.get\(['\"](\w+)['\"]\)\s*(==|!=|>|<|>=|<=)\s*(.+)")
+_RE_CTX_IDX = re.compile(r"context\[['\"](\w+)['\"]\]\s*(==|!=|>|<|>=|<=)\s*(.+)")
+
+
+def _parse_value(value_str) -> Union[str, int, float, bool, None]:
+    value_str = value_str.strip()
+    if value_str.startswith(("'", '"')) and value_str.endswith(("'", '"')):
+        return value_str[1:-1]
+    if value_str.lower() in _LITERALS:
+        return _LITERALS[value_str.lower()]
+    try:
+        return float(value_str) if '.' in value_str else int(value_str)
+    except ValueError:
+        return value_str
+
+
+def _compare(ctx_value, op, compare_value) -> bool:
+    if ctx_value is None or compare_value is None:
+        return (ctx_value == compare_value) if op == '==' else (ctx_value != compare_value) if op == '!=' else False
+    compare = _OPS.get(op)
+    return compare(ctx_value, compare_value) if compare else False
+
+
+def _prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode()).hexdigest()[:16]
+
+
+def _always_true(context: dict) -> bool:
+    return True
+
+
+def _always_false(context: dict) -> bool:
+    return False
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(condition: str) -> Callable[[dict], bool]:
+    """
+    Parse a condition string once into a predicate over a context dict.
+
+    Supports the same grammar as safe_eval_condition; unrecognized
+    conditions compile to a predicate that always returns False.
+    """
     if not condition or not condition.strip():
-        return True
+        return _always_true
     condition = condition.strip()
     if condition.lower() == 'true':
-        return True
+        return _always_true
     if condition.lower() == 'false':
-        return False
+        return _always_false
 
-    match = re.match(r"['\"](\w+)['\"]\s+not\s+in\s+context", condition)
+    match = _RE_NOT_IN.match(condition)
     if match:
-        return match.group(1) not in context
-    match = re.match(r"['\"](\w+)['\"]\s+in\s+context", condition)
+        key = match.group(1)
+        return lambda context: key not in context
+    match = _RE_IN.match(condition)
     if match:
-        return match.group(1) in context
-
-    def _parse_value(value_str) -> Union[str, int, float, bool, None]:
-        value_str = value_str.strip()
-        if value_str.startswith(("'", '"')) and value_str.endswith(("'", '"')):
-            return value_str[1:-1]
-        if value_str.lower() in ('true', 'false', 'none'):
-            return {'true': True, 'false': False, 'none': None}[value_str.lower()]
-        try:
-            return float(value_str) if '.' in value_str else int(value_str)
-        except ValueError:
-            return value_str
-
-    def _compare(ctx_value, op, compare_value) -> bool:
-        if ctx_value is None or compare_value is None:
-            return (ctx_value == compare_value) if op == '==' else (ctx_value != compare_value) if op == '!=' else False
-        ops = {'==': lambda a,b: a==b, '!=': lambda a,b: a!=b, '>': lambda a,b: a>b, '<': lambda a,b: a<b, '>=': lambda a,b: a>=b, '<=': lambda a,b: a<=b}
-        return ops.get(op, lambda a,b: False)(ctx_value, compare_value)
-
-    for pattern in [r"context\.get\(['\"](\w+)['\"]\)\s*(==|!=|>|<|>=|<=)\s*(.+)", r"context\[['\"](\w+)['\"]\]\s*(==|!=|>|<|>=|<=)\s*(.+)"]:
-        match = re.match(pattern, condition)
+        key = match.group(1)
+        return lambda context: key in context
+
+    for pattern in (_RE_CTX_GET, _RE_CTX_IDX):
+        match = pattern.match(condition)
         if match:
             key, op, value = match.groups()
-            return _compare(context.get(key), op, _parse_value(value))
-    return False
+            compare_value = _parse_value(value)
+            return lambda context: _compare(context.get(key), op, compare_value)
+    return _always_false
+
+
+def safe_eval_condition(condition: str, context: dict) -> bool:
+    """Safely evaluate a condition string against a context dictionary."""
+    return compile_condition(condition)(context)
+
+
+# Number of idle read-only connections kept per Conductor
+_READER_POOL_SIZE = 4
+_NODE_POOL_SIZE = 8
+_EXEC_FLUSH_EVERY = 64
+_WORKFLOW_CACHE_SIZE = 128
+_WORKFLOW_LIST_TTL = 1.0  # seconds
+_CALLBACK_QUEUE_SIZE = 1024
+
+# Serialized empty containers, used instead of encoding {} / [] every time
+_EMPTY_TUPLE: tuple = ()
+_EMPTY_PAIR: tuple = ((), ())
+_EMPTY_OBJ = "{}"
+_EMPTY_ARR = "[]"
+
+# Python types sqlite3 can bind as a column value
+_SQL_SCALARS = (str, int, float, bytes, type(None))
+
+_TRAIL_COLUMNS = (
+    "id, run_id, location, location_type, scent, strength, agent_id, "
+    "node_id, message, tags, created_at, expires_at"
+)
+
+# Static SQL statements. Keeping one string object per statement lets every
+# call hit the connection's prepared-statement cache.
+_SQL_INSERT_WORKFLOW = """
+    INSERT INTO workflows (name, description, nodes_json, config_json)
+    VALUES (?, ?, ?, ?)
+"""
+_SQL_INSERT_EDGE = """
+    INSERT INTO workflow_edges
+    (workflow_id, from_node, to_node, condition, priority)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_WORKFLOW = "SELECT * FROM workflows WHERE name = ?"
+_SQL_SELECT_EDGES = """
+    SELECT from_node, to_node, condition, priority
+    FROM workflow_edges WHERE workflow_id = ?
+    ORDER BY priority
+"""
+_SQL_LIST_WORKFLOWS = """
+    SELECT id, name, description, created_at
+    FROM workflows ORDER BY name
+"""
+_SQL_INSERT_RUN = """
+    INSERT INTO workflow_runs
+    (workflow_id, workflow_name, status, phase, input_json, started_at)
+    VALUES (?, ?, 'running', ?, ?, ?)
+"""
+_SQL_SELECT_RUN = "SELECT * FROM workflow_runs WHERE id = ?"
+_SQL_UPDATE_RUN_PHASE = "UPDATE workflow_runs SET phase = ? WHERE id = ?"
+_SQL_UPDATE_RUN_CONTEXT = "UPDATE workflow_runs SET context_json = ? WHERE id = ?"
+_SQL_INSERT_NODE_EXEC = """
+    INSERT INTO node_executions
+    (run_id, node_id, node_name, node_type, agent_id, prompt,
+     prompt_hash, status, started_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, 'running', ?)
+    RETURNING id
+"""
+_SQL_INC_TOTAL_NODES = "UPDATE workflow_runs SET total_nodes = total_nodes + 1 WHERE id = ?"
+_SQL_INC_COMPLETED_NODES = "UPDATE workflow_runs SET completed_nodes = completed_nodes + 1 WHERE id = ?"
+_SQL_INC_FAILED_NODES = "UPDATE workflow_runs SET failed_nodes = failed_nodes + 1 WHERE id = ?"
+_SQL_INSERT_FINISHED_NODE_EXEC = """
+    INSERT INTO node_executions
+    (run_id, node_id, node_name, node_type, prompt, prompt_hash, status,
+     result_text, result_json, findings_json, files_modified, duration_ms,
+     error_message, error_type, started_at, completed_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
+_SQL_ADD_NODE_COUNTS = """
+    UPDATE workflow_runs SET
+        total_nodes = total_nodes + ?,
+        completed_nodes = completed_nodes + ?,
+        failed_nodes = failed_nodes + ?
+    WHERE id = ?
+"""
+_SQL_SELECT_EXEC_RUN = "SELECT run_id, node_id FROM node_executions WHERE id = ?"
+_SQL_COMPLETE_NODE_EXEC = """
+    UPDATE node_executions SET
+        status = 'completed',
+        result_text = ?,
+        result_json = ?,
+        findings_json = ?,
+        files_modified = ?,
+        duration_ms = ?,
+        token_count = ?,
+        completed_at = ?
+    WHERE id = ?
+"""
+_SQL_FAIL_NODE_EXEC = """
+    UPDATE node_executions SET
+        status = 'failed',
+        error_message = ?,
+        error_type = ?,
+        duration_ms = ?,
+        completed_at = ?
+    WHERE id = ?
+"""
+_SQL_SELECT_NODE_EXECS = """
+    SELECT * FROM node_executions
+    WHERE run_id = ?
+    ORDER BY created_at
+"""
+_SQL_INSERT_TRAIL = """
+    INSERT INTO trails
+    (run_id, location, scent, strength, agent_id, node_id,
+     message, tags, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_DELETE_WEAK_TRAILS = """
+    DELETE FROM trails
+    WHERE strength < 0.01
+       OR ((expires_at > datetime('now') OR expires_at IS NULL)
+           AND strength * (1.0 - ?) < 0.01)
+"""
+_SQL_DECAY_TRAILS = """
+    UPDATE trails
+    SET strength = strength * (1.0 - ?)
+    WHERE expires_at > datetime('now') OR expires_at IS NULL
+"""
+_SQL_SELECT_HOTSPOTS = """
+    SELECT location, trail_count, max_strength, total_strength,
+           scents, agents, last_activity
+    FROM trail_hotspots
+    ORDER BY total_strength DESC
+    LIMIT ?
+"""
+_SQL_SELECT_RUN_HOTSPOTS = """
+    SELECT
+        location,
+        COUNT(*) as trail_count,
+        MAX(strength) as max_strength,
+        SUM(strength) as total_strength,
+        GROUP_CONCAT(DISTINCT scent) as scents,
+        GROUP_CONCAT(DISTINCT agent_id) as agents,
+        MAX(created_at) as last_activity
+    FROM trails
+    WHERE run_id = ?
+    GROUP BY location
+    ORDER BY total_strength DESC
+    LIMIT ?
+"""
+_SQL_INSERT_DECISION = """
+    INSERT INTO conductor_decisions
+    (run_id, decision_type, decision_data, reason)
+    VALUES (?, ?, ?, ?)
+"""
+_SQL_SELECT_DECISIONS = """
+    SELECT * FROM conductor_decisions
+    WHERE run_id = ?
+    ORDER BY created_at
+"""
 
 
 # Add parent utils to path for blackboard access
@@ -108,9 +317,9 @@ class RunStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Node:
-    """Workflow node definition."""
+    """Workflow node definition (immutable; shared across runs by the graph cache)."""
     id: str
     name: str
     node_type: NodeType
@@ -119,12 +328,12 @@ class Node:
 
     def __post_init__(self):
         if self.config is None:
-            self.config = {}
+            object.__setattr__(self, "config", {})
         if isinstance(self.node_type, str):
-            self.node_type = NodeType(self.node_type)
+            object.__setattr__(self, "node_type", NodeType(self.node_type))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Edge:
     """Workflow edge definition."""
     from_node: str
@@ -133,6 +342,26 @@ class Edge:
     priority: int = 100
 
 
+# Compact edge-index entry: (to_node, predicate, priority). The predicate
+# is the compiled edge condition, or None for unconditional edges.
+EdgeEntry = Tuple[str, Optional[Callable[[Dict], bool]], int]
+
+
+@dataclass
+class CompiledGraph:
+    """Workflow graph with node IDs interned to contiguous ints."""
+    nodes: List[Node]                  # index -> Node
+    index: Dict[str, int]              # node ID -> index
+    # index -> (unconditional successor indices,
+    #           ((successor index, predicate), ...) for conditional edges),
+    # each part sorted by edge priority; leaves share _EMPTY_PAIR
+    successors: List[Tuple[Tuple[int, ...], Tuple[Tuple[int, Callable[[Dict], bool]], ...]]]
+    initial: List[int]                 # indices reachable from __start__
+    # index -> incoming edges from nodes reachable from __start__, not
+    # counting back edges; a node waits until all of them have settled
+    in_degree: List[int]
+
+
 @dataclass
 class ExecutionRecord:
     """Record of a node execution for SQLite storage."""
@@ -158,6 +387,46 @@ class ExecutionRecord:
     error_type: str = None
 
 
+class _CallbackDispatcher:
+    """
+    Run a progress callback on a background thread, in posting order.
+
+    The queue is bounded, so a callback that falls behind eventually
+    blocks post() instead of growing memory without limit. The first
+    exception the callback raises is kept in error and stops later calls;
+    the owner re-raises it after close().
+    """
+
+    def __init__(self, callback: Callable, maxsize: int = _CALLBACK_QUEUE_SIZE):
+        self._callback = callback
+        self.error: Optional[BaseException] = None
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._drain, name="conductor-callbacks",
+                                        daemon=True)
+        self._thread.start()
+
+    def post(self, *args):
+        self._queue.put(args)
+
+    def _drain(self):
+        while True:
+            args = self._queue.get()
+            if args is None:
+                return
+            if self.error is not None:
+                continue
+            try:
+                self._callback(*args)
+            except Exception as e:
+                self.error = e
+                print(f"Warning: on_node_complete callback failed: {e}", file=sys.stderr)
+
+    def close(self):
+        """Deliver everything already posted, then stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+
 class Conductor:
     """
     Workflow orchestration engine.
@@ -166,13 +435,20 @@ class Conductor:
     all executions for historical queries.
     """
 
-    def __init__(self, base_path: Optional[str] = None, project_root: str = "."):
+    def __init__(self, base_path: Optional[str] = None, project_root: str = ".",
+                 max_parallel_nodes: int = _NODE_POOL_SIZE, readonly: bool = False,
+                 db_uri: Optional[str] = None):
         """
         Initialize the Conductor.
 
         Args:
             base_path: Path to emergent-learning directory (default: resolved via elf_paths)
             project_root: Project root for blackboard coordination (default: current dir)
+            max_parallel_nodes: Worker threads used to run sibling nodes in run_workflow
+            readonly: Skip blackboard and schema setup and reject writes (see open_readonly)
+            db_uri: SQLite URI to open instead of base_path's memory/index.db, e.g.
+                a shared-cache in-memory database ("file:name?mode=memory&cache=shared")
+                kept alive by the caller; used by the tests
         """
         if base_path is None:
             self.base_path = get_base_path(Path(project_root))
@@ -180,11 +456,13 @@ class Conductor:
             self.base_path = Path(base_path)
 
         self.db_path = self.base_path / "memory" / "index.db"
+        self.db_uri = db_uri
         self.project_root = Path(project_root).resolve()
+        self.readonly = readonly
 
         # Initialize blackboard if available
         self.blackboard = None
-        if Blackboard is not None:
+        if Blackboard is not None and not readonly:
             try:
                 self.blackboard = Blackboard(str(self.project_root))
             except Exception as e:
@@ -193,6 +471,42 @@ class Conductor:
         # Node execution callbacks (for external integration)
         self._node_executor: Optional[Callable] = None
 
+        # One serialized writer plus a pool of read-only connections, so
+        # reads never queue behind writes (WAL mode)
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.RLock()
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=_READER_POOL_SIZE)
+
+        # Worker pool for sibling nodes, created on first parallel frontier
+        self._max_parallel_nodes = max(1, max_parallel_nodes)
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        # workflow id -> compiled graph, shared by every run of that workflow
+        self._graph_cache: Dict[int, CompiledGraph] = {}
+
+        # LRU of loaded workflow definitions by name, kept with their raw
+        # nodes/config JSON, plus a short-lived (loaded_at, rows) snapshot
+        # of list_workflows()
+        self._workflow_cache: "OrderedDict[str, Tuple[Dict, str, str]]" = OrderedDict()
+        self._workflow_list_cache: Optional[Tuple[float, List[Dict]]] = None
+
+        # Finished executions from run_workflow awaiting one batched write
+        self._exec_buffer: List[tuple] = []
+        self._exec_buffer_lock = threading.Lock()
+
+        if not readonly:
+            self._ensure_schema()
+
+    @classmethod
+    def open_readonly(cls, base_path: Optional[str] = None, project_root: str = ".") -> "Conductor":
+        """
+        Open a Conductor for queries only.
+
+        Skips blackboard and schema setup; every read goes through the
+        read-only connection pool and any write raises sqlite3.OperationalError.
+        """
+        return cls(base_path, project_root, readonly=True)
+
     def set_node_executor(self, executor: Callable[[Node, Dict], Tuple[str, Dict]]) -> None:
         """
         Set the callback function for executing nodes.
@@ -203,21 +517,112 @@ class Conductor:
         """
         self._node_executor = executor
 
-    @contextmanager
-    def _get_connection(self):
-        """Get a database connection with proper settings."""
-        conn = sqlite3.connect(str(self.db_path), timeout=10.0)
+    def _open_writer(self) -> sqlite3.Connection:
+        """Open the dedicated writer connection."""
+        if self.db_uri is not None:
+            conn = sqlite3.connect(self.db_uri, uri=True, timeout=10.0, cached_statements=256,
+                                   isolation_level=None, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(str(self.db_path), timeout=10.0, cached_statements=256,
+                                   isolation_level=None, check_same_thread=False)
         conn.execute("PRAGMA busy_timeout=10000")
         conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection for the reader pool."""
+        if self.db_uri is not None:
+            # mode=ro cannot be combined with an in-memory URI; query_only
+            # rejects writes on this connection instead
+            conn = sqlite3.connect(self.db_uri, uri=True, timeout=10.0, cached_statements=256,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA query_only=ON")
+        else:
+            conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True,
+                                   timeout=10.0, cached_statements=256,
+                                   isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA busy_timeout=10000")
         conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _write_conn(self):
+        """
+        Run a write transaction on the shared writer connection.
+
+        Writers are serialized by a lock; the transaction is committed on
+        success and rolled back on error.
+        """
+        if self.readonly:
+            raise sqlite3.OperationalError("attempt to write a readonly database")
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._open_writer()
+            conn = self._writer
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    @contextmanager
+    def _read_conn(self):
+        """Borrow a read-only connection from the pool."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
         try:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
         finally:
-            conn.close()
+            try:
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def close(self):
+        """Shut down the node pool, flush buffered executions and close all connections."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._flush_executions()
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _ensure_schema(self):
+        """
+        Upgrade the database to schema.sql once (see migrations.py).
+
+        Up-to-date databases, and ones without conductor tables, cost one
+        read on a pooled reader and never take the write lock.
+        """
+        if self.db_uri is None and not self.db_path.exists():
+            return
+        try:
+            with self._read_conn() as conn:
+                if not needs_migration(conn):
+                    return
+            with self._write_conn() as conn:
+                migrate(conn)
+        except sqlite3.Error as e:
+            print(f"Warning: Could not prepare conductor schema: {e}", file=sys.stderr)
 
     # =========================================================================
     # Workflow Management
@@ -239,69 +644,120 @@ class Conductor:
         Returns:
             Workflow ID
         """
-        nodes = nodes or []
         edges = edges or []
-        config = config or {}
+        nodes_json = json_dumps(nodes) if nodes else _EMPTY_ARR
+        config_json = json_dumps(config) if config else _EMPTY_OBJ
 
-        with self._get_connection() as conn:
+        with self._write_conn() as conn:
             cursor = conn.cursor()
 
             # Insert workflow
-            cursor.execute("""
-                INSERT INTO workflows (name, description, nodes_json, config_json)
-                VALUES (?, ?, ?, ?)
-            """, (name, description, json.dumps(nodes), json.dumps(config)))
+            cursor.execute(_SQL_INSERT_WORKFLOW, (name, description, nodes_json, config_json))
             workflow_id = cursor.lastrowid
+            self._graph_cache.pop(workflow_id, None)
+            self.invalidate_workflow(name)
 
             # Insert edges
-            for edge in edges:
-                cursor.execute("""
-                    INSERT INTO workflow_edges
-                    (workflow_id, from_node, to_node, condition, priority)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    workflow_id,
-                    edge.get("from_node", "__start__"),
-                    edge.get("to_node", "__end__"),
-                    edge.get("condition", ""),
-                    edge.get("priority", 100)
-                ))
+            if edges:
+                cursor.executemany(_SQL_INSERT_EDGE, [
+                    (workflow_id,
+                     edge.get("from_node", "__start__"),
+                     edge.get("to_node", "__end__"),
+                     edge.get("condition", ""),
+                     edge.get("priority", 100))
+                    for edge in edges
+                ])
 
             return workflow_id
 
     def get_workflow(self, name: str) -> Optional[Dict]:
         """Get a workflow by name."""
-        with self._get_connection() as conn:
+        entry = self._cached_workflow(name)
+        if entry is None:
+            return None
+        # A private copy for the caller: nodes and config are decoded again
+        # from the cached JSON, which is cheaper than a deep copy
+        cached, nodes_json, config_json = entry
+        workflow = dict(cached)
+        workflow["nodes"] = json_loads(nodes_json)
+        workflow["config"] = json_loads(config_json)
+        workflow["edges"] = [dict(edge) for edge in cached["edges"]]
+        return workflow
+
+    def _load_workflow(self, name: str) -> Optional[Dict]:
+        """
+        Return the cached definition of a workflow, loading it on a miss.
+
+        The returned dict is shared with the cache and must not be mutated;
+        get_workflow() hands callers a private copy.
+        """
+        entry = self._cached_workflow(name)
+        return entry[0] if entry else None
+
+    def _cached_workflow(self, name: str) -> Optional[Tuple[Dict, str, str]]:
+        """
+        Return (definition, nodes_json, config_json) for a workflow from the
+        cache, loading it on a miss. Misses are not cached, so workflows
+        created by another process are picked up.
+        """
+        entry = self._workflow_cache.get(name)
+        if entry is not None:
+            try:
+                self._workflow_cache.move_to_end(name)
+            except KeyError:
+                pass  # Invalidated concurrently; the copy we hold is still whole
+            return entry
+
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM workflows WHERE name = ?
-            """, (name,))
+            cursor.execute(_SQL_SELECT_WORKFLOW, (name,))
             row = cursor.fetchone()
-            if row:
-                workflow = dict(row)
-                workflow["nodes"] = json.loads(workflow.pop("nodes_json", "[]"))
-                workflow["config"] = json.loads(workflow.pop("config_json", "{}"))
-
-                # Get edges
-                cursor.execute("""
-                    SELECT from_node, to_node, condition, priority
-                    FROM workflow_edges WHERE workflow_id = ?
-                    ORDER BY priority
-                """, (workflow["id"],))
-                workflow["edges"] = [dict(r) for r in cursor.fetchall()]
-
-                return workflow
-            return None
+            if not row:
+                return None
+            workflow = dict(row)
+            nodes_json = workflow.pop("nodes_json", "[]")
+            config_json = workflow.pop("config_json", "{}")
+            workflow["nodes"] = json_loads(nodes_json)
+            workflow["config"] = json_loads(config_json)
+
+            # Get edges
+            cursor.execute(_SQL_SELECT_EDGES, (workflow["id"],))
+            workflow["edges"] = [dict(r) for r in cursor.fetchall()]
+
+        entry = (workflow, nodes_json, config_json)
+        self._workflow_cache[name] = entry
+        while len(self._workflow_cache) > _WORKFLOW_CACHE_SIZE:
+            try:
+                self._workflow_cache.popitem(last=False)
+            except KeyError:
+                break
+        return entry
+
+    def invalidate_workflow(self, name: Optional[str] = None):
+        """
+        Drop cached workflow definitions.
+
+        Call this after changing a workflow outside create_workflow() (e.g.
+        from another process). With no name, the whole cache is cleared.
+        """
+        if name is None:
+            self._workflow_cache.clear()
+        else:
+            self._workflow_cache.pop(name, None)
+        self._workflow_list_cache = None
 
     def list_workflows(self) -> List[Dict]:
         """List all workflow definitions."""
-        with self._get_connection() as conn:
+        cached = self._workflow_list_cache
+        if cached is not None and time.monotonic() - cached[0] < _WORKFLOW_LIST_TTL:
+            return [dict(w) for w in cached[1]]
+
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, name, description, created_at
-                FROM workflows ORDER BY name
-            """)
-            return [dict(row) for row in cursor.fetchall()]
+            cursor.execute(_SQL_LIST_WORKFLOWS)
+            workflows = [dict(row) for row in cursor.fetchall()]
+        self._workflow_list_cache = (time.monotonic(), workflows)
+        return [dict(w) for w in workflows]
 
     # =========================================================================
     # Run Management
@@ -321,20 +777,16 @@ class Conductor:
         Returns:
             Run ID
         """
-        input_data = input_data or {}
+        input_json = json_dumps(input_data) if input_data else _EMPTY_OBJ
 
-        with self._get_connection() as conn:
+        with self._write_conn() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("""
-                INSERT INTO workflow_runs
-                (workflow_id, workflow_name, status, phase, input_json, started_at)
-                VALUES (?, ?, 'running', ?, ?, ?)
-            """, (
+            cursor.execute(_SQL_INSERT_RUN, (
                 workflow_id,
                 workflow_name,
                 phase,
-                json.dumps(input_data),
+                input_json,
                 datetime.now().isoformat()
             ))
 
@@ -350,15 +802,15 @@ class Conductor:
 
     def get_run(self, run_id: int) -> Optional[Dict]:
         """Get a workflow run by ID."""
-        with self._get_connection() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM workflow_runs WHERE id = ?", (run_id,))
+            cursor.execute(_SQL_SELECT_RUN, (run_id,))
             row = cursor.fetchone()
             if row:
                 run = dict(row)
-                run["input"] = json.loads(run.pop("input_json", "{}"))
-                run["output"] = json.loads(run.pop("output_json", "{}"))
-                run["context"] = json.loads(run.pop("context_json", "{}"))
+                run["input"] = json_loads(run.pop("input_json", "{}"))
+                run["output"] = json_loads(run.pop("output_json", "{}"))
+                run["context"] = json_loads(run.pop("context_json", "{}"))
                 return run
             return None
 
@@ -369,7 +821,7 @@ class Conductor:
         if hasattr(status, 'value'):
             status = status.value
 
-        with self._get_connection() as conn:
+        with self._write_conn() as conn:
             cursor = conn.cursor()
 
             updates = ["status = ?"]
@@ -385,7 +837,7 @@ class Conductor:
 
             if output:
                 updates.append("output_json = ?")
-                params.append(json.dumps(output))
+                params.append(json_dumps(output))
 
             params.append(run_id)
             cursor.execute(f"""
@@ -394,11 +846,9 @@ class Conductor:
 
     def update_run_phase(self, run_id: int, phase: str):
         """Update the current phase of a workflow run."""
-        with self._get_connection() as conn:
+        with self._write_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE workflow_runs SET phase = ? WHERE id = ?
-            """, (phase, run_id))
+            cursor.execute(_SQL_UPDATE_RUN_PHASE, (phase, run_id))
 
             self._log_decision(cursor, run_id, "phase_change", {
                 "new_phase": phase
@@ -406,11 +856,9 @@ class Conductor:
 
     def update_run_context(self, run_id: int, context: Dict):
         """Update the shared context of a workflow run."""
-        with self._get_connection() as conn:
+        with self._write_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE workflow_runs SET context_json = ? WHERE id = ?
-            """, (json.dumps(context), run_id))
+            cursor.execute(_SQL_UPDATE_RUN_CONTEXT, (json_dumps(context), run_id))
 
     # =========================================================================
     # Node Execution
@@ -423,16 +871,11 @@ class Conductor:
 
         Returns the execution record ID.
         """
-        prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+        prompt_hash = _prompt_hash(prompt)
 
-        with self._get_connection() as conn:
+        with self._write_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO node_executions
-                (run_id, node_id, node_name, node_type, agent_id, prompt,
-                 prompt_hash, status, started_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, 'running', ?)
-            """, (
+            cursor.execute(_SQL_INSERT_NODE_EXEC, (
                 run_id,
                 node.id,
                 node.name,
@@ -442,13 +885,10 @@ class Conductor:
                 prompt_hash,
                 datetime.now().isoformat()
             ))
-
-            exec_id = cursor.lastrowid
+            exec_id = cursor.fetchone()[0]
 
             # Update run node count
-            cursor.execute("""
-                UPDATE workflow_runs SET total_nodes = total_nodes + 1 WHERE id = ?
-            """, (run_id,))
+            cursor.execute(_SQL_INC_TOTAL_NODES, (run_id,))
 
             self._log_decision(cursor, run_id, "fire_node", {
                 "node_id": node.id,
@@ -464,36 +904,25 @@ class Conductor:
                                files_modified: List[str] = None, duration_ms: int = None,
                                token_count: int = None):
         """Record successful completion of a node execution."""
-        result_dict = result_dict or {}
-        findings = findings or []
-        files_modified = files_modified or []
+        result_json = json_dumps(result_dict) if result_dict else _EMPTY_OBJ
+        findings_json = json_dumps(findings) if findings else _EMPTY_ARR
+        files_json = json_dumps(files_modified) if files_modified else _EMPTY_ARR
 
-        with self._get_connection() as conn:
+        with self._write_conn() as conn:
             cursor = conn.cursor()
 
             # Get run_id for updating counts
-            cursor.execute("SELECT run_id FROM node_executions WHERE id = ?", (exec_id,))
+            cursor.execute(_SQL_SELECT_EXEC_RUN, (exec_id,))
             row = cursor.fetchone()
             if not row:
                 return
             run_id = row["run_id"]
 
-            cursor.execute("""
-                UPDATE node_executions SET
-                    status = 'completed',
-                    result_text = ?,
-                    result_json = ?,
-                    findings_json = ?,
-                    files_modified = ?,
-                    duration_ms = ?,
-                    token_count = ?,
-                    completed_at = ?
-                WHERE id = ?
-            """, (
+            cursor.execute(_SQL_COMPLETE_NODE_EXEC, (
                 result_text,
-                json.dumps(result_dict),
-                json.dumps(findings),
-                json.dumps(files_modified),
+                result_json,
+                findings_json,
+                files_json,
                 duration_ms,
                 token_count,
                 datetime.now().isoformat(),
@@ -501,33 +930,23 @@ class Conductor:
             ))
 
             # Update run completed count
-            cursor.execute("""
-                UPDATE workflow_runs SET completed_nodes = completed_nodes + 1 WHERE id = ?
-            """, (run_id,))
+            cursor.execute(_SQL_INC_COMPLETED_NODES, (run_id,))
 
     def record_node_failure(self, exec_id: int, error_message: str,
                             error_type: str = "error", duration_ms: int = None):
         """Record failure of a node execution."""
-        with self._get_connection() as conn:
+        with self._write_conn() as conn:
             cursor = conn.cursor()
 
             # Get run_id for updating counts
-            cursor.execute("SELECT run_id, node_id FROM node_executions WHERE id = ?", (exec_id,))
+            cursor.execute(_SQL_SELECT_EXEC_RUN, (exec_id,))
             row = cursor.fetchone()
             if not row:
                 return
             run_id = row["run_id"]
             node_id = row["node_id"]
 
-            cursor.execute("""
-                UPDATE node_executions SET
-                    status = 'failed',
-                    error_message = ?,
-                    error_type = ?,
-                    duration_ms = ?,
-                    completed_at = ?
-                WHERE id = ?
-            """, (
+            cursor.execute(_SQL_FAIL_NODE_EXEC, (
                 error_message,
                 error_type,
                 duration_ms,
@@ -536,9 +955,7 @@ class Conductor:
             ))
 
             # Update run failed count
-            cursor.execute("""
-                UPDATE workflow_runs SET failed_nodes = failed_nodes + 1 WHERE id = ?
-            """, (run_id,))
+            cursor.execute(_SQL_INC_FAILED_NODES, (run_id,))
 
             self._log_decision(cursor, run_id, "node_failed", {
                 "node_id": node_id,
@@ -549,20 +966,18 @@ class Conductor:
 
     def get_node_executions(self, run_id: int) -> List[Dict]:
         """Get all node executions for a run."""
-        with self._get_connection() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM node_executions
-                WHERE run_id = ?
-                ORDER BY created_at
-            """, (run_id,))
+            cursor.execute(_SQL_SELECT_NODE_EXECS, (run_id,))
             results = []
+            append, loads, to_dict = results.append, json_loads, dict
             for row in cursor.fetchall():
-                record = dict(row)
-                record["result"] = json.loads(record.pop("result_json", "{}"))
-                record["findings"] = json.loads(record.pop("findings_json", "[]"))
-                record["files_modified"] = json.loads(record.pop("files_modified", "[]"))
-                results.append(record)
+                record = to_dict(row)
+                pop = record.pop
+                record["result"] = loads(pop("result_json", "{}"))
+                record["findings"] = loads(pop("findings_json", "[]"))
+                record["files_modified"] = loads(pop("files_modified", "[]"))
+                append(record)
             return results
 
     # =========================================================================
@@ -590,21 +1005,17 @@ class Conductor:
         expires_at = (datetime.now() + timedelta(hours=ttl_hours)).isoformat()
         tags_str = ",".join(tags) if tags else ""
 
-        with self._get_connection() as conn:
+        with self._write_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO trails
-                (run_id, location, scent, strength, agent_id, node_id,
-                 message, tags, expires_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(_SQL_INSERT_TRAIL, (
                 run_id, location, scent, strength, agent_id, node_id,
                 message, tags_str, expires_at
             ))
 
     def get_trails(self, location: str = None, scent: str = None,
                    min_strength: float = 0.0, run_id: int = None,
-                   include_expired: bool = False) -> List[Dict]:
+                   include_expired: bool = False,
+                   exact_location: bool = False) -> List[Dict]:
         """
         Get pheromone trails matching criteria.
 
@@ -614,8 +1025,9 @@ class Conductor:
             min_strength: Minimum trail strength
             run_id: Filter by workflow run
             include_expired: Include expired trails
+            exact_location: Match location exactly (uses idx_trails_location)
         """
-        with self._get_connection() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
 
             conditions = ["strength >= ?"]
@@ -624,7 +1036,10 @@ class Conductor:
             if not include_expired:
                 conditions.append("(expires_at IS NULL OR expires_at > datetime('now'))")
 
-            if location:
+            if location and exact_location:
+                conditions.append("location = ?")
+                params.append(location)
+            elif location:
                 conditions.append("location LIKE ?")
                 params.append(f"%{location}%")
 
@@ -637,7 +1052,7 @@ class Conductor:
                 params.append(run_id)
 
             query = f"""
-                SELECT * FROM trails
+                SELECT {_TRAIL_COLUMNS} FROM trails
                 WHERE {' AND '.join(conditions)}
                 ORDER BY strength DESC, created_at DESC
                 LIMIT 100
@@ -649,50 +1064,47 @@ class Conductor:
         """
         Get locations with the most trail activity.
 
-        Returns aggregated trail data grouped by location.
+        Returns aggregated trail data grouped by location. Without a run
+        filter this reads the trail_hotspots summary kept up to date by the
+        trails triggers; per-run lookups aggregate that run's trails
+        in one GROUP BY that walks idx_trails_run_loc in location order.
         """
-        with self._get_connection() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
 
-            run_filter = "WHERE run_id = ?" if run_id else ""
-            params = [run_id] if run_id else []
+            if not run_id:
+                cursor.execute(_SQL_SELECT_HOTSPOTS, (limit,))
+                return [dict(row) for row in cursor.fetchall()]
 
-            cursor.execute(f"""
-                SELECT
-                    location,
-                    COUNT(*) as trail_count,
-                    MAX(strength) as max_strength,
-                    SUM(strength) as total_strength,
-                    GROUP_CONCAT(DISTINCT scent) as scents,
-                    GROUP_CONCAT(DISTINCT agent_id) as agents,
-                    MAX(created_at) as last_activity
-                FROM trails
-                {run_filter}
-                GROUP BY location
-                ORDER BY total_strength DESC
-                LIMIT ?
-            """, params + [limit])
+            cursor.execute(_SQL_SELECT_RUN_HOTSPOTS, (run_id, limit))
 
             return [dict(row) for row in cursor.fetchall()]
 
+    def refresh_hot_spots(self):
+        """
+        Rebuild the trail_hotspots summary from the trails table.
+
+        Triggers keep the summary in step with every insert, update and
+        delete, so this is only a repair tool, e.g. after the triggers were
+        dropped or trails were restored from a backup.
+        """
+        with self._write_conn() as conn:
+            conn.execute(_SQL_CLEAR_HOTSPOTS)
+            conn.execute(_SQL_REBUILD_HOTSPOTS)
+
     def decay_trails(self, decay_rate: float = 0.1):
         """
         Decay all trail strengths by a percentage.
 
         This simulates pheromone evaporation over time.
         """
-        with self._get_connection() as conn:
+        with self._write_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE trails
-                SET strength = strength * (1.0 - ?)
-                WHERE expires_at > datetime('now') OR expires_at IS NULL
-            """, (decay_rate,))
 
-            # Remove very weak trails
-            cursor.execute("""
-                DELETE FROM trails WHERE strength < 0.01
-            """)
+            # Remove trails that are already weak or would be after decay,
+            # so the UPDATE below only rewrites survivors
+            cursor.execute(_SQL_DELETE_WEAK_TRAILS, (decay_rate,))
+            cursor.execute(_SQL_DECAY_TRAILS, (decay_rate,))
 
     # =========================================================================
     # Blackboard Bridge
@@ -707,20 +1119,24 @@ class Conductor:
         if self.blackboard is None:
             return
 
+        add_finding = self.blackboard.add_finding
         executions = self.get_node_executions(run_id)
         for exec_record in executions:
             if exec_record["status"] != "completed":
                 continue
 
+            agent_id = exec_record.get("agent_id", "conductor")
+            files = exec_record.get("files_modified", [])
             for finding in exec_record.get("findings", []):
+                get = finding.get
                 try:
-                    self.blackboard.add_finding(
-                        agent_id=exec_record.get("agent_id", "conductor"),
-                        finding_type=finding.get("type", "note"),
-                        content=finding.get("content", ""),
-                        files=exec_record.get("files_modified", []),
-                        importance=finding.get("importance", "normal"),
-                        tags=finding.get("tags", [])
+                    add_finding(
+                        agent_id=agent_id,
+                        finding_type=get("type", "note"),
+                        content=get("content", ""),
+                        files=files,
+                        importance=get("importance", "normal"),
+                        tags=get("tags", [])
                     )
                 except Exception as e:
                     print(f"Warning: Failed to sync finding to blackboard: {e}",
@@ -755,43 +1171,42 @@ class Conductor:
     def _log_decision(self, cursor, run_id: int, decision_type: str,
                       data: Dict, reason: str):
         """Log a conductor decision."""
-        cursor.execute("""
-            INSERT INTO conductor_decisions
-            (run_id, decision_type, decision_data, reason)
-            VALUES (?, ?, ?, ?)
-        """, (run_id, decision_type, json.dumps(data), reason))
+        cursor.execute(_SQL_INSERT_DECISION, (run_id, decision_type, json_dumps(data), reason))
 
     def get_decisions(self, run_id: int) -> List[Dict]:
         """Get all decisions for a workflow run."""
-        with self._get_connection() as conn:
+        with self._read_conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM conductor_decisions
-                WHERE run_id = ?
-                ORDER BY created_at
-            """, (run_id,))
+            cursor.execute(_SQL_SELECT_DECISIONS, (run_id,))
             results = []
+            append, loads, to_dict = results.append, json_loads, dict
             for row in cursor.fetchall():
-                record = dict(row)
-                record["data"] = json.loads(record.pop("decision_data", "{}"))
-                results.append(record)
+                record = to_dict(row)
+                record["data"] = loads(record.pop("decision_data", "{}"))
+                append(record)
             return results
 
     # =========================================================================
     # Workflow Execution
     # =========================================================================
 
-    def execute_node(self, run_id: int, node: Node, context: Dict) -> Tuple[bool, Dict]:
+    def execute_node(self, run_id: int, node: Node, context: Dict,
+                     buffered: bool = False) -> Tuple[bool, Dict]:
         """
         Execute a single node.
 
+        With buffered=True the execution is recorded once it has finished,
+        through the batch written by _flush_executions(), instead of a
+        start and a completion write per node.
+
         Returns (success, result_dict)
         """
         # Prepare prompt from template
         prompt = node.prompt_template.format(**context) if context else node.prompt_template
 
         # Record start
-        exec_id = self.record_node_start(run_id, node, prompt)
+        exec_id = None if buffered else self.record_node_start(run_id, node, prompt)
+        started_at = datetime.now().isoformat()
         start_time = time.time()
 
         try:
@@ -805,23 +1220,166 @@ class Conductor:
 
             duration_ms = int((time.time() - start_time) * 1000)
 
-            self.record_node_completion(
-                exec_id,
-                result_text=result_text,
-                result_dict=result_dict,
-                findings=result_dict.get("findings", []),
-                files_modified=result_dict.get("files_modified", []),
-                duration_ms=duration_ms
-            )
+            if buffered:
+                # Validate and serialize here, so a bad result is recorded as
+                # this node's failure instead of breaking the batched flush
+                if not isinstance(result_dict, dict):
+                    raise TypeError(
+                        f"node executor returned {type(result_dict).__name__}, expected dict")
+                if not isinstance(result_text, _SQL_SCALARS):
+                    raise TypeError(
+                        f"node executor returned {type(result_text).__name__} result text")
+                findings = result_dict.get("findings")
+                files = result_dict.get("files_modified")
+                record = (run_id, node, prompt, started_at, True, result_text,
+                          json_dumps(result_dict) if result_dict else _EMPTY_OBJ,
+                          json_dumps(findings) if findings else _EMPTY_ARR,
+                          json_dumps(files) if files else _EMPTY_ARR,
+                          duration_ms)
+                outcome = (True, result_dict)
+            else:
+                self.record_node_completion(
+                    exec_id,
+                    result_text=result_text,
+                    result_dict=result_dict,
+                    findings=result_dict.get("findings", []),
+                    files_modified=result_dict.get("files_modified", []),
+                    duration_ms=duration_ms
+                )
 
-            return True, result_dict
+                return True, result_dict
 
         except Exception as e:
             duration_ms = int((time.time() - start_time) * 1000)
-            self.record_node_failure(exec_id, str(e), "exception", duration_ms)
-            return False, {"error": str(e)}
+            if not buffered:
+                self.record_node_failure(exec_id, str(e), "exception", duration_ms)
+                return False, {"error": str(e)}
+            record = (run_id, node, prompt, started_at, False,
+                      str(e), None, None, None, duration_ms)
+            outcome = (False, {"error": str(e)})
+
+        # Outside the try: a failed flush must not be recorded as this
+        # node's failure on top of its buffered result
+        self._buffer_execution(record)
+        return outcome
+
+    def _buffer_execution(self, record: tuple):
+        """Queue a finished execution, flushing once the buffer is full."""
+        with self._exec_buffer_lock:
+            self._exec_buffer.append(record)
+            full = len(self._exec_buffer) >= _EXEC_FLUSH_EVERY
+        if full:
+            self._flush_executions()
+
+    def _flush_executions(self):
+        """
+        Write all buffered executions in a single transaction.
+
+        Inserts each finished node_executions row, the matching fire_node /
+        node_failed decisions and the per-run node counters. If the write
+        fails the batch is put back at the front of the buffer, so a later
+        flush (or close()) can retry it, and the error is re-raised.
+        """
+        with self._exec_buffer_lock:
+            batch, self._exec_buffer = self._exec_buffer, []
+        if not batch:
+            return
 
-    def _build_edge_index(self, edges: List[Dict]) -> Dict[str, List[Edge]]:
+        try:
+            self._write_executions(batch)
+        except Exception:
+            with self._exec_buffer_lock:
+                self._exec_buffer[:0] = batch
+            raise
+
+    def _write_executions(self, batch: List[tuple]):
+        """Write one batch of buffered executions in a single transaction."""
+        completed_at = datetime.now().isoformat()
+        counts = defaultdict(lambda: [0, 0, 0])  # run_id -> [total, completed, failed]
+        decisions = []
+
+        with self._write_conn() as conn:
+            cursor = conn.cursor()
+            for (run_id, node, prompt, started_at, success, text,
+                 result_json, findings_json, files_json, duration_ms) in batch:
+                node_type = node.node_type.value
+                if success:
+                    row = (run_id, node.id, node.name, node_type, prompt, _prompt_hash(prompt),
+                           "completed", text, result_json, findings_json, files_json,
+                           duration_ms, None, None, started_at, completed_at)
+                else:
+                    row = (run_id, node.id, node.name, node_type, prompt, _prompt_hash(prompt),
+                           "failed", None, _EMPTY_OBJ, _EMPTY_ARR, _EMPTY_ARR,
+                           duration_ms, text, "exception", started_at, completed_at)
+                cursor.execute(_SQL_INSERT_FINISHED_NODE_EXEC, row)
+                exec_id = cursor.fetchone()[0]
+
+                run_counts = counts[run_id]
+                run_counts[0] += 1
+                run_counts[1 if success else 2] += 1
+
+                decisions.append((run_id, "fire_node", json_dumps({
+                    "node_id": node.id,
+                    "node_name": node.name,
+                    "node_type": node_type,
+                    "execution_id": exec_id
+                }), f"Started node: {node.name}"))
+                if not success:
+                    decisions.append((run_id, "node_failed", json_dumps({
+                        "node_id": node.id,
+                        "execution_id": exec_id,
+                        "error_type": "exception",
+                        "error_message": text[:200]
+                    }), f"Node failed: {text[:100]}"))
+
+            cursor.executemany(_SQL_INSERT_DECISION, decisions)
+            cursor.executemany(_SQL_ADD_NODE_COUNTS, [
+                (total, completed, failed, run_id)
+                for run_id, (total, completed, failed) in counts.items()
+            ])
+
+    @staticmethod
+    def _merge_parallel_results(results: List[Tuple[bool, Dict]]) -> Tuple[bool, Dict]:
+        """Fold per-node results into one (all_succeeded, merged_result) pair."""
+        merged = {}
+        for success, result in results:
+            if success and isinstance(result, dict):
+                merged.update(result)
+        return all(success for success, _ in results), merged
+
+    def execute_parallel_node(self, run_id: int, nodes: List[Node], context: Dict,
+                              max_workers: int = None) -> Tuple[bool, Dict]:
+        """
+        Execute several independent nodes concurrently on a thread pool.
+
+        Each node gets its own copy of the context. Results from successful
+        nodes are merged in the order the nodes were given, so the outcome
+        does not depend on completion order.
+
+        Returns (all_succeeded, merged_result_dict)
+        """
+        if not nodes:
+            return True, {}
+        with ThreadPoolExecutor(max_workers=max_workers or len(nodes)) as pool:
+            futures = [pool.submit(self.execute_node, run_id, node, dict(context))
+                       for node in nodes]
+            results = [future.result() for future in futures]
+        return self._merge_parallel_results(results)
+
+    async def execute_parallel_node_async(self, run_id: int, nodes: List[Node],
+                                          context: Dict) -> Tuple[bool, Dict]:
+        """
+        Async variant of execute_parallel_node for callers on an event loop.
+
+        Node executors are blocking, so each one runs via asyncio.to_thread.
+        """
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self.execute_node, run_id, node, dict(context))
+            for node in nodes
+        ))
+        return self._merge_parallel_results(list(results))
+
+    def _build_edge_index(self, edges: List[Dict]) -> Dict[str, Tuple[EdgeEntry, ...]]:
         """
         Build node_id -> outgoing edges index.
 
@@ -829,15 +1387,20 @@ class Conductor:
             edges: List of edge dictionaries from workflow
 
         Returns:
-            Dictionary mapping node IDs to lists of outgoing edges
+            Dictionary mapping node IDs to a tuple of (to_node, predicate,
+            priority) entries, sorted by priority
         """
-        edges_from = {}
+        edges_from = defaultdict(list)
         for e in edges:
-            edge = Edge(**e)
-            edges_from.setdefault(edge.from_node, []).append(edge)
-        return edges_from
+            condition = e.get("condition")
+            edges_from[e["from_node"]].append(
+                (e["to_node"], compile_condition(condition) if condition else None,
+                 e.get("priority", 100))
+            )
+        return {node_id: tuple(sorted(outgoing, key=itemgetter(2)))
+                for node_id, outgoing in edges_from.items()}
 
-    def _get_initial_nodes(self, edges_from: Dict[str, List[Edge]]) -> List[str]:
+    def _get_initial_nodes(self, edges_from: Dict[str, Tuple[EdgeEntry, ...]]) -> List[str]:
         """
         Get starting nodes from __start__.
 
@@ -847,105 +1410,273 @@ class Conductor:
         Returns:
             List of node IDs to start execution from
         """
-        return [e.to_node for e in edges_from.get("__start__", [])]
+        return [to_node for to_node, _, _ in edges_from.get("__start__", _EMPTY_TUPLE)]
 
-    def _evaluate_edge_condition(self, edge: Edge, context: Dict) -> bool:
+    def _get_graph(self, workflow: Dict) -> CompiledGraph:
+        """
+        Return the compiled graph for a workflow, building it on first use.
+
+        Workflow definitions are never edited in place, so the Node objects
+        and edge index are shared by every run of the same workflow id.
+        Edges to __end__ or to unknown nodes are dropped since they never
+        lead to a runnable node.
+        """
+        graph = self._graph_cache.get(workflow["id"])
+        if graph is None:
+            nodes = [Node(**n) for n in workflow["nodes"]]
+            index = {node.id: i for i, node in enumerate(nodes)}
+            index.pop("__end__", None)
+            edges_from = self._build_edge_index(workflow["edges"])
+            successors = [self._partition_edges(edges_from.get(node.id, _EMPTY_TUPLE), index)
+                          for node in nodes]
+            initial = list(dict.fromkeys(
+                index[n] for n in self._get_initial_nodes(edges_from) if n in index))
+            graph = CompiledGraph(
+                nodes=nodes,
+                index=index,
+                successors=successors,
+                initial=initial,
+                in_degree=self._count_in_edges(successors, initial),
+            )
+            self._graph_cache[workflow["id"]] = graph
+        return graph
+
+    @staticmethod
+    def _partition_edges(outgoing: Tuple[EdgeEntry, ...], index: Dict[str, int]) -> tuple:
+        """Split a node's edges into unconditional indices and (index, predicate) pairs."""
+        unconditional = tuple(index[to_node] for to_node, predicate, _ in outgoing
+                              if predicate is None and to_node in index)
+        conditional = tuple((index[to_node], predicate) for to_node, predicate, _ in outgoing
+                            if predicate is not None and to_node in index)
+        return (unconditional, conditional) if unconditional or conditional else _EMPTY_PAIR
+
+    @staticmethod
+    def _edge_targets(successors: tuple) -> Iterator[int]:
+        """Target indices of a node's edges, conditional or not, one per edge."""
+        unconditional, conditional = successors
+        return chain(unconditional, map(itemgetter(0), conditional))
+
+    @classmethod
+    def _count_in_edges(cls, successors: List[tuple], initial: List[int]) -> List[int]:
+        """
+        Count each node's incoming edges from nodes reachable from __start__.
+
+        Back edges, which point at a node still on the depth-first path, are
+        left out: a node runs at most once per run, so it can never wait on
+        a cycle through itself.
+        """
+        in_degree = [0] * len(successors)
+        state = bytearray(len(successors))  # 0 unseen, 1 on the path, 2 done
+        for root in initial:
+            if state[root]:
+                continue
+            state[root] = 1
+            stack = [(root, cls._edge_targets(successors[root]))]
+            while stack:
+                node_idx, targets = stack[-1]
+                for to_idx in targets:
+                    if state[to_idx] == 1:
+                        continue
+                    in_degree[to_idx] += 1
+                    if not state[to_idx]:
+                        state[to_idx] = 1
+                        stack.append((to_idx, cls._edge_targets(successors[to_idx])))
+                        break
+                else:
+                    state[node_idx] = 2
+                    stack.pop()
+        return in_degree
+
+    def _settle_edges(self, node_idx: int, taken: List[int], graph: CompiledGraph,
+                      waiting: List[int], live: bytearray) -> List[int]:
+        """
+        Settle the outgoing edges of a node that has finished or was skipped.
+
+        Every edge lowers its target's count of unsettled incoming edges in
+        waiting; edges whose target is in taken also mark it live. A target
+        whose count reaches zero is returned to run if it is live, and is
+        otherwise skipped, settling its own edges as not taken.
+
+        Returns:
+            Indices of the nodes that became runnable
+        """
+        runnable = []
+        stack = [(node_idx, taken)]
+        while stack:
+            node_idx, taken = stack.pop()
+            for to_idx in taken:
+                live[to_idx] = 1
+            for to_idx in self._edge_targets(graph.successors[node_idx]):
+                waiting[to_idx] -= 1
+                if waiting[to_idx] == 0:
+                    if live[to_idx]:
+                        runnable.append(to_idx)
+                    else:
+                        stack.append((to_idx, _EMPTY_TUPLE))
+        return runnable
+
+    def _evaluate_edge_condition(self, predicate: Optional[Callable[[Dict], bool]],
+                                 context: Dict) -> bool:
         """
         Evaluate edge condition, returning True if should traverse.
 
         Args:
-            edge: Edge object with optional condition
+            predicate: Compiled edge condition (None = always traverse)
             context: Current workflow context for condition evaluation
 
         Returns:
             True if edge should be traversed, False otherwise
         """
-        if not edge.condition:
+        if predicate is None:
             return True
         try:
-            return safe_eval_condition(edge.condition, context)
+            return predicate(context)
         except Exception as e:
             sys.stderr.write(f"Warning: Condition evaluation failed for edge: {e}\n")
             return False
 
-    def _get_next_nodes(self, current_node: str, edges_from: Dict[str, List[Edge]],
-                        context: Dict) -> List[str]:
+    def _get_next_nodes(self, node_idx: int, graph: CompiledGraph,
+                        context: Dict) -> List[int]:
         """
         Get next nodes to traverse based on edge conditions.
 
         Args:
-            current_node: Current node ID
-            edges_from: Dictionary mapping node IDs to outgoing edges
+            node_idx: Index of the node that just completed
+            graph: Compiled workflow graph
             context: Current workflow context for condition evaluation
 
         Returns:
-            List of next node IDs to execute
+            List of next node indices to execute: unconditional targets
+            first, then conditional targets whose predicate holds
         """
-        next_nodes = []
-        for edge in edges_from.get(current_node, []):
-            if self._evaluate_edge_condition(edge, context):
-                next_nodes.append(edge.to_node)
+        unconditional, conditional = graph.successors[node_idx]
+        next_nodes = list(unconditional)
+        for to_idx, predicate in conditional:
+            if self._evaluate_edge_condition(predicate, context):
+                next_nodes.append(to_idx)
         return next_nodes
 
+    def _node_pool(self) -> ThreadPoolExecutor:
+        """Return the shared sibling-node pool, creating it on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_parallel_nodes,
+                                            thread_name_prefix="conductor-node")
+        return self._pool
+
+    def _submit_node(self, run_id: int, node: Node, context: Dict) -> Future:
+        """
+        Schedule a node on the shared pool.
+
+        Falls back to running the node inline (returning an already
+        resolved future) if the pool has been shut down.
+        """
+        try:
+            return self._node_pool().submit(self.execute_node, run_id, node, context, True)
+        except RuntimeError:
+            future = Future()
+            future.set_result(self.execute_node(run_id, node, context, buffered=True))
+            return future
+
     def run_workflow(self, workflow_name: str, input_data: Dict = None,
                      on_node_complete: Callable = None) -> int:
         """
         Execute a workflow from start to finish.
 
+        Nodes are streamed through a shared thread pool: as soon as a node
+        finishes, its result is merged into the context and its outgoing
+        edges are settled, without waiting for slower siblings. A node is
+        scheduled once every incoming edge from a node reachable from
+        __start__ has settled, that is its source finished or was skipped,
+        and at least one of those edges was taken (its condition held); a
+        node none of whose edges were taken is skipped. So a join node sees
+        the results of all its predecessors. Each node runs at most once per
+        run, on a snapshot of the context taken when it was scheduled; nodes
+        scheduled between two merges share one snapshot dict. Merges and callbacks
+        happen on the calling thread in completion order; a custom node
+        executor must be thread-safe. Execution records are written in
+        batches (every _EXEC_FLUSH_EVERY nodes and when the run ends).
+
         Args:
             workflow_name: Name of workflow to run
             input_data: Initial input parameters
-            on_node_complete: Callback after each node (for progress reporting)
+            on_node_complete: Callback after each node (for progress reporting).
+                Called as (node_id, success, result) on a background thread in
+                completion order; all calls have finished when this returns.
+                If it raises, it is not called again and the exception is
+                re-raised here once the run has been recorded.
 
         Returns:
             Run ID
         """
-        workflow = self.get_workflow(workflow_name)
+        workflow = self._load_workflow(workflow_name)
         if not workflow:
             raise ValueError(f"Workflow not found: {workflow_name}")
 
         input_data = input_data or {}
         run_id = self.start_run(workflow_name, workflow["id"], input_data)
 
-        context = input_data.copy()
-        nodes_by_id = {n["id"]: Node(**n) for n in workflow["nodes"]}
-
-        # Build adjacency list from edges and get initial nodes
-        edges_from = self._build_edge_index(workflow["edges"])
-        current_nodes = self._get_initial_nodes(edges_from)
-        completed_nodes = set()
-
-        while current_nodes:
-            # Execute current batch (could be parallel)
-            next_nodes = []
-
-            for node_id in current_nodes:
-                if node_id == "__end__" or node_id in completed_nodes:
-                    continue
-
-                node = nodes_by_id.get(node_id)
-                if not node:
-                    continue
+        # Node results layer over the caller's input, which is never copied
+        # or mutated; snapshot is the materialized dict handed to executors
+        context = ChainMap({}, input_data)
+        snapshot = None
+        graph = self._get_graph(workflow)
+        nodes = graph.nodes
+        # Unsettled incoming edges per node, and whether any edge into it
+        # (or from __start__) was taken
+        waiting = list(graph.in_degree)
+        live = bytearray(len(nodes))
+        for node_idx in graph.initial:
+            live[node_idx] = 1
+        pending: Dict[Future, int] = {}
+        ready = [i for i in graph.initial if not waiting[i]]
+
+        # Loop-invariant bound methods
+        submit, next_nodes_of, merge = self._submit_node, self._get_next_nodes, context.update
+        settle = self._settle_edges
+        dispatcher = _CallbackDispatcher(on_node_complete) if on_node_complete else None
 
-                success, result = self.execute_node(run_id, node, context)
-
-                # Merge result into context
-                if success and isinstance(result, dict):
-                    context.update(result)
-
-                completed_nodes.add(node_id)
-
-                if on_node_complete:
-                    on_node_complete(node_id, success, result)
-
-                # Get next nodes based on edge conditions
-                next_nodes.extend(self._get_next_nodes(node_id, edges_from, context))
-
-            current_nodes = list(set(next_nodes))
+        try:
+            while True:
+                if ready and snapshot is None:
+                    snapshot = dict(context)
+                for node_idx in ready:
+                    pending[submit(run_id, nodes[node_idx], snapshot)] = node_idx
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                ready = []
+
+                # Handle finished nodes in submission order
+                for future in [f for f in pending if f in done]:
+                    node_idx = pending.pop(future)
+                    success, result = future.result()
+
+                    # Merge result into context
+                    if success and isinstance(result, dict) and result:
+                        merge(result)
+                        snapshot = None
+
+                    if dispatcher:
+                        dispatcher.post(nodes[node_idx].id, success, result)
+
+                    # Settle outgoing edges; joins run once all have settled
+                    ready.extend(settle(node_idx, next_nodes_of(node_idx, graph, context),
+                                        graph, waiting, live))
+        finally:
+            # Persist buffered executions even if the run aborts
+            self._flush_executions()
+            if dispatcher:
+                dispatcher.close()
 
         # Complete the run
-        self.update_run_context(run_id, context)
-        self.update_run_status(run_id, "completed", output=context)
+        output = dict(context)
+        self.update_run_context(run_id, output)
+        self.update_run_status(run_id, "completed", output=output)
+
+        if dispatcher and dispatcher.error is not None:
+            raise dispatcher.error
 
         return run_id
 
@@ -953,6 +1684,7 @@ class Conductor:
 # CLI interface
 if __name__ == "__main__":
     import argparse
+    from json_compat import dumps_pretty as json_dumps_pretty
 
     parser = argparse.ArgumentParser(description="Conductor - Workflow Orchestration")
     subparsers = parser.add_subparsers(dest="command", help="Commands")
@@ -975,7 +1707,16 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    conductor = Conductor()
+    if args.command is None:
+        parser.print_help()
+        sys.exit(0)
+
+    # list/show/run only read; hotspots may need the startup schema
+    # (trail_hotspots backfill), so it opens a regular Conductor
+    if args.command == "hotspots":
+        conductor = Conductor()
+    else:
+        conductor = Conductor.open_readonly()
 
     if args.command == "list":
         workflows = conductor.list_workflows()
@@ -989,14 +1730,14 @@ if __name__ == "__main__":
     elif args.command == "show":
         workflow = conductor.get_workflow(args.name)
         if workflow:
-            print(json.dumps(workflow, indent=2, default=str))
+            print(json_dumps_pretty(workflow))
         else:
             print(f"Workflow not found: {args.name}")
 
     elif args.command == "run":
         run = conductor.get_run(args.run_id)
         if run:
-            print(json.dumps(run, indent=2, default=str))
+            print(json_dumps_pretty(run))
             print("\nNode Executions:")
             for exec_record in conductor.get_node_executions(args.run_id):
                 status_icon = "✓" if exec_record["status"] == "completed" else "✗" if exec_record["status"] == "failed" else "○"
@@ -19,141 +19,83 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from validation import (
     validate_node_id,
+    validate_node_ids_bulk,
     validate_agent_type,
     ValidationError
 )
 
 
-def demo_valid_identifiers():
-    """Demonstrate validation of valid identifiers."""
+# (value, should_pass, description) cases for each section
+VALID_IDENTIFIERS = [
+    ("node123", True, "Alphanumeric"),
+    ("test-node", True, "Hyphenated"),
+    ("my_node_id", True, "Underscored"),
+    ("NODE-123-abc", True, "Mixed case"),
+    ("workflow-2024-12-10", True, "Date suffix"),
+]
+
+COMMAND_INJECTION_ATTEMPTS = [
+    ("node; rm -rf /", False, "Command chaining with semicolon"),
+    ("node && cat /etc/passwd", False, "Command chaining with &&"),
+    ("node || malicious", False, "Command chaining with ||"),
+    ("node | grep secrets", False, "Pipe to another command"),
+    ("node$(whoami)", False, "Command substitution with $()"),
+    ("node`whoami`", False, "Command substitution with backticks"),
+    ("node${PATH}", False, "Environment variable expansion"),
+    ("node > /tmp/evil", False, "Output redirection"),
+    ("node < /etc/passwd", False, "Input redirection"),
+]
+
+PATH_TRAVERSAL_ATTEMPTS = [
+    ("../../../etc/passwd", False, "Unix path traversal"),
+    ("..\\..\\windows\\system32", False, "Windows path traversal"),
+    ("node/../admin", False, "Relative path in node ID"),
+    ("/etc/passwd", False, "Absolute path"),
+    ("C:\\Windows\\System32", False, "Windows absolute path"),
+]
+
+EDGE_CASES = [
+    ("", False, "Empty string"),
+    ("_node", False, "Starts with underscore"),
+    ("node_", False, "Ends with underscore"),
+    ("-node", False, "Starts with hyphen"),
+    ("node-", False, "Ends with hyphen"),
+    ("a" * 101, False, "Too long (101 chars)"),
+    ("node\x00", False, "Null byte injection"),
+    ("node\n", False, "Newline character"),
+    ("node id", False, "Contains space"),
+]
+
+AGENT_TYPES = [
+    ("general-purpose", True, "Hyphenated agent type"),
+    ("code review", True, "Agent type with space"),
+    ("Explore", True, "Simple agent type"),
+    ("agent;drop table", False, "Command injection attempt"),
+    ("agent|ls", False, "Pipe command attempt"),
+    ("agent$(whoami)", False, "Command substitution attempt"),
+]
+
+
+def run_cases(title, validator, cases):
+    """Run every (value, should_pass, description) case and print the outcome."""
     print("=" * 60)
-    print("VALID IDENTIFIERS - These will be accepted")
+    print(title)
     print("=" * 60)
 
-    valid_ids = [
-        "node123",
-        "test-node",
-        "my_node_id",
-        "NODE-123-abc",
-        "workflow-2024-12-10",
-    ]
-
-    for node_id in valid_ids:
-        try:
-            result = validate_node_id(node_id)
-            print(f"✓ {node_id:<30} -> VALID")
-        except ValidationError as e:
-            print(f"✗ {node_id:<30} -> ERROR: {e}")
-
-    print()
-
-
-def demo_command_injection_attempts():
-    """Demonstrate blocking of command injection attempts."""
-    print("=" * 60)
-    print("COMMAND INJECTION ATTEMPTS - These will be BLOCKED")
-    print("=" * 60)
-
-    attacks = [
-        ("node; rm -rf /", "Command chaining with semicolon"),
-        ("node && cat /etc/passwd", "Command chaining with &&"),
-        ("node || malicious", "Command chaining with ||"),
-        ("node | grep secrets", "Pipe to another command"),
-        ("node$(whoami)", "Command substitution with $()"),
-        ("node`whoami`", "Command substitution with backticks"),
-        ("node${PATH}", "Environment variable expansion"),
-        ("node > /tmp/evil", "Output redirection"),
-        ("node < /etc/passwd", "Input redirection"),
-    ]
-
-    for attack, description in attacks:
-        try:
-            result = validate_node_id(attack)
-            print(f"✗ {attack:<30} -> DANGER: NOT BLOCKED! (This is a bug)")
-        except ValidationError as e:
-            print(f"✓ {attack:<30} -> BLOCKED: {description}")
-
-    print()
-
-
-def demo_path_traversal_attempts():
-    """Demonstrate blocking of path traversal attempts."""
-    print("=" * 60)
-    print("PATH TRAVERSAL ATTEMPTS - These will be BLOCKED")
-    print("=" * 60)
-
-    attacks = [
-        ("../../../etc/passwd", "Unix path traversal"),
-        ("..\\..\\windows\\system32", "Windows path traversal"),
-        ("node/../admin", "Relative path in node ID"),
-        ("/etc/passwd", "Absolute path"),
-        ("C:\\Windows\\System32", "Windows absolute path"),
-    ]
-
-    for attack, description in attacks:
+    for value, should_pass, description in cases:
+        display = value[:30] + "..." if len(value) > 30 else value
         try:
-            result = validate_node_id(attack)
-            print(f"✗ {attack:<30} -> DANGER: NOT BLOCKED! (This is a bug)")
+            validator(value)
+            error = None
         except ValidationError as e:
-            print(f"✓ {attack:<30} -> BLOCKED: {description}")
+            error = e
 
-    print()
-
-
-def demo_edge_cases():
-    """Demonstrate handling of edge cases."""
-    print("=" * 60)
-    print("EDGE CASES - Special situations")
-    print("=" * 60)
-
-    edge_cases = [
-        ("", "Empty string"),
-        ("_node", "Starts with underscore"),
-        ("node_", "Ends with underscore"),
-        ("-node", "Starts with hyphen"),
-        ("node-", "Ends with hyphen"),
-        ("a" * 101, "Too long (101 chars)"),
-        ("node\x00", "Null byte injection"),
-        ("node\n", "Newline character"),
-        ("node id", "Contains space"),
-    ]
-
-    for test_case, description in edge_cases:
-        try:
-            result = validate_node_id(test_case)
-            display = test_case[:30] + "..." if len(test_case) > 30 else test_case
-            print(f"✗ {display:<30} -> DANGER: NOT BLOCKED! ({description})")
-        except ValidationError as e:
-            display = test_case[:30] + "..." if len(test_case) > 30 else test_case
-            print(f"✓ {display:<30} -> BLOCKED: {description}")
-
-    print()
-
-
-def demo_agent_types():
-    """Demonstrate validation of agent types (which allow spaces)."""
-    print("=" * 60)
-    print("AGENT TYPES - Allow spaces but still secure")
-    print("=" * 60)
-
-    agent_types = [
-        ("general-purpose", True, "Hyphenated agent type"),
-        ("code review", True, "Agent type with space"),
-        ("Explore", True, "Simple agent type"),
-        ("agent;drop table", False, "Command injection attempt"),
-        ("agent|ls", False, "Pipe command attempt"),
-        ("agent$(whoami)", False, "Command substitution attempt"),
-    ]
-
-    for agent_type, should_pass, description in agent_types:
-        try:
-            result = validate_agent_type(agent_type)
-            symbol = "✓" if should_pass else "✗"
-            print(f"{symbol} {agent_type:<30} -> VALID: {description}")
-        except ValidationError as e:
-            symbol = "✓" if not should_pass else "✗"
-            status = "BLOCKED" if not should_pass else "ERROR"
-            print(f"{symbol} {agent_type:<30} -> {status}: {description}")
+        if error is None:
+            status = "VALID" if should_pass else "DANGER: NOT BLOCKED! (This is a bug)"
+        else:
+            status = "BLOCKED" if not should_pass else f"ERROR ({error})"
+        symbol = "✓" if (error is None) == should_pass else "✗"
+        print(f"{symbol} {display:<30} -> {status}: {description}")
 
     print()
 
@@ -206,13 +148,26 @@ def main():
     print("the Conductor system from security vulnerabilities.")
     print()
 
-    demo_valid_identifiers()
-    demo_command_injection_attempts()
-    demo_path_traversal_attempts()
-    demo_edge_cases()
-    demo_agent_types()
+    run_cases("VALID IDENTIFIERS - These will be accepted",
+              validate_node_id, VALID_IDENTIFIERS)
+    run_cases("COMMAND INJECTION ATTEMPTS - These will be BLOCKED",
+              validate_node_id, COMMAND_INJECTION_ATTEMPTS)
+    run_cases("PATH TRAVERSAL ATTEMPTS - These will be BLOCKED",
+              validate_node_id, PATH_TRAVERSAL_ATTEMPTS)
+    run_cases("EDGE CASES - Special situations",
+              validate_node_id, EDGE_CASES)
+    run_cases("AGENT TYPES - Allow spaces but still secure",
+              validate_agent_type, AGENT_TYPES)
     demo_security_in_practice()
 
+    # Bulk checks return one bool per ID instead of raising
+    all_node_cases = VALID_IDENTIFIERS + COMMAND_INJECTION_ATTEMPTS + PATH_TRAVERSAL_ATTEMPTS + EDGE_CASES
+    accepted = validate_node_ids_bulk([value for value, _, _ in all_node_cases])
+    expected = [should_pass for _, should_pass, _ in all_node_cases]
+    print(f"Bulk check: {sum(accepted)}/{len(accepted)} node IDs accepted, "
+          f"{'matching' if accepted == expected else 'NOT matching'} the per-ID results")
+    print()
+
     print("=" * 60)
     print("SUMMARY")
     print("=" * 60)
@@ -20,15 +20,27 @@ USAGE:
     conductor.run_workflow("my-workflow")
 """
 
+import ctypes
+import ctypes.util
 import json
 import os
+import re
+import select
+import struct
+import sys
 import time
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Optional
 from datetime import datetime
 
 from elf_paths import get_base_path
+from json_compat import dumps_bytes as json_dumps_bytes, loads as json_loads
 
 # Import validation utilities
 from validation import (
@@ -38,8 +50,280 @@ from validation import (
     ValidationError
 )
 
+# Output parsing patterns, compiled once rather than per node result
+_FINDINGS_RE = re.compile(r'## FINDINGS\s*\n(.*?)(?=\n##|\n---|\Z)', re.DOTALL | re.IGNORECASE)
+# One "- [type:tags:importance] content" line; finditer runs it over a whole section
+_FINDING_LINE_RE = re.compile(r'^[ \t]*-[ \t]*\[([^\]\n]+)\][ \t]*(.*\S)', re.MULTILINE)
+# Both file-mention forms in one alternation so the output is scanned once
+_FILES_RE = re.compile(
+    r'(?:created|modified|edited|wrote|updated)\s+[`"\']?([^\s`"\']+\.[a-zA-Z]+)'
+    r'|File\s+[`"\']([^\s`"\']+\.[a-zA-Z]+)[`"\']',
+    re.IGNORECASE)
 
-class CLIExecutor:
+# Instructions appended to every swarm ant's prompt
+_SWARM_SUFFIX = """
+
+Report findings in ## FINDINGS section with format:
+- [type:tags:importance] description
+
+Types: fact, discovery, warning, blocker, hypothesis
+Importance: low, normal, high, critical
+"""
+
+# Only the tail of a task's output is kept in memory; the FINDINGS section
+# the parsers look for comes at the end of the reply
+_OUTPUT_TAIL_BYTES = 64 * 1024
+
+# stderr is kept apart from the parsed output; its tail is only for diagnosis
+_STDERR_TAIL_BYTES = 4 * 1024
+
+# Cap on result_text stored in .coordination/result-*.json files, in UTF-8 bytes
+_RESULT_FILE_MAX_BYTES = 10000
+
+# HookSignalExecutor poll interval when inotify is unavailable: starts
+# short so fast hooks are picked up quickly, doubling up to the cap
+_POLL_INITIAL_DELAY = 0.05
+_POLL_MAX_DELAY = 1.0
+
+# inotify(7) event bits and the fixed part of struct inotify_event
+# (wd, mask, cookie, len); the name follows, NUL-padded to len bytes
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+# Upper bound on claude processes a single executor runs at once. Subprocess
+# waits are I/O-bound, so a couple of workers per core is plenty.
+_DEFAULT_MAX_PARALLEL = min(8, (os.cpu_count() or 1) * 2)
+
+
+class _Placeholder:
+    """Stands in for a missing context key and formats back to its own field text."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def __format__(self, spec: str) -> str:
+        return "{" + self.key + (":" + spec if spec else "") + "}"
+
+    def __str__(self) -> str:
+        return "{" + self.key + "}"
+
+    __repr__ = __str__
+
+
+class _Missing:
+    """
+    View over a context that leaves unknown {placeholders} in the prompt.
+
+    Wraps the context rather than subclassing dict, so formatting never
+    copies it.
+    """
+
+    __slots__ = ("context",)
+
+    def __init__(self, context: Dict):
+        self.context = context
+
+    def __getitem__(self, key: str):
+        try:
+            return self.context[key]
+        except KeyError:
+            return _Placeholder(key)
+
+
+def _safe_format(template: str, context: Dict) -> str:
+    """
+    Fill {placeholders} in a prompt template from context.
+
+    Templates without a '{' are returned as-is without formatting.
+    Unknown keys are left in place, so literal braces such as JSON
+    examples survive. A template str.format cannot parse is returned
+    unchanged.
+    """
+    if not context or "{" not in template:
+        return template
+    try:
+        return template.format_map(_Missing(context))
+    except (ValueError, IndexError, AttributeError, TypeError):
+        return template
+
+
+def _truncate_utf8(text: str, max_bytes: int) -> str:
+    """Cut text to at most max_bytes of UTF-8 without splitting a character."""
+    if len(text) * 4 <= max_bytes:
+        return text  # Fits even if every character takes 4 bytes
+    # No more than max_bytes characters can fit, so only encode those
+    data = text[:max_bytes].encode("utf-8")
+    if len(data) <= max_bytes and len(text) <= max_bytes:
+        return text
+    return data[:max_bytes].decode("utf-8", errors="ignore")
+
+
+def _atomic_write(path: Path, data: bytes):
+    """
+    Replace path with data in one write.
+
+    The bytes go to a sibling .tmp file that is then renamed over path, so
+    hooks polling the file never see a partially written version.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _read_tail(pipe, limit: int) -> Tuple[bytes, bool]:
+    """
+    Drain a binary pipe line by line, keeping only its last limit bytes.
+
+    Returns the kept bytes and whether anything before them was dropped.
+    """
+    tail = deque()
+    size = 0
+    truncated = False
+    with pipe:
+        for line in pipe:
+            if len(line) > limit:
+                line = line[-limit:]
+                truncated = True
+            tail.append(line)
+            size += len(line)
+            while size > limit:
+                size -= len(tail.popleft())
+                truncated = True
+    return b"".join(tail), truncated
+
+
+def _atomic_write_json(path: Path, obj):
+    """Atomically write obj to path as compact JSON."""
+    _atomic_write(path, json_dumps_bytes(obj))
+
+
+class _SignalWatcher:
+    """
+    inotify watch on a directory, used to wake HookSignalExecutor when a
+    signal file is written instead of polling it.
+
+    Talks to libc through ctypes, so there is no extra dependency. create()
+    returns None off Linux or when no watch can be set up, and callers fall
+    back to polling.
+    """
+
+    _libc = None  # Loaded on first use; False once known to be unavailable
+
+    def __init__(self, fd: int):
+        self._fd = fd
+        self._poller = select.poll()
+        self._poller.register(fd, select.POLLIN)
+
+    @classmethod
+    def _load_libc(cls):
+        if cls._libc is None:
+            cls._libc = False
+            if sys.platform.startswith("linux"):
+                try:
+                    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+                    libc.inotify_init1.argtypes = [ctypes.c_int]
+                    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+                    cls._libc = libc
+                except (OSError, AttributeError):
+                    pass
+        return cls._libc
+
+    @classmethod
+    def create(cls, directory: Path) -> Optional["_SignalWatcher"]:
+        """Watch directory for finished writes, or return None to poll."""
+        libc = cls._load_libc()
+        if not libc:
+            return None
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None  # e.g. max_user_instances reached
+        # CLOSE_WRITE covers in-place rewrites, MOVED_TO atomic renames
+        if libc.inotify_add_watch(fd, os.fsencode(directory), _IN_CLOSE_WRITE | _IN_MOVED_TO) < 0:
+            os.close(fd)
+            return None
+        return cls(fd)
+
+    def wait(self, name: str, timeout: float) -> bool:
+        """
+        Block until the file called name is written or timeout seconds pass.
+
+        Returns whether a write to name was seen.
+        """
+        encoded = os.fsencode(name)
+        deadline = time.monotonic() + timeout
+        remaining = timeout
+        while remaining > 0:
+            if not self._poller.poll(int(remaining * 1000) + 1):
+                return False
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                data = b""
+            # Other nodes' signals share the directory; only wake for ours
+            offset = 0
+            while offset < len(data):
+                length = _INOTIFY_EVENT.unpack_from(data, offset)[3]
+                offset += _INOTIFY_EVENT.size
+                if data[offset:offset + length].rstrip(b"\0") == encoded:
+                    return True
+                offset += length
+            remaining = deadline - time.monotonic()
+        return False
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _BaseExecutor:
+    """
+    State shared by the executors: project paths and the lazily created
+    coordination directory.
+    """
+
+    def __init__(self, project_root: str = "."):
+        self.project_root = Path(project_root).resolve()
+        # Created on first write; see _ensure_coord_dir
+        self.coordination_dir = self.project_root / ".coordination"
+        self._coord_ready = False
+        self._db_path: Optional[Path] = None
+
+    def _ensure_coord_dir(self):
+        """Create the coordination directory the first time a file is written."""
+        if not self._coord_ready:
+            self.coordination_dir.mkdir(parents=True, exist_ok=True)
+            self._coord_ready = True
+
+    @property
+    def db_path(self) -> Path:
+        """SQLite database for result checking, resolved on first use."""
+        if self._db_path is None:
+            # .coordination marks the repo root for get_base_path, so it
+            # must exist before the base path is resolved
+            self._ensure_coord_dir()
+            self._db_path = get_base_path(self.project_root) / "memory" / "index.db"
+        return self._db_path
+
+    def close(self):
+        """Release executor resources; the base executor holds none."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class CLIExecutor(_BaseExecutor):
     """
     Execute nodes via Claude Code CLI.
 
@@ -47,23 +331,40 @@ class CLIExecutor:
     or directly invokes Claude Code CLI for subagent tasks.
     """
 
-    def __init__(self, project_root: str = ".", timeout: int = 300):
+    def __init__(self, project_root: str = ".", timeout: int = 300,
+                 max_parallel: int = _DEFAULT_MAX_PARALLEL,
+                 keep_prompt_on_disk: bool = False):
         """
         Initialize the CLI executor.
 
         Args:
             project_root: Project directory for coordination
             timeout: Max seconds to wait for execution (default 5 min)
+            max_parallel: Max claude processes running at once across all
+                swarm/parallel nodes handled by this executor
+            keep_prompt_on_disk: Also write each prompt to
+                .coordination/prompt-<node_id>.md while its task runs
         """
-        self.project_root = Path(project_root).resolve()
+        super().__init__(project_root)
         self.timeout = timeout
-        self.coordination_dir = self.project_root / ".coordination"
+        self.max_parallel = max_parallel
+        self.keep_prompt_on_disk = keep_prompt_on_disk
+        self._pool: Optional[ThreadPoolExecutor] = None
 
-        # Ensure coordination directory exists
-        self.coordination_dir.mkdir(parents=True, exist_ok=True)
+        # Fixed parts of every claude invocation, built once per executor
+        # Using --print for non-interactive output capture
+        self._base_cmd = (
+            "claude",
+            "--print",  # Non-interactive, print result
+            "--dangerously-skip-permissions",  # Skip confirmations
+        )
+        self._base_env = dict(os.environ)
 
-        # SQLite for result checking
-        self.db_path = get_base_path(self.project_root) / "memory" / "index.db"
+    def close(self):
+        """Wait for running tasks and shut down the task pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
 
     def execute(self, node, context: Dict) -> Tuple[str, Dict]:
         """
@@ -100,12 +401,7 @@ class CLIExecutor:
             }
 
         # Format prompt with context
-        prompt = node.prompt_template
-        if context:
-            try:
-                prompt = prompt.format(**context)
-            except KeyError:
-                pass  # Keep original if formatting fails
+        prompt = _safe_format(node.prompt_template, context)
 
         # Get agent type from config and validate it
         agent_type = node.config.get("agent_type", "general-purpose") if node.config else "general-purpose"
@@ -133,7 +429,7 @@ class CLIExecutor:
 
         # For CLI execution, we need to spawn the actual process
         # This uses claude CLI with the prompt
-        result_text, result_dict = self._spawn_claude_task(
+        result_text, result_dict = self._spawn_claude_task_unchecked(
             node_id=validated_node_id,
             prompt=prompt,
             agent_type=validated_agent_type
@@ -176,15 +472,12 @@ class CLIExecutor:
             }
 
         # Format base prompt
-        base_prompt = node.prompt_template
-        if context:
-            try:
-                base_prompt = base_prompt.format(**context)
-            except KeyError:
-                pass
+        base_prompt = _safe_format(node.prompt_template, context)
+        # Everything after the role line is the same for every ant
+        shared_prompt = f"\n\n{base_prompt}{_SWARM_SUFFIX}"
 
-        # Spawn multiple ants
-        results = []
+        # Build one task per ant, then run them all at once
+        ants = []
         for i in range(min(num_ants, len(roles))):
             role = roles[i % len(roles)]
             # Validate role before using it in node_id
@@ -194,41 +487,32 @@ class CLIExecutor:
                 # Skip invalid roles
                 continue
 
-            ant_prompt = f"""[SWARM] You are a {validated_role} agent.
-
-{base_prompt}
-
-Report findings in ## FINDINGS section with format:
-- [type:tags:importance] description
-
-Types: fact, discovery, warning, blocker, hypothesis
-Importance: low, normal, high, critical
-"""
-            result_text, result_dict = self._spawn_claude_task(
-                node_id=f"{validated_node_id}-{validated_role}-{i}",
-                prompt=ant_prompt,
-                agent_type=validated_agent_type
-            )
-            results.append({
-                "role": validated_role,
-                "result_text": result_text,
-                "result_dict": result_dict
-            })
+            ant_prompt = f"[SWARM] You are a {validated_role} agent.{shared_prompt}"
+            ants.append((validated_role, (
+                f"{validated_node_id}-{validated_role}-{i}",
+                ant_prompt,
+                validated_agent_type
+            )))
+
+        outputs = self._run_concurrently([task for _, task in ants])
+        results = [
+            {"role": role, "result_text": result_text, "result_dict": result_dict}
+            for (role, _), (result_text, result_dict) in zip(ants, outputs)
+        ]
 
         # Aggregate results
-        all_findings = []
-        all_files = []
-        for r in results:
-            all_findings.extend(r["result_dict"].get("findings", []))
-            all_files.extend(r["result_dict"].get("files_modified", []))
+        all_findings, all_files = self._merge_results(results)
 
-        combined_text = "\n\n---\n\n".join([
-            f"## {r['role']}\n{r['result_text']}" for r in results
-        ])
+        # Join the pieces directly so each result_text is copied only once,
+        # into the final string, rather than first into a per-role f-string
+        parts = []
+        for r in results:
+            parts.extend(("## ", r['role'], "\n", r['result_text'], "\n\n---\n\n"))
+        combined_text = "".join(parts[:-1])  # Drop the trailing separator
 
         return combined_text, {
             "findings": all_findings,
-            "files_modified": list(set(all_files)),
+            "files_modified": all_files,
             "swarm_results": results
         }
 
@@ -262,59 +546,50 @@ Importance: low, normal, high, critical
                 "files_modified": []
             }
 
-        results = []
+        tasks = []
         for i, sub_prompt in enumerate(sub_prompts):
-            if context:
-                try:
-                    sub_prompt = sub_prompt.format(**context)
-                except KeyError:
-                    pass
-
-            result_text, result_dict = self._spawn_claude_task(
-                node_id=f"{validated_node_id}-parallel-{i}",
-                prompt=sub_prompt,
-                agent_type=validated_agent_type
-            )
-            results.append({
-                "index": i,
-                "result_text": result_text,
-                "result_dict": result_dict
-            })
+            tasks.append((
+                f"{validated_node_id}-parallel-{i}",
+                _safe_format(sub_prompt, context),
+                validated_agent_type
+            ))
+
+        # Sub-prompts are independent: run them all at once
+        results = [
+            {"index": i, "result_text": result_text, "result_dict": result_dict}
+            for i, (result_text, result_dict) in enumerate(self._run_concurrently(tasks))
+        ]
 
         # Aggregate
-        all_findings = []
-        all_files = []
-        for r in results:
-            all_findings.extend(r["result_dict"].get("findings", []))
-            all_files.extend(r["result_dict"].get("files_modified", []))
+        all_findings, all_files = self._merge_results(results)
 
-        combined_text = "\n\n---\n\n".join([r['result_text'] for r in results])
+        combined_text = "\n\n---\n\n".join(map(itemgetter('result_text'), results))
 
         return combined_text, {
             "findings": all_findings,
-            "files_modified": list(set(all_files)),
+            "files_modified": all_files,
             "parallel_results": results
         }
 
-    def _spawn_claude_task(self, node_id: str, prompt: str,
-                          agent_type: str = "general-purpose") -> Tuple[str, Dict]:
+    @staticmethod
+    def _merge_results(results: List[Dict]) -> Tuple[List[Dict], List[str]]:
         """
-        Spawn a Claude Code task and capture results.
-
-        This is the core execution that actually runs claude CLI.
-
-        Args:
-            node_id: Node identifier (must be pre-validated)
-            prompt: Prompt text to execute
-            agent_type: Agent type (must be pre-validated)
+        Combine child task results in one pass each.
 
-        Returns:
-            Tuple of (result_text, result_dict)
+        Returns every finding in result order, plus the modified files
+        deduplicated in first-seen order.
         """
+        result_dicts = [r["result_dict"] for r in results]
+        findings = list(chain.from_iterable(d.get("findings", ()) for d in result_dicts))
+        files = dict.fromkeys(chain.from_iterable(d.get("files_modified", ()) for d in result_dicts))
+        return findings, list(files)
+
+    def _check_spawn_args(self, node_id: str, agent_type: str) -> Optional[Tuple[str, Dict]]:
+        """Return a (result_text, result_dict) error if node_id or agent_type is invalid."""
         # SECURITY: Validate node_id before using it in filenames and environment variables
         # This prevents command injection through malicious node IDs
         try:
-            validated_node_id = validate_node_id(node_id)
+            validate_node_id(node_id)
         except ValidationError as e:
             error_msg = f"[SECURITY ERROR] Invalid node_id: {str(e)}"
             return error_msg, {
@@ -326,7 +601,7 @@ Importance: low, normal, high, critical
 
         # Validate agent_type
         try:
-            validated_agent_type = validate_agent_type(agent_type)
+            validate_agent_type(agent_type)
         except ValidationError as e:
             error_msg = f"[SECURITY ERROR] Invalid agent_type: {str(e)}"
             return error_msg, {
@@ -335,61 +610,150 @@ Importance: low, normal, high, critical
                 "findings": [],
                 "files_modified": []
             }
+        return None
 
-        # Create a temp file for the prompt using validated node_id
-        prompt_file = self.coordination_dir / f"prompt-{validated_node_id}.md"
-        result_file = self.coordination_dir / f"result-{validated_node_id}.json"
+    def _run_claude(self, prompt: str, node_id: str) -> Tuple[str, str, int, bool]:
+        """
+        Run the claude CLI, keeping only the tails of its output.
 
-        # Write prompt to file
-        prompt_file.write_text(prompt, encoding='utf-8')
+        The prompt is fed on stdin rather than argv, so argv stays a fixed
+        size and long prompts cannot hit the OS argument length limit.
+        stdout and stderr are drained line by line on separate pipes, into
+        the last _OUTPUT_TAIL_BYTES and _STDERR_TAIL_BYTES respectively, so
+        a chatty task never holds more than those windows in memory.
 
-        # Build claude command
-        # Using --print for non-interactive output capture
-        cmd = [
-            "claude",
-            "--print",  # Non-interactive, print result
-            "--dangerously-skip-permissions",  # Skip confirmations
-            "-p", prompt
-        ]
+        Returns:
+            Tuple of (stdout_tail, stderr_tail, exit_code, stdout_truncated)
+
+        Raises:
+            subprocess.TimeoutExpired: If the process outlives self.timeout
+        """
+        cmd = self._base_cmd
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=64 * 1024,
+            cwd=str(self.project_root),
+            env=self._base_env | {"CLAUDE_SWARM_NODE": node_id}
+        )
+        timed_out = threading.Event()
+        stderr_tail = [b""]
+
+        def kill():
+            timed_out.set()
+            proc.kill()
 
+        def feed():
+            # Separate thread so a large prompt cannot deadlock against output
+            try:
+                with proc.stdin:
+                    proc.stdin.write(prompt.encode("utf-8"))
+            except OSError:
+                pass  # Process exited early; its output says why
+
+        def drain_stderr():
+            stderr_tail[0] = _read_tail(proc.stderr, _STDERR_TAIL_BYTES)[0]
+
+        timer = threading.Timer(self.timeout, kill)
+        timer.start()
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+        stderr_reader = threading.Thread(target=drain_stderr, daemon=True)
+        stderr_reader.start()
         try:
-            # Execute claude CLI with validated node_id in environment
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                cwd=str(self.project_root),
-                env={**os.environ, "CLAUDE_SWARM_NODE": validated_node_id}
-            )
-
-            result_text = result.stdout or ""
-            if result.stderr:
-                result_text += f"\n\n[STDERR]\n{result.stderr}"
-
-            # Parse findings from output
-            findings = self._extract_findings(result_text)
-            files = self._extract_files(result_text)
-
-            result_dict = {
-                "exit_code": result.returncode,
-                "findings": findings,
-                "files_modified": files,
-                "success": result.returncode == 0
-            }
+            stdout, truncated = _read_tail(proc.stdout, _OUTPUT_TAIL_BYTES)
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            feeder.join()
+            stderr_reader.join()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, self.timeout)
+        return (stdout.decode("utf-8", errors="replace"),
+                stderr_tail[0].decode("utf-8", errors="replace"),
+                returncode, truncated)
+
+    def _finish_task(self, node_id: str, stdout: str, stderr: str,
+                     returncode: int, truncated: bool = False) -> Tuple[str, Dict]:
+        """Parse a finished claude process's output and save its result file."""
+        # Parse findings from stdout only; stderr is diagnostics
+        findings, files = self._extract_all(stdout)
+
+        result_text = stdout
+        if stderr:
+            result_text += f"\n\n[STDERR]\n{stderr}"
+
+        result_dict = {
+            "exit_code": returncode,
+            "findings": findings,
+            "files_modified": files,
+            "success": returncode == 0,
+            "output_truncated": truncated
+        }
+
+        # Save result using validated node_id
+        result_file = self.coordination_dir / f"result-{node_id}.json"
+        _atomic_write_json(result_file, {
+            "node_id": node_id,
+            "result_text": _truncate_utf8(result_text, _RESULT_FILE_MAX_BYTES),
+            "result_dict": result_dict,
+            "timestamp": datetime.now().isoformat()
+        })
+
+        return result_text, result_dict
+
+    def _spawn_claude_task(self, node_id: str, prompt: str,
+                          agent_type: str = "general-purpose") -> Tuple[str, Dict]:
+        """
+        Validate node_id and agent_type, then spawn a Claude Code task.
+
+        Use this for ids that have not been checked yet; the _execute_*
+        methods validate up front and call _spawn_claude_task_unchecked.
+
+        Returns:
+            Tuple of (result_text, result_dict)
+        """
+        error = self._check_spawn_args(node_id, agent_type)
+        if error:
+            return error
+        return self._spawn_claude_task_unchecked(node_id, prompt, agent_type)
+
+    def _spawn_claude_task_unchecked(self, node_id: str, prompt: str,
+                                     agent_type: str = "general-purpose") -> Tuple[str, Dict]:
+        """
+        Spawn a Claude Code task and capture results.
+
+        This is the core execution that actually runs claude CLI.
+
+        Args:
+            node_id: Node identifier (must be pre-validated, or built only
+                from validated parts)
+            prompt: Prompt text to execute
+            agent_type: Agent type (must be pre-validated)
 
-            # Save result using validated_node_id
-            result_file.write_text(json.dumps({
-                "node_id": validated_node_id,
-                "result_text": result_text[:10000],  # Truncate
-                "result_dict": result_dict,
-                "timestamp": datetime.now().isoformat()
-            }, indent=2), encoding='utf-8')
+        Returns:
+            Tuple of (result_text, result_dict)
+        """
+        # Result files land here, and it also keeps project_root (the
+        # child's cwd) in existence as the eager mkdir used to
+        self._ensure_coord_dir()
 
-            return result_text, result_dict
+        # The CLI reads the prompt from stdin; the file copy is opt-in
+        prompt_file = None
+        if self.keep_prompt_on_disk:
+            prompt_file = self.coordination_dir / f"prompt-{node_id}.md"
+            _atomic_write(prompt_file, prompt.encode('utf-8'))
+
+        try:
+            # Execute claude CLI with validated node_id in environment
+            stdout, stderr, returncode, truncated = self._run_claude(prompt, node_id)
+            return self._finish_task(node_id, stdout, stderr, returncode, truncated)
 
         except subprocess.TimeoutExpired:
-            return f"[TIMEOUT] Node {validated_node_id} timed out after {self.timeout}s", {
+            return f"[TIMEOUT] Node {node_id} timed out after {self.timeout}s", {
                 "error": "timeout",
                 "findings": [],
                 "files_modified": []
@@ -408,7 +772,29 @@ Importance: low, normal, high, critical
             }
         finally:
             # Cleanup
-            prompt_file.unlink(missing_ok=True)
+            if prompt_file is not None:
+                prompt_file.unlink(missing_ok=True)
+
+    def _task_pool(self) -> ThreadPoolExecutor:
+        """Return the shared task pool, creating it on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_parallel,
+                                            thread_name_prefix="cli-executor")
+        return self._pool
+
+    def _run_concurrently(self, tasks: List[Tuple[str, str, str]]) -> List[Tuple[str, Dict]]:
+        """
+        Run pre-validated (node_id, prompt, agent_type) tasks on the shared pool.
+
+        The pool caps how many claude processes run at once, even when
+        several nodes fan out through this executor at the same time.
+        Results keep task order.
+        """
+        if len(tasks) == 1:
+            return [self._spawn_claude_task_unchecked(*tasks[0])]
+        pool = self._task_pool()
+        futures = [pool.submit(self._spawn_claude_task_unchecked, *task) for task in tasks]
+        return [future.result() for future in futures]
 
     def _write_signal(self, node_id: str, data: Dict) -> Path:
         """
@@ -429,50 +815,48 @@ Importance: low, normal, high, critical
             # If validation fails, raise an exception since this is a programming error
             raise ValueError(f"Invalid node_id passed to _write_signal: {str(e)}")
 
+        self._ensure_coord_dir()
         signal_file = self.coordination_dir / f"signal-{validated_node_id}.json"
-        signal_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        _atomic_write_json(signal_file, data)
         return signal_file
 
-    def _extract_findings(self, output: str) -> List[Dict]:
-        """Extract findings from output text."""
-        import re
+    def _extract_all(self, output: str) -> Tuple[List[Dict], List[str]]:
+        """
+        Extract findings and modified files from output text.
+
+        Each regex runs once over the text in C: finding lines are matched
+        across the ## FINDINGS section with finditer, and both file-mention
+        forms share one pattern. Files come back deduplicated in
+        first-mention order.
+        """
         findings = []
 
         # Look for ## FINDINGS section
-        match = re.search(r'## FINDINGS\s*\n(.*?)(?=\n##|\n---|\Z)', output, re.DOTALL | re.IGNORECASE)
+        match = _FINDINGS_RE.search(output)
         if match:
-            for line in match.group(1).split('\n'):
-                line = line.strip()
-                if line.startswith('-'):
-                    # Parse [type:tags:importance] content
-                    type_match = re.match(r'-\s*\[([^\]]+)\]\s*(.+)', line)
-                    if type_match:
-                        bracket = type_match.group(1)
-                        content = type_match.group(2)
-                        parts = bracket.split(':')
-                        findings.append({
-                            "type": parts[0] if parts else "note",
-                            "tags": parts[1].split(',') if len(parts) > 1 else [],
-                            "importance": parts[2] if len(parts) > 2 else "normal",
-                            "content": content
-                        })
-
-        return findings
+            # Parse [type:tags:importance] content
+            for bracket, content in _FINDING_LINE_RE.findall(match.group(1)):
+                parts = bracket.split(':')
+                findings.append({
+                    "type": parts[0] if parts else "note",
+                    "tags": parts[1].split(',') if len(parts) > 1 else [],
+                    "importance": parts[2] if len(parts) > 2 else "normal",
+                    "content": content
+                })
+
+        files = dict.fromkeys(a or b for a, b in _FILES_RE.findall(output))
+        return findings, list(files)
+
+    def _extract_findings(self, output: str) -> List[Dict]:
+        """Extract findings from output text."""
+        return self._extract_all(output)[0]
 
     def _extract_files(self, output: str) -> List[str]:
-        """Extract modified files from output."""
-        import re
-        files = []
-        patterns = [
-            r'(?:created|modified|edited|wrote|updated)\s+[`"\']?([^\s`"\']+\.[a-zA-Z]+)',
-            r'File\s+[`"\']([^\s`"\']+\.[a-zA-Z]+)[`"\']',
-        ]
-        for pattern in patterns:
-            files.extend(re.findall(pattern, output, re.IGNORECASE))
-        return list(set(files))
+        """Extract modified files from output, in first-mention order."""
+        return self._extract_all(output)[1]
 
 
-class HookSignalExecutor:
+class HookSignalExecutor(_BaseExecutor):
     """
     Alternative executor that signals via files for hook-based execution.
 
@@ -480,12 +864,6 @@ class HookSignalExecutor:
     nodes via the hook system rather than spawning new CLI processes.
     """
 
-    def __init__(self, project_root: str = "."):
-        self.project_root = Path(project_root).resolve()
-        self.coordination_dir = self.project_root / ".coordination"
-        self.coordination_dir.mkdir(parents=True, exist_ok=True)
-        self.db_path = get_base_path(self.project_root) / "memory" / "index.db"
-
     def execute(self, node, context: Dict) -> Tuple[str, Dict]:
         """
         Signal for execution via hooks and wait for result.
@@ -510,37 +888,63 @@ class HookSignalExecutor:
             "action": "execute",
             "node_id": validated_node_id,
             "node_name": node.name,
-            "prompt": node.prompt_template.format(**context) if context else node.prompt_template,
+            "prompt": _safe_format(node.prompt_template, context),
             "node_type": node.node_type.value if hasattr(node.node_type, 'value') else str(node.node_type),
             "config": node.config or {},
             "timestamp": datetime.now().isoformat(),
             "status": "pending"
         }
 
+        self._ensure_coord_dir()
         signal_file = self.coordination_dir / f"conductor-signal-{validated_node_id}.json"
-        signal_file.write_text(json.dumps(instruction, indent=2), encoding='utf-8')
 
-        # Wait for result (hook should update the signal file)
-        timeout = 300
-        start = time.time()
+        # Watch before writing so no update from the hook can be missed
+        watcher = _SignalWatcher.create(self.coordination_dir)
+        try:
+            _atomic_write_json(signal_file, instruction)
 
-        while time.time() - start < timeout:
-            try:
-                data = json.loads(signal_file.read_text())
-                if data.get("status") == "completed":
-                    signal_file.unlink(missing_ok=True)
-                    return data.get("result_text", ""), data.get("result_dict", {})
-                elif data.get("status") == "failed":
-                    signal_file.unlink(missing_ok=True)
-                    return data.get("error", "Unknown error"), {"error": data.get("error")}
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
+            # Wait for result (hook should update the signal file)
+            timeout = 300
+            deadline = time.monotonic() + timeout
+            delay = _POLL_INITIAL_DELAY
 
-            time.sleep(1)
+            while True:
+                result = self._read_signal(signal_file)
+                if result is not None:
+                    signal_file.unlink(missing_ok=True)
+                    return result
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if watcher is None:
+                    # No inotify: poll, backing off from fast to the old 1s
+                    time.sleep(min(delay, remaining))
+                    delay = min(delay * 2, _POLL_MAX_DELAY)
+                else:
+                    # Capped like the poll, so a missed event costs at most 1s
+                    watcher.wait(signal_file.name, min(remaining, _POLL_MAX_DELAY))
+        finally:
+            if watcher is not None:
+                watcher.close()
 
         signal_file.unlink(missing_ok=True)
         return f"[TIMEOUT] Waiting for node {validated_node_id}", {"error": "timeout"}
 
+    @staticmethod
+    def _read_signal(signal_file: Path) -> Optional[Tuple[str, Dict]]:
+        """Return the node result once the hook has finished it, else None."""
+        try:
+            data = json_loads(signal_file.read_bytes())
+        except (json.JSONDecodeError, FileNotFoundError):
+            return None
+
+        if data.get("status") == "completed":
+            return data.get("result_text", ""), data.get("result_dict", {})
+        elif data.get("status") == "failed":
+            return data.get("error", "Unknown error"), {"error": data.get("error")}
+        return None
+
 
 # CLI for testing
 if __name__ == "__main__":
@@ -581,4 +985,5 @@ if __name__ == "__main__":
     print("\n=== RESULT TEXT ===")
     print(result_text[:2000])
     print("\n=== RESULT DICT ===")
-    print(json.dumps(result_dict, indent=2))
+    from json_compat import dumps_pretty
+    print(dumps_pretty(result_dict))
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+JSON encode/decode helpers for the Conductor system.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. dumps() always returns str so the result can be stored in SQLite
+TEXT columns or written to files exactly like json.dumps() output;
+dumps_bytes() and dumps_pretty_bytes() skip the decode for callers writing
+straight to files or to a binary stdout.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # stdlib json only
+
+
+def dumps(obj) -> str:
+    """Serialize obj to a compact JSON string."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # Types orjson rejects (e.g. >64-bit ints) go through stdlib
+    return json.dumps(obj)
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, ready to write to a file."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_pretty(obj, default=str) -> str:
+    """Serialize obj as 2-space indented JSON; unknown types go through default."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, default=default)
+
+
+def dumps_pretty_bytes(obj, default=str) -> bytes:
+    """Like dumps_pretty(), but returns UTF-8 bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, default=default).encode("utf-8")
+
+
+def loads(data):
+    """Deserialize a JSON str or bytes value."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
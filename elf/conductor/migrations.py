@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Migrations: bring existing conductor databases up to schema.sql.
+
+schema.sql is the single source of the conductor DDL. A database created
+from an older copy of it is upgraded once, by re-applying every idempotent
+CREATE ... IF NOT EXISTS statement in the file, then adding the optional
+trails FTS index and rebuilding the hot spot summary. PRAGMA user_version
+records that the upgrade ran, so later opens skip it after one pragma read
+and never take the write lock.
+
+Used by Conductor and ReplayManager at startup:
+
+    with read_connection() as conn:
+        if needs_migration(conn):
+            with write_transaction() as conn:
+                migrate(conn)
+"""
+
+import re
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+SCHEMA_PATH = Path(__file__).parent / "schema.sql"
+
+# Stored in PRAGMA user_version once a database has been upgraded. Bump it
+# whenever schema.sql gains DDL that existing databases need.
+SCHEMA_VERSION = 2
+
+# Trigram full-text index over trails.location, so substring location
+# filters (LIKE '%...%') in query_conductor.py use an index instead of
+# scanning trails. Optional: skipped on SQLite builds without FTS5/trigram,
+# which is why it lives here rather than in schema.sql.
+#
+# Its triggers fire on every write to trails, including those from
+# trail_helper.py, post_tool_learning.py, sqlite_bridge.py and elf/memory.py.
+# Once the index exists, every process writing the database needs SQLite
+# TRAILS_FTS_MIN_SQLITE or later with FTS5, or its trail inserts fail.
+TRAILS_FTS_MIN_SQLITE = (3, 34, 0)  # First release with the trigram tokenizer
+
+TRAILS_FTS_SCHEMA = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS trails_fts USING fts5(
+        location, content='trails', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_trails_fts_insert
+    AFTER INSERT ON trails
+    BEGIN
+        INSERT INTO trails_fts(rowid, location) VALUES (NEW.id, NEW.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_trails_fts_delete
+    AFTER DELETE ON trails
+    BEGIN
+        INSERT INTO trails_fts(trails_fts, rowid, location)
+        VALUES ('delete', OLD.id, OLD.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_trails_fts_update
+    AFTER UPDATE OF location ON trails
+    BEGIN
+        INSERT INTO trails_fts(trails_fts, rowid, location)
+        VALUES ('delete', OLD.id, OLD.location);
+        INSERT INTO trails_fts(rowid, location) VALUES (NEW.id, NEW.location);
+    END
+    """,
+)
+
+SQL_CLEAR_HOTSPOTS = "DELETE FROM trail_hotspots"
+SQL_REBUILD_HOTSPOTS = """
+    INSERT INTO trail_hotspots
+        (location, trail_count, max_strength, total_strength,
+         scents, agents, last_activity)
+    SELECT
+        location,
+        COUNT(*),
+        MAX(strength),
+        IFNULL(SUM(strength), 0),
+        GROUP_CONCAT(DISTINCT scent),
+        GROUP_CONCAT(DISTINCT agent_id),
+        MAX(created_at)
+    FROM trails
+    GROUP BY location
+"""
+
+_IDEMPOTENT_DDL = re.compile(
+    r"CREATE\s+(?:TABLE|INDEX|TRIGGER)\s+IF\s+NOT\s+EXISTS\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def upgrade_statements() -> Tuple[str, ...]:
+    """The CREATE ... IF NOT EXISTS statements of schema.sql, in file order."""
+    statements = []
+    pending = ""
+    for line in SCHEMA_PATH.read_text().splitlines(keepends=True):
+        if not pending and (not line.strip() or line.lstrip().startswith("--")):
+            continue
+        pending += line
+        if sqlite3.complete_statement(pending):
+            if _IDEMPOTENT_DDL.match(pending.strip()):
+                statements.append(pending.strip())
+            pending = ""
+    return tuple(statements)
+
+
+def needs_migration(conn: sqlite3.Connection) -> bool:
+    """
+    True if conn's database holds conductor tables not yet upgraded.
+
+    Read-only, so it can run on a reader connection before deciding to
+    take the write lock. Databases without conductor tables are left alone.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return False
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'node_executions'"
+    ).fetchone() is not None
+
+
+def migrate(conn: sqlite3.Connection) -> bool:
+    """
+    Upgrade conn's database to schema.sql inside the caller's transaction.
+
+    The caller must hold the write lock (BEGIN IMMEDIATE); the check is
+    repeated under it, so concurrent processes upgrade only once.
+
+    Returns:
+        True if the database was upgraded
+    """
+    if not needs_migration(conn):
+        return False
+    for statement in upgrade_statements():
+        conn.execute(statement)
+    ensure_trails_fts(conn)
+    # The summary may predate its triggers, or have missed updates and
+    # deletes made before the update/delete triggers existed
+    conn.execute(SQL_CLEAR_HOTSPOTS)
+    conn.execute(SQL_REBUILD_HOTSPOTS)
+    # Give the planner statistics for the new indexes
+    conn.execute("ANALYZE")
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return True
+
+
+def ensure_trails_fts(conn: sqlite3.Connection):
+    """
+    Create the trails location FTS index and backfill it if new.
+
+    Skipped below TRAILS_FTS_MIN_SQLITE, before any trigger is created, so
+    an older SQLite never leaves triggers behind that it cannot run.
+    """
+    if sqlite3.sqlite_version_info < TRAILS_FTS_MIN_SQLITE:
+        return
+    if conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'trails_fts'"
+    ).fetchone() is not None:
+        return
+    try:
+        conn.execute("SAVEPOINT trails_fts")
+        for statement in TRAILS_FTS_SCHEMA:
+            conn.execute(statement)
+        conn.execute("INSERT INTO trails_fts(trails_fts) VALUES ('rebuild')")
+        conn.execute("RELEASE trails_fts")
+    except sqlite3.OperationalError:
+        # No FTS5 or no trigram tokenizer: location filters keep using LIKE
+        conn.execute("ROLLBACK TO trails_fts")
+        conn.execute("RELEASE trails_fts")
@@ -17,65 +17,437 @@ Usage:
     python query_conductor.py --hotspots --limit 20
 """
 
+import os
+import queue
 import sqlite3
 import sys
+import time
 import io
 import argparse
-import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from contextlib import contextmanager
 
 from elf_paths import get_base_path
-# Fix Windows console encoding
-if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+from json_compat import dumps_pretty, dumps_pretty_bytes, loads as json_loads
+
+# Idle connections kept open between queries
+_POOL_SIZE = 4
+
+# Upper bound on how long cached statistics are reused, on top of the
+# file-signature check (guards against coarse filesystem mtimes)
+_STATS_TTL = 30.0
+
+# Rows per fetchmany() while building result lists
+_FETCH_CHUNK = 500
+
+
+# =============================================================================
+# SQL
+#
+# Every statement is a fixed module-level string, so sqlite3's per-connection
+# statement cache (kept warm by the connection pool) hits on repeat calls
+# instead of re-preparing. Optional filters are expanded into one variant per
+# combination rather than binding NULLs, which would stop SQLite from using
+# the filter columns' indexes.
+#
+# Newest-first listings page by keyset: a cursor (created_at, id) from the
+# last row of a page, compared as a row value, so the next page is an index
+# range seek rather than an OFFSET scan over everything already shown.
+# =============================================================================
+
+
+def _paged_sql(select: str, conditions: List[str], created_at: str, row_id: str) -> str:
+    """Append filters and newest-first (created_at, id) ordering to select."""
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return select + f"""
+    {where_clause}
+    ORDER BY {created_at} DESC, {row_id} DESC
+    LIMIT ?
+"""
+
+
+_LIST_WORKFLOWS_SELECT = """
+    SELECT
+        id, workflow_name, status, phase,
+        total_nodes, completed_nodes, failed_nodes,
+        started_at, completed_at, created_at
+    FROM workflow_runs
+"""
+
+# Keyed by whether a page cursor was given
+_SQL_LIST_WORKFLOWS = {
+    before: _paged_sql(
+        _LIST_WORKFLOWS_SELECT,
+        ["(created_at, id) < (?, ?)"] if before else [],
+        "created_at", "id")
+    for before in (False, True)
+}
+
+_SQL_RUN = "SELECT * FROM workflow_runs WHERE id = ?"
+
+_SQL_RUN_NAME = "SELECT workflow_name FROM workflow_runs WHERE id = ?"
+
+_SQL_RUN_EXECUTIONS = """
+    SELECT * FROM node_executions
+    WHERE run_id = ?
+    ORDER BY created_at
+"""
+
+_SQL_RUN_DECISIONS = """
+    SELECT * FROM conductor_decisions
+    WHERE run_id = ?
+    ORDER BY created_at
+"""
+
+_SQL_ACTIVE_RUNS = """
+    SELECT * FROM workflow_runs
+    WHERE status = 'running'
+    ORDER BY started_at DESC
+"""
+
+# Queries filtered to one run take workflow_name as their first parameter
+# (looked up once via ConductorQuery._run_name) instead of joining
+# workflow_runs for every row.
+_RUN_NAME_JOIN = {
+    False: ("wr.workflow_name", "LEFT JOIN workflow_runs wr ON {alias}.run_id = wr.id"),
+    True: ("? AS workflow_name", ""),
+}
+
+
+def _failed_nodes_select(for_run: bool) -> str:
+    """SELECT/FROM part of the get_failed_nodes statement."""
+    name, join = _RUN_NAME_JOIN[for_run]
+    return f"""
+    SELECT
+        ne.id, ne.run_id, ne.node_id, ne.node_name,
+        ne.agent_id, ne.status, ne.error_message, ne.error_type,
+        ne.prompt, ne.duration_ms, ne.created_at,
+        {name}
+    FROM node_executions ne
+    {join.format(alias="ne")}
+"""
+
+
+# Keyed by (run_id given, page cursor given)
+_SQL_FAILED_NODES = {
+    (for_run, before): _paged_sql(
+        _failed_nodes_select(for_run),
+        ["ne.status = 'failed'"]
+        + (["ne.run_id = ?"] if for_run else [])
+        + (["(ne.created_at, ne.id) < (?, ?)"] if before else []),
+        "ne.created_at", "ne.id")
+    for for_run in (False, True)
+    for before in (False, True)
+}
+
+_SQL_BLOCKERS = """
+    SELECT
+        t.id, t.run_id, t.location, t.scent,
+        t.agent_id, t.message, t.created_at,
+        wr.workflow_name
+    FROM trails t
+    LEFT JOIN workflow_runs wr ON t.run_id = wr.id
+    WHERE t.scent = 'blocker'
+    ORDER BY t.created_at DESC
+    LIMIT ?
+"""
+
+
+# get_trails location filter: plain LIKE scans trails; the trigram FTS index
+# (created by Conductor when SQLite supports it) answers the same LIKE
+_LOCATION_FILTERS = {
+    None: None,
+    "like": "t.location LIKE ?",
+    "fts": "t.id IN (SELECT rowid FROM trails_fts WHERE location LIKE ?)",
+}
+
+
+def _trails_sql(scent: bool, location: Optional[str], run_id: bool) -> str:
+    """Build the get_trails statement for one combination of filters."""
+    conditions = []
+    if scent:
+        conditions.append("t.scent = ?")
+    if location:
+        conditions.append(_LOCATION_FILTERS[location])
+    if run_id:
+        conditions.append("t.run_id = ?")
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    name, join = _RUN_NAME_JOIN[run_id]
+    return f"""
+    SELECT
+        t.id, t.run_id, t.location, t.location_type,
+        t.scent, t.strength, t.agent_id, t.message,
+        t.tags, t.created_at, t.expires_at,
+        {name}
+    FROM trails t
+    {join.format(alias="t")}
+    {where_clause}
+    ORDER BY t.strength DESC, t.created_at DESC
+    LIMIT ?
+"""
+
+
+# Keyed by (scent given, location filter kind, run_id given)
+_SQL_TRAILS = {
+    (scent, location, run_id): _trails_sql(scent, location, run_id)
+    for scent in (False, True)
+    for location in _LOCATION_FILTERS
+    for run_id in (False, True)
+}
+
+
+def _hotspots_sql(run_filter: str, run_join: str) -> str:
+    """
+    Build the get_hotspots statement, optionally restricted to one run.
+
+    The top locations are picked from a cheap SUM(strength) pass first
+    (covered by idx_trails_loc_strength); the GROUP_CONCATs and other
+    metadata are then only computed for those LIMIT locations.
+    """
+    return f"""
+    WITH top AS (
+        SELECT location, SUM(strength) AS total_strength
+        FROM trails
+        {run_filter}
+        GROUP BY location
+        ORDER BY total_strength DESC
+        LIMIT ?
+    )
+    SELECT
+        t.location,
+        t.location_type,
+        COUNT(*) as trail_count,
+        MAX(t.strength) as max_strength,
+        top.total_strength as total_strength,
+        GROUP_CONCAT(DISTINCT t.scent) as scents,
+        GROUP_CONCAT(DISTINCT t.agent_id) as agents,
+        MAX(t.created_at) as last_activity
+    FROM top
+    JOIN trails t ON t.location = top.location {run_join}
+    GROUP BY t.location
+    ORDER BY top.total_strength DESC
+"""
+
+
+_SQL_HOTSPOTS = _hotspots_sql("", "")
+_SQL_HOTSPOTS_FOR_RUN = _hotspots_sql("WHERE run_id = ?", "AND t.run_id = ?")
+
+_RECENT_EXECUTIONS_SELECT = """
+    SELECT
+        ne.id, ne.run_id, ne.node_id, ne.node_name, ne.node_type,
+        ne.agent_id, ne.status, ne.duration_ms,
+        ne.created_at, ne.completed_at,
+        wr.workflow_name
+    FROM node_executions ne
+    LEFT JOIN workflow_runs wr ON ne.run_id = wr.id
+"""
+
+# Keyed by (status given, page cursor given)
+_SQL_RECENT_EXECUTIONS = {
+    (by_status, before): _paged_sql(
+        _RECENT_EXECUTIONS_SELECT,
+        (["ne.status = ?"] if by_status else [])
+        + (["(ne.created_at, ne.id) < (?, ?)"] if before else []),
+        "ne.created_at", "ne.id")
+    for by_status in (False, True)
+    for before in (False, True)
+}
+
+_SQL_EXECUTION = "SELECT * FROM node_executions WHERE id = ?"
+
+# One statement: each table is scanned once for its GROUP BY, rows are
+# tagged with the bucket they belong to, and totals are summed from the
+# group counts instead of separate COUNT(*)s
+_SQL_STATISTICS = """
+    SELECT 'runs', status, COUNT(*), NULL
+    FROM workflow_runs GROUP BY status
+    UNION ALL
+    SELECT 'executions', status, COUNT(*), NULL
+    FROM node_executions GROUP BY status
+    UNION ALL
+    SELECT 'trails', scent, COUNT(*), NULL
+    FROM trails GROUP BY scent
+    UNION ALL
+    SELECT 'avg', NULL, NULL, AVG(duration_ms)
+    FROM node_executions WHERE duration_ms IS NOT NULL
+"""
+
+
+def _load_obj(value) -> Dict:
+    """Decode a JSON object column; NULL and the '{}' default skip the parser."""
+    if not value or value == "{}":
+        return {}
+    return json_loads(value)
+
+
+def _load_arr(value) -> List:
+    """Decode a JSON array column; NULL and the '[]' default skip the parser."""
+    if not value or value == "[]":
+        return []
+    return json_loads(value)
+
+
+def _truncate(value: Any, limit: int = 100) -> str:
+    """Text form of a column value, cut to limit characters plus '...'."""
+    # TEXT columns are already str: slice them without a str() copy
+    text = value if isinstance(value, str) else str(value)
+    if len(text) > limit:
+        return text[:limit] + "..."
+    return text
+
+
+def page_cursor(row) -> str:
+    """Cursor for the page after row: pass it back as before=/--before."""
+    return f"{row['created_at']}/{row['id']}"
+
+
+def _parse_cursor(cursor: str) -> tuple:
+    """
+    Split a page cursor into (created_at, id) parameters.
+
+    A bare timestamp is accepted too and pages strictly before it (ids are
+    positive, so id 0 excludes every row at that exact timestamp).
+    """
+    created_at, sep, row_id = cursor.rpartition("/")
+    if sep and row_id.isdigit():
+        return created_at, int(row_id)
+    return cursor, 0
+
+
+def _fetch_dicts(cursor: sqlite3.Cursor) -> List[Dict]:
+    """All of a cursor's rows as dicts, fetched _FETCH_CHUNK at a time."""
+    cursor.arraysize = _FETCH_CHUNK
+    rows = []
+    extend = rows.extend
+    while True:
+        chunk = cursor.fetchmany()
+        if not chunk:
+            return rows
+        extend(map(dict, chunk))
+
+
+def _copy_stats(stats: Dict) -> Dict:
+    """Copy a statistics dict so callers cannot mutate the cached one."""
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in stats.items()}
 
 
 class ConductorQuery:
     """Query interface for conductor data."""
 
-    def __init__(self, base_path: Optional[str] = None):
+    def __init__(self, base_path: Optional[str] = None, immutable: bool = False):
+        """
+        Args:
+            base_path: ELF base directory (default: discovered from cwd)
+            immutable: Open the database with immutable=1, skipping all
+                locking and change detection. Only safe while nothing (e.g.
+                a running Conductor) is writing to it; the WAL is ignored,
+                so commits not yet checkpointed are not visible.
+        """
+        self.immutable = immutable
         if base_path is None:
             self.base_path = get_base_path(Path.cwd())
         else:
             self.base_path = Path(base_path)
 
         self.db_path = self.base_path / "memory" / "index.db"
-
-    @contextmanager
-    def _get_connection(self):
-        """Get a database connection."""
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=_POOL_SIZE)
+        # (file signature, monotonic time, stats) from the last get_statistics()
+        self._stats_cache: Optional[tuple] = None
+        # Whether trails_fts is usable; probed on first location filter
+        self._trails_fts: Optional[bool] = None
+        # run_id -> workflow_name; names never change once a run exists
+        self._run_names: Dict[int, str] = {}
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a connection with the read-tuned PRAGMAs applied."""
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database not found: {self.db_path}")
 
-        conn = sqlite3.connect(str(self.db_path), timeout=10.0)
+        # This module only reads: open read-only so any accidental write fails
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        if self.immutable:
+            uri += "&immutable=1"
+        conn = sqlite3.connect(uri, uri=True, timeout=10.0, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA busy_timeout=10000")
+        # Scans and GROUP BYs: keep pages in cache/mmap, sort in memory
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA mmap_size=1073741824")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    @contextmanager
+    def _get_connection(self):
+        """
+        Borrow a database connection.
+
+        Connections are returned to a small pool rather than closed, so
+        later queries skip the connect and PRAGMA setup and find SQLite's
+        page cache still warm.
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection()
         try:
             yield conn
         finally:
-            conn.close()
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def _db_signature(self) -> tuple:
+        """(mtime_ns, size) of the database and its WAL; changes on any commit."""
+        sig = []
+        for path in (str(self.db_path), str(self.db_path) + "-wal"):
+            try:
+                st = os.stat(path)
+            except OSError:
+                sig.append(None)
+            else:
+                sig.append((st.st_mtime_ns, st.st_size))
+        return tuple(sig)
+
+    def _has_trails_fts(self, conn: sqlite3.Connection) -> bool:
+        """Check once whether the trails location FTS index can be queried."""
+        if self._trails_fts is None:
+            try:
+                conn.execute("SELECT rowid FROM trails_fts LIMIT 0")
+            except sqlite3.OperationalError:
+                self._trails_fts = False
+            else:
+                self._trails_fts = True
+        return self._trails_fts
+
+    def _run_name(self, conn: sqlite3.Connection, run_id: int) -> Optional[str]:
+        """workflow_name of a run, cached; None (uncached) if it doesn't exist."""
+        name = self._run_names.get(run_id)
+        if name is None:
+            row = conn.execute(_SQL_RUN_NAME, (run_id,)).fetchone()
+            if row is None:
+                return None
+            name = self._run_names[run_id] = row[0]
+        return name
+
+    def close(self):
+        """Close all pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
 
     # =========================================================================
     # Workflow Queries
     # =========================================================================
 
-    def list_workflows(self, limit: int = 20) -> List[Dict]:
-        """List all workflow runs with summary."""
+    def list_workflows(self, limit: int = 20, before: Optional[str] = None) -> List[Dict]:
+        """List all workflow runs with summary, newest first."""
+        params = [*_parse_cursor(before), limit] if before else [limit]
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT
-                    id, workflow_name, status, phase,
-                    total_nodes, completed_nodes, failed_nodes,
-                    started_at, completed_at, created_at
-                FROM workflow_runs
-                ORDER BY created_at DESC
-                LIMIT ?
-            """, (limit,))
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(conn.execute(_SQL_LIST_WORKFLOWS[bool(before)], params))
 
     def get_workflow_run(self, run_id: int) -> Optional[Dict]:
         """Get detailed workflow run with all executions."""
@@ -83,41 +455,33 @@ class ConductorQuery:
             cursor = conn.cursor()
 
             # Get run info
-            cursor.execute("SELECT * FROM workflow_runs WHERE id = ?", (run_id,))
+            cursor.execute(_SQL_RUN, (run_id,))
             row = cursor.fetchone()
             if not row:
                 return None
 
             run = dict(row)
-            run["input"] = json.loads(run.get("input_json", "{}"))
-            run["output"] = json.loads(run.get("output_json", "{}"))
-            run["context"] = json.loads(run.get("context_json", "{}"))
+            run["input"] = _load_obj(run.get("input_json"))
+            run["output"] = _load_obj(run.get("output_json"))
+            run["context"] = _load_obj(run.get("context_json"))
 
             # Get node executions
-            cursor.execute("""
-                SELECT * FROM node_executions
-                WHERE run_id = ?
-                ORDER BY created_at
-            """, (run_id,))
+            cursor.execute(_SQL_RUN_EXECUTIONS, (run_id,))
             executions = []
-            for exec_row in cursor.fetchall():
-                exec_dict = dict(exec_row)
-                exec_dict["findings"] = json.loads(exec_dict.get("findings_json", "[]"))
-                exec_dict["files_modified"] = json.loads(exec_dict.get("files_modified", "[]"))
-                executions.append(exec_dict)
+            append = executions.append
+            for exec_dict in map(dict, cursor):
+                exec_dict["findings"] = _load_arr(exec_dict["findings_json"])
+                exec_dict["files_modified"] = _load_arr(exec_dict["files_modified"])
+                append(exec_dict)
             run["executions"] = executions
 
             # Get decisions
-            cursor.execute("""
-                SELECT * FROM conductor_decisions
-                WHERE run_id = ?
-                ORDER BY created_at
-            """, (run_id,))
+            cursor.execute(_SQL_RUN_DECISIONS, (run_id,))
             decisions = []
-            for dec_row in cursor.fetchall():
-                dec_dict = dict(dec_row)
-                dec_dict["data"] = json.loads(dec_dict.get("decision_data", "{}"))
-                decisions.append(dec_dict)
+            append = decisions.append
+            for dec_dict in map(dict, cursor):
+                dec_dict["data"] = _load_obj(dec_dict["decision_data"])
+                append(dec_dict)
             run["decisions"] = decisions
 
             return run
@@ -125,68 +489,30 @@ class ConductorQuery:
     def get_active_runs(self) -> List[Dict]:
         """Get currently running workflows."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM workflow_runs
-                WHERE status = 'running'
-                ORDER BY started_at DESC
-            """)
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(conn.execute(_SQL_ACTIVE_RUNS))
 
     # =========================================================================
     # Failure Queries
     # =========================================================================
 
-    def get_failed_nodes(self, limit: int = 20, run_id: int = None) -> List[Dict]:
-        """Get failed node executions with prompts."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+    def get_failed_nodes(self, limit: int = 20, run_id: int = None,
+                         before: Optional[str] = None) -> List[Dict]:
+        """Get failed node executions with prompts, newest first."""
+        params = [run_id] if run_id else []
+        if before:
+            params.extend(_parse_cursor(before))
+        params.append(limit)
 
+        sql = _SQL_FAILED_NODES[bool(run_id), bool(before)]
+        with self._get_connection() as conn:
             if run_id:
-                cursor.execute("""
-                    SELECT
-                        ne.id, ne.run_id, ne.node_id, ne.node_name,
-                        ne.agent_id, ne.status, ne.error_message, ne.error_type,
-                        ne.prompt, ne.duration_ms, ne.created_at,
-                        wr.workflow_name
-                    FROM node_executions ne
-                    LEFT JOIN workflow_runs wr ON ne.run_id = wr.id
-                    WHERE ne.status = 'failed' AND ne.run_id = ?
-                    ORDER BY ne.created_at DESC
-                    LIMIT ?
-                """, (run_id, limit))
-            else:
-                cursor.execute("""
-                    SELECT
-                        ne.id, ne.run_id, ne.node_id, ne.node_name,
-                        ne.agent_id, ne.status, ne.error_message, ne.error_type,
-                        ne.prompt, ne.duration_ms, ne.created_at,
-                        wr.workflow_name
-                    FROM node_executions ne
-                    LEFT JOIN workflow_runs wr ON ne.run_id = wr.id
-                    WHERE ne.status = 'failed'
-                    ORDER BY ne.created_at DESC
-                    LIMIT ?
-                """, (limit,))
-
-            return [dict(row) for row in cursor.fetchall()]
+                params.insert(0, self._run_name(conn, run_id))
+            return _fetch_dicts(conn.execute(sql, params))
 
     def get_blockers(self, limit: int = 20) -> List[Dict]:
         """Get blocker trails and findings."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT
-                    t.id, t.run_id, t.location, t.scent,
-                    t.agent_id, t.message, t.created_at,
-                    wr.workflow_name
-                FROM trails t
-                LEFT JOIN workflow_runs wr ON t.run_id = wr.id
-                WHERE t.scent = 'blocker'
-                ORDER BY t.created_at DESC
-                LIMIT ?
-            """, (limit,))
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(conn.execute(_SQL_BLOCKERS, (limit,)))
 
     # =========================================================================
     # Trail Queries
@@ -195,116 +521,60 @@ class ConductorQuery:
     def get_trails(self, scent: str = None, location: str = None,
                    run_id: int = None, limit: int = 50) -> List[Dict]:
         """Get trails with optional filtering."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            conditions = []
-            params = []
-
-            if scent:
-                conditions.append("t.scent = ?")
-                params.append(scent)
-
-            if location:
-                conditions.append("t.location LIKE ?")
-                params.append(f"%{location}%")
+        params = []
+        if scent:
+            params.append(scent)
+        if location:
+            params.append(f"%{location}%")
+        if run_id:
+            params.append(run_id)
+        params.append(limit)
 
+        with self._get_connection() as conn:
+            if not location:
+                location_filter = None
+            elif self._has_trails_fts(conn):
+                location_filter = "fts"
+            else:
+                location_filter = "like"
+            sql = _SQL_TRAILS[bool(scent), location_filter, bool(run_id)]
             if run_id:
-                conditions.append("t.run_id = ?")
-                params.append(run_id)
-
-            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-            params.append(limit)
-
-            cursor.execute(f"""
-                SELECT
-                    t.id, t.run_id, t.location, t.location_type,
-                    t.scent, t.strength, t.agent_id, t.message,
-                    t.tags, t.created_at, t.expires_at,
-                    wr.workflow_name
-                FROM trails t
-                LEFT JOIN workflow_runs wr ON t.run_id = wr.id
-                {where_clause}
-                ORDER BY t.strength DESC, t.created_at DESC
-                LIMIT ?
-            """, params)
-
-            return [dict(row) for row in cursor.fetchall()]
+                params.insert(0, self._run_name(conn, run_id))
+            return _fetch_dicts(conn.execute(sql, params))
 
     def get_hotspots(self, run_id: int = None, limit: int = 20) -> List[Dict]:
         """Get locations with most trail activity."""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            run_filter = "WHERE run_id = ?" if run_id else ""
-            params = [run_id] if run_id else []
-
-            cursor.execute(f"""
-                SELECT
-                    location,
-                    location_type,
-                    COUNT(*) as trail_count,
-                    MAX(strength) as max_strength,
-                    SUM(strength) as total_strength,
-                    GROUP_CONCAT(DISTINCT scent) as scents,
-                    GROUP_CONCAT(DISTINCT agent_id) as agents,
-                    MAX(created_at) as last_activity
-                FROM trails
-                {run_filter}
-                GROUP BY location
-                ORDER BY total_strength DESC
-                LIMIT ?
-            """, params + [limit])
-
-            return [dict(row) for row in cursor.fetchall()]
+            if run_id:
+                return _fetch_dicts(conn.execute(_SQL_HOTSPOTS_FOR_RUN, (run_id, limit, run_id)))
+            return _fetch_dicts(conn.execute(_SQL_HOTSPOTS, (limit,)))
 
     # =========================================================================
     # Execution Queries
     # =========================================================================
 
-    def get_recent_executions(self, limit: int = 20, status: str = None) -> List[Dict]:
-        """Get recent node executions."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+    def get_recent_executions(self, limit: int = 20, status: str = None,
+                              before: Optional[str] = None) -> List[Dict]:
+        """Get recent node executions, newest first."""
+        params = [status] if status else []
+        if before:
+            params.extend(_parse_cursor(before))
+        params.append(limit)
 
-            if status:
-                cursor.execute("""
-                    SELECT
-                        ne.id, ne.run_id, ne.node_id, ne.node_name, ne.node_type,
-                        ne.agent_id, ne.status, ne.duration_ms,
-                        ne.created_at, ne.completed_at,
-                        wr.workflow_name
-                    FROM node_executions ne
-                    LEFT JOIN workflow_runs wr ON ne.run_id = wr.id
-                    WHERE ne.status = ?
-                    ORDER BY ne.created_at DESC
-                    LIMIT ?
-                """, (status, limit))
-            else:
-                cursor.execute("""
-                    SELECT
-                        ne.id, ne.run_id, ne.node_id, ne.node_name, ne.node_type,
-                        ne.agent_id, ne.status, ne.duration_ms,
-                        ne.created_at, ne.completed_at,
-                        wr.workflow_name
-                    FROM node_executions ne
-                    LEFT JOIN workflow_runs wr ON ne.run_id = wr.id
-                    ORDER BY ne.created_at DESC
-                    LIMIT ?
-                """, (limit,))
-
-            return [dict(row) for row in cursor.fetchall()]
+        sql = _SQL_RECENT_EXECUTIONS[bool(status), bool(before)]
+        with self._get_connection() as conn:
+            return _fetch_dicts(conn.execute(sql, params))
 
     def get_execution_details(self, exec_id: int) -> Optional[Dict]:
         """Get full details of a node execution including prompt and result."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM node_executions WHERE id = ?", (exec_id,))
+            cursor.execute(_SQL_EXECUTION, (exec_id,))
             row = cursor.fetchone()
             if row:
                 result = dict(row)
-                result["findings"] = json.loads(result.get("findings_json", "[]"))
-                result["files_modified"] = json.loads(result.get("files_modified", "[]"))
+                result["findings"] = _load_arr(result.get("findings_json"))
+                result["files_modified"] = _load_arr(result.get("files_modified"))
                 return result
             return None
 
@@ -313,81 +583,75 @@ class ConductorQuery:
     # =========================================================================
 
     def get_statistics(self) -> Dict:
-        """Get conductor statistics."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
+        """
+        Get conductor statistics.
 
-            stats = {}
-
-            # Workflow run counts by status
-            cursor.execute("""
-                SELECT status, COUNT(*) as count
-                FROM workflow_runs
-                GROUP BY status
-            """)
-            stats["runs_by_status"] = dict(cursor.fetchall())
-
-            # Node execution counts by status
-            cursor.execute("""
-                SELECT status, COUNT(*) as count
-                FROM node_executions
-                GROUP BY status
-            """)
-            stats["executions_by_status"] = dict(cursor.fetchall())
-
-            # Trail counts by scent
-            cursor.execute("""
-                SELECT scent, COUNT(*) as count
-                FROM trails
-                GROUP BY scent
-            """)
-            stats["trails_by_scent"] = dict(cursor.fetchall())
-
-            # Total counts
-            cursor.execute("SELECT COUNT(*) FROM workflow_runs")
-            stats["total_runs"] = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM node_executions")
-            stats["total_executions"] = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM trails")
-            stats["total_trails"] = cursor.fetchone()[0]
-
-            # Average execution duration
-            cursor.execute("""
-                SELECT AVG(duration_ms) FROM node_executions
-                WHERE duration_ms IS NOT NULL
-            """)
-            avg = cursor.fetchone()[0]
-            stats["avg_execution_ms"] = round(avg, 2) if avg else 0
-
-            return stats
+        The aggregates scan whole tables, so the result is cached until the
+        database or its WAL changes on disk (or _STATS_TTL elapses).
+        """
+        signature = self._db_signature()
+        cached = self._stats_cache
+        if (cached is not None and cached[0] == signature
+                and time.monotonic() - cached[1] < _STATS_TTL):
+            return _copy_stats(cached[2])
+
+        stats = self._compute_statistics()
+        self._stats_cache = (signature, time.monotonic(), stats)
+        return _copy_stats(stats)
+
+    def _compute_statistics(self) -> Dict:
+        """Run the statistics aggregates against the database."""
+        with self._get_connection() as conn:
+            cursor = conn.execute(_SQL_STATISTICS)
+
+            buckets = {"runs": {}, "executions": {}, "trails": {}}
+            avg = None
+            for tag, key, count, value in cursor:
+                if tag == "avg":
+                    avg = value
+                else:
+                    buckets[tag][key] = count
+
+            return {
+                "runs_by_status": buckets["runs"],
+                "executions_by_status": buckets["executions"],
+                "trails_by_scent": buckets["trails"],
+                "total_runs": sum(buckets["runs"].values()),
+                "total_executions": sum(buckets["executions"].values()),
+                "total_trails": sum(buckets["trails"].values()),
+                "avg_execution_ms": round(avg, 2) if avg else 0,
+            }
 
 
 def format_output(data: Any, format_type: str = 'text') -> str:
     """Format query results for display."""
     if format_type == 'json':
-        return json.dumps(data, indent=2, default=str)
+        return dumps_pretty(data)
 
     # Text formatting
     if isinstance(data, list):
-        if not data:
-            return "No results found."
-
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
+        # "\n  key: " per column, built once rather than once per row
+        prefixes = {}
         for i, item in enumerate(data, 1):
-            lines.append(f"\n--- {i} ---")
+            if i > 1:
+                write("\n")
+            write(f"\n--- {i} ---")
             if isinstance(item, dict):
                 for key, value in item.items():
                     if value is not None and value != "" and value != []:
-                        # Truncate long values
-                        val_str = str(value)
-                        if len(val_str) > 100:
-                            val_str = val_str[:100] + "..."
-                        lines.append(f"  {key}: {val_str}")
+                        val_str = _truncate(value)
+                        prefix = prefixes.get(key)
+                        if prefix is None:
+                            prefix = prefixes[key] = f"\n  {key}: "
+                        write(prefix)
+                        write(val_str)
             else:
-                lines.append(f"  {item}")
-        return "\n".join(lines)
+                write(f"\n  {item}")
+        if not buf.tell():
+            return "No results found."
+        return buf.getvalue()
 
     elif isinstance(data, dict):
         lines = []
@@ -403,7 +667,70 @@ def format_output(data: Any, format_type: str = 'text') -> str:
         return str(data)
 
 
-def main():
+def _fix_console_encoding() -> None:
+    """
+    Re-wrap stdout/stderr as UTF-8 on Windows consoles that are not already.
+
+    Only needed for text output; done from main() rather than at import so
+    library users and JSON output keep the original streams.
+    """
+    if sys.platform != 'win32':
+        return
+    for name in ('stdout', 'stderr'):
+        stream = getattr(sys, name)
+        encoding = (getattr(stream, 'encoding', None) or '').lower()
+        if encoding not in ('utf-8', 'utf8') and hasattr(stream, 'buffer'):
+            setattr(sys, name, io.TextIOWrapper(stream.buffer, encoding='utf-8', errors='replace'))
+
+
+def write_json(data: Any) -> None:
+    """
+    Write query results to stdout as indented JSON.
+
+    Encoded bytes go straight to the binary stream, skipping the str round
+    trip and any text-mode re-encode.
+    """
+    out = dumps_pretty_bytes(data) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(out.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(out)
+    buffer.flush()
+
+
+# Bare single-flag invocations answered without building the full parser
+_FAST_COMMANDS = {
+    "--workflows": "workflows",
+    "--stats": "stats",
+    "--active": "active",
+    "--blockers": "blockers",
+}
+
+
+def _fast_args(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parsed arguments for a bare hot command, e.g. ``--stats``; None otherwise.
+
+    Scripts and watchers call these in loops, so skip constructing the
+    ArgumentParser. Defaults must match _build_parser().
+    """
+    if len(argv) != 1 or argv[0] not in _FAST_COMMANDS:
+        return None
+    args = argparse.Namespace(
+        workflows=False, workflow=None, active=False, failures=False,
+        blockers=False, trails=False, hotspots=False, executions=False,
+        execution=None, stats=False,
+        run_id=None, scent=None, location=None, status=None, limit=20,
+        before=None, immutable=False, format="text",
+    )
+    setattr(args, _FAST_COMMANDS[argv[0]], True)
+    return args
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
     parser = argparse.ArgumentParser(
         description="Query Conductor - Workflow execution queries",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -450,18 +777,34 @@ Examples:
     parser.add_argument("--location", type=str, help="Filter trails by location")
     parser.add_argument("--status", type=str, help="Filter by status")
     parser.add_argument("--limit", type=int, default=20, help="Limit results (default: 20)")
+    parser.add_argument("--before", type=str, metavar="CURSOR",
+                        help="Next page of --workflows/--failures/--executions "
+                             "(cursor printed after a full page, or a timestamp)")
+
+    parser.add_argument("--immutable", action="store_true",
+                        help="Open the database as immutable (faster; only while no workflow is running)")
 
     # Output options
     parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format")
+    return parser
 
-    args = parser.parse_args()
 
+def main():
+    parser = None
+    args = _fast_args(sys.argv[1:])
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
+    if args.format != "json":
+        _fix_console_encoding()
+
+    query = None
     try:
-        query = ConductorQuery()
+        query = ConductorQuery(immutable=args.immutable)
         result = None
 
         if args.workflows:
-            result = query.list_workflows(args.limit)
+            result = query.list_workflows(args.limit, args.before)
 
         elif args.workflow:
             result = query.get_workflow_run(args.workflow)
@@ -473,7 +816,7 @@ Examples:
             result = query.get_active_runs()
 
         elif args.failures:
-            result = query.get_failed_nodes(args.limit, args.run_id)
+            result = query.get_failed_nodes(args.limit, args.run_id, args.before)
 
         elif args.blockers:
             result = query.get_blockers(args.limit)
@@ -485,7 +828,7 @@ Examples:
             result = query.get_hotspots(args.run_id, args.limit)
 
         elif args.executions:
-            result = query.get_recent_executions(args.limit, args.status)
+            result = query.get_recent_executions(args.limit, args.status, args.before)
 
         elif args.execution:
             result = query.get_execution_details(args.execution)
@@ -497,11 +840,18 @@ Examples:
             result = query.get_statistics()
 
         else:
-            parser.print_help()
+            (parser or _build_parser()).print_help()
             return 0
 
         if result is not None:
-            print(format_output(result, args.format))
+            if args.format == "json":
+                write_json(result)
+            else:
+                print(format_output(result, args.format))
+
+        # Keyset-paged listings: a full page gets a cursor for the next one
+        if (args.workflows or args.failures or args.executions) and len(result) >= args.limit:
+            print(f"Next page: --before '{page_cursor(result[-1])}'", file=sys.stderr)
 
     except FileNotFoundError as e:
         print(f"Error: {e}")
@@ -509,6 +859,9 @@ Examples:
     except Exception as e:
         print(f"Error: {e}")
         return 1
+    finally:
+        if query is not None:
+            query.close()
 
     return 0
 
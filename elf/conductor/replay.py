@@ -11,92 +11,364 @@ This module provides replay functionality for conductor workflows:
 USAGE:
     python replay.py --run-id 123 --from-node "analyze"
     python replay.py --run-id 123 --retry-failed
+    python replay.py --run-id 123,124,125 --retry-failed
     python replay.py --run-id 123 --dry-run
 """
 
 import json
+import os
+import queue
 import sqlite3
+import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, List, Optional
 from contextlib import contextmanager
 import argparse
+import asyncio
 
 from elf_paths import get_base_path
+from json_compat import dumps as json_dumps, dumps_pretty, loads as json_loads
+from migrations import migrate, needs_migration
+
+# Number of idle read-only connections kept per ReplayManager
+_READER_POOL_SIZE = 4
+
+# Prepared statements kept per connection (sqlite3's default is 128)
+_STATEMENT_CACHE = 200
+
+# Rows per fetchmany() when streaming a run's executions
+_FETCH_CHUNK = 1000
+
+# Statements used by ReplayManager, kept as module constants so every call
+# submits identical text and hits the connection's statement cache.
+_SQL_RUN = "SELECT * FROM workflow_runs WHERE id = ?"
+
+_SQL_RUN_SOURCE = "SELECT workflow_id, workflow_name, input_json FROM workflow_runs WHERE id = ?"
+
+_SQL_RUN_INPUT = "SELECT input_json FROM workflow_runs WHERE id = ?"
+
+_SQL_RUN_EXECUTIONS = """
+    SELECT * FROM node_executions
+    WHERE run_id = ?
+    ORDER BY created_at
+"""
+
+_SQL_PLAN_EXECUTIONS = """
+    SELECT id, node_id, node_name, status, duration_ms, created_at
+    FROM node_executions
+    WHERE run_id = ?
+    ORDER BY created_at, id
+"""
+
+_SQL_FAILED_NODES = """
+    SELECT * FROM node_executions
+    WHERE run_id = ? AND status = 'failed'
+    ORDER BY created_at
+"""
+
+_SQL_FAILED_NODE_PREVIEWS = """
+    SELECT id, node_id, node_name, node_type, status, error_message,
+           substr(prompt, 1, 200) AS prompt, created_at
+    FROM node_executions
+    WHERE run_id = ? AND status = 'failed'
+    ORDER BY created_at
+"""
+
+_SQL_NODE = """
+    SELECT * FROM node_executions
+    WHERE run_id = ? AND node_id = ?
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
+
+_SQL_NODE_FIRST_EXECUTION = """
+    SELECT created_at, id FROM node_executions
+    WHERE run_id = ? AND node_id = ?
+    ORDER BY created_at, id
+    LIMIT 1
+"""
+
+_SQL_COMPLETED_RESULTS = """
+    SELECT result_json FROM node_executions
+    WHERE run_id = ? AND status = 'completed'
+    ORDER BY created_at, id
+"""
+
+_SQL_COMPLETED_RESULTS_BEFORE = """
+    SELECT result_json FROM node_executions
+    WHERE run_id = ? AND status = 'completed'
+      AND (created_at, id) < (?, ?)
+    ORDER BY created_at, id
+"""
+
+# Parameters: workflow_id, workflow_name, phase, input_json
+_SQL_INSERT_RUN = """
+    INSERT INTO workflow_runs
+    (workflow_id, workflow_name, status, phase, input_json, started_at)
+    VALUES (?, ?, 'pending', ?, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
+    RETURNING id
+"""
+
+# Copies the given executions (ids as a JSON array) into a new run as pending
+_SQL_INSERT_RETRY_NODES = """
+    INSERT INTO node_executions
+    (run_id, node_id, node_name, node_type, prompt, status)
+    SELECT ?, node_id, node_name, node_type, prompt, 'pending'
+    FROM node_executions
+    WHERE id IN (SELECT value FROM json_each(?))
+    ORDER BY created_at, id
+"""
+
+_SQL_RESET_NODE = """
+    UPDATE node_executions
+    SET status = 'pending',
+        result_json = '{}',
+        result_text = NULL,
+        error_message = NULL,
+        completed_at = NULL,
+        retry_count = retry_count + 1
+    WHERE run_id = ? AND node_id = ?
+"""
+
+_SQL_INSERT_REPLAY_DECISION = """
+    INSERT INTO conductor_decisions
+    (run_id, decision_type, decision_data, reason)
+    VALUES (?, 'replay', json_object(
+        'original_run_id', ?,
+        'from_node', ?,
+        'include_context', json(CASE WHEN ? THEN 'true' ELSE 'false' END)
+    ), ?)
+"""
+
+_SQL_INSERT_CLONE_DECISION = """
+    INSERT INTO conductor_decisions
+    (run_id, decision_type, decision_data, reason)
+    VALUES (?, 'clone', json_object('original_run_id', ?, 'modifications', json(?)), ?)
+"""
+
+_SQL_INSERT_RESET_DECISION = """
+    INSERT INTO conductor_decisions
+    (run_id, decision_type, decision_data, reason)
+    VALUES (?, 'reset_node', json_object('node_id', ?), ?)
+"""
+
+
+def _iter_chunks(cursor: sqlite3.Cursor):
+    """Yield a cursor's rows, fetched cursor.arraysize at a time."""
+    while True:
+        rows = cursor.fetchmany()
+        if not rows:
+            return
+        yield from rows
+
+
+@lru_cache(maxsize=8)
+def _resolved_base(cwd: str, env_base: Optional[str]) -> Path:
+    """
+    get_base_path() for a working directory, memoized.
+
+    Embedded callers construct ReplayManager repeatedly; this avoids
+    re-walking parent directories for repo markers each time. env_base
+    (ELF_BASE_PATH) is part of the key so changing it is still honoured.
+    """
+    return get_base_path(Path(cwd))
+
 
 class ReplayManager:
     """Manage workflow replay and retry operations."""
 
+    # Databases already switched to WAL by this process. journal_mode=WAL is
+    # persistent, so it only has to be issued once per file.
+    _wal_initialized = set()
+
     def __init__(self, base_path: Optional[str] = None):
         if base_path is None:
-            self.base_path = get_base_path(Path.cwd())
+            self.base_path = _resolved_base(os.getcwd(), os.environ.get("ELF_BASE_PATH"))
         else:
             self.base_path = Path(base_path)
 
         self.db_path = self.base_path / "memory" / "index.db"
 
-    @contextmanager
-    def _get_connection(self):
-        """Get database connection."""
-        conn = sqlite3.connect(str(self.db_path), timeout=10.0)
+        # One shared writer (serialized by the lock) plus a pool of readers,
+        # kept open across calls instead of reconnecting every time
+        self._write_lock = threading.Lock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=_READER_POOL_SIZE)
+
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        """
+        Upgrade the database to schema.sql once (see migrations.py), for
+        databases never opened by a Conductor; this adds the per-run
+        lookup indexes used below.
+        """
+        if not self.db_path.exists():
+            return
+        try:
+            with self._get_connection() as conn:
+                if not needs_migration(conn):
+                    return
+            with self._get_write_connection() as conn:
+                migrate(conn)
+        except sqlite3.Error as e:
+            print(f"Warning: Could not prepare conductor schema: {e}", file=sys.stderr)
+
+    def _open_writer(self) -> sqlite3.Connection:
+        """Open the read-write connection."""
+        conn = sqlite3.connect(str(self.db_path), timeout=10.0, isolation_level=None,
+                               check_same_thread=False, cached_statements=_STATEMENT_CACHE)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout=10000")
+        # Decision records are built with JSON1's json_object(); fail here
+        # with a clear message rather than on the first replay
+        try:
+            conn.execute("SELECT json_object()")
+        except sqlite3.OperationalError:
+            conn.close()
+            raise sqlite3.NotSupportedError(
+                f"SQLite {sqlite3.sqlite_version} was built without JSON1 functions")
+        db_key = str(self.db_path)
+        if db_key not in ReplayManager._wal_initialized:
+            # WAL lets readers proceed while a replay/retry is writing
+            conn.execute("PRAGMA journal_mode=WAL")
+            ReplayManager._wal_initialized.add(db_key)
+        # Fewer fsyncs, in-memory temp, bigger cache
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection for the reader pool."""
+        conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True,
+                               timeout=10.0, isolation_level=None, check_same_thread=False,
+                               cached_statements=_STATEMENT_CACHE)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA busy_timeout=10000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    @contextmanager
+    def _get_connection(self):
+        """Borrow a read-only database connection from the pool."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
         try:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
         finally:
-            conn.close()
+            try:
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
 
-    def get_run_info(self, run_id: int) -> Optional[Dict]:
-        """Get full information about a workflow run."""
+    @contextmanager
+    def _get_write_connection(self):
+        """
+        Run a write transaction on the shared writer connection.
+
+        BEGIN IMMEDIATE takes the write lock up front, so two writers never
+        both hold a read lock and then deadlock upgrading it; the second
+        simply waits on busy_timeout. Committed on success, rolled back on
+        error.
+        """
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._open_writer()
+            conn = self._writer
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        """Close the writer and all pooled reader connections."""
+        with self._write_lock:
+            if self._writer is not None:
+                # Refresh planner stats the replay/retry writes may have made
+                # stale; a no-op when they are still current. Readers are
+                # read-only and cannot store stats, so only the writer does it.
+                try:
+                    self._writer.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
+                self._writer.close()
+                self._writer = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def get_run_info(self, run_id: int, load_executions: bool = True,
+                     load_json: bool = True) -> Optional[Dict]:
+        """
+        Get full information about a workflow run.
+
+        Args:
+            run_id: Workflow run ID
+            load_executions: Include the run's node executions
+            load_json: Decode input/output/context from their *_json
+                columns (the raw columns are always present)
+        """
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
             # Get run
-            cursor.execute("SELECT * FROM workflow_runs WHERE id = ?", (run_id,))
+            cursor.execute(_SQL_RUN, (run_id,))
             row = cursor.fetchone()
             if not row:
                 return None
 
             run = dict(row)
-            run["input"] = json.loads(run.get("input_json", "{}"))
-            run["output"] = json.loads(run.get("output_json", "{}"))
-            run["context"] = json.loads(run.get("context_json", "{}"))
+            if load_json:
+                run["input"] = json_loads(run.get("input_json", "{}"))
+                run["output"] = json_loads(run.get("output_json", "{}"))
+                run["context"] = json_loads(run.get("context_json", "{}"))
 
             # Get executions
-            cursor.execute("""
-                SELECT * FROM node_executions
-                WHERE run_id = ?
-                ORDER BY created_at
-            """, (run_id,))
-            run["executions"] = [dict(r) for r in cursor.fetchall()]
+            if load_executions:
+                cursor.execute(_SQL_RUN_EXECUTIONS, (run_id,))
+                run["executions"] = [dict(r) for r in cursor.fetchall()]
 
             return run
 
-    def get_failed_nodes(self, run_id: int) -> List[Dict]:
-        """Get all failed nodes from a run."""
+    def get_failed_nodes(self, run_id: int, preview_only: bool = False) -> List[Dict]:
+        """
+        Get all failed nodes from a run.
+
+        Args:
+            run_id: Workflow run ID
+            preview_only: Return only the identifying columns, with prompt
+                cut to its first 200 characters inside SQLite
+        """
+        sql = _SQL_FAILED_NODE_PREVIEWS if preview_only else _SQL_FAILED_NODES
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM node_executions
-                WHERE run_id = ? AND status = 'failed'
-                ORDER BY created_at
-            """, (run_id,))
+            cursor.execute(sql, (run_id,))
             return [dict(r) for r in cursor.fetchall()]
 
     def get_node_by_id(self, run_id: int, node_id: str) -> Optional[Dict]:
         """Get a specific node execution."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM node_executions
-                WHERE run_id = ? AND node_id = ?
-                ORDER BY created_at DESC
-                LIMIT 1
-            """, (run_id, node_id))
+            cursor.execute(_SQL_NODE, (run_id, node_id))
             row = cursor.fetchone()
             return dict(row) if row else None
 
@@ -113,52 +385,38 @@ class ReplayManager:
         Returns:
             New run ID
         """
-        original = self.get_run_info(original_run_id)
-        if not original:
-            raise ValueError(f"Run {original_run_id} not found")
-
-        with self._get_connection() as conn:
+        with self._get_write_connection() as conn:
             cursor = conn.cursor()
 
-            # Build context up to from_node if requested
-            replay_context = original.get("input", {}).copy()
+            original = cursor.execute(_SQL_RUN_SOURCE, (original_run_id,)).fetchone()
+            if not original:
+                raise ValueError(f"Run {original_run_id} not found")
+
+            # Build context up to from_node if requested: completed results
+            # ahead of from_node's first execution (all of them if it never ran)
+            replay_context = json_loads(original["input_json"] or "{}")
             if include_context and from_node:
-                for exec_record in original["executions"]:
-                    if exec_record["node_id"] == from_node:
-                        break
-                    if exec_record["status"] == "completed":
-                        try:
-                            result = json.loads(exec_record.get("result_json", "{}"))
-                            replay_context.update(result)
-                        except json.JSONDecodeError:
-                            pass
+                pivot = cursor.execute(_SQL_NODE_FIRST_EXECUTION,
+                                       (original_run_id, from_node)).fetchone()
+                self._merge_completed_results(conn, original_run_id, replay_context,
+                                              before=tuple(pivot) if pivot else None)
 
             # Create new run
-            cursor.execute("""
-                INSERT INTO workflow_runs
-                (workflow_id, workflow_name, status, phase, input_json, started_at)
-                VALUES (?, ?, 'pending', 'replay', ?, ?)
-            """, (
-                original.get("workflow_id"),
-                f"replay-{original.get('workflow_name', 'unknown')}-from-{from_node or 'start'}",
-                json.dumps(replay_context),
-                datetime.now().isoformat()
+            cursor.execute(_SQL_INSERT_RUN, (
+                original["workflow_id"],
+                f"replay-{original['workflow_name']}-from-{from_node or 'start'}",
+                "replay",
+                json_dumps(replay_context)
             ))
 
-            new_run_id = cursor.lastrowid
+            new_run_id = cursor.fetchone()[0]
 
             # Log the replay decision
-            cursor.execute("""
-                INSERT INTO conductor_decisions
-                (run_id, decision_type, decision_data, reason)
-                VALUES (?, 'replay', ?, ?)
-            """, (
+            cursor.execute(_SQL_INSERT_REPLAY_DECISION, (
                 new_run_id,
-                json.dumps({
-                    "original_run_id": original_run_id,
-                    "from_node": from_node,
-                    "include_context": include_context
-                }),
+                original_run_id,
+                from_node,
+                include_context,
                 f"Replay of run {original_run_id} from {from_node or 'start'}"
             ))
 
@@ -175,7 +433,9 @@ class ReplayManager:
         Returns:
             Dict with retry information
         """
-        failed = self.get_failed_nodes(run_id)
+        # Full prompts are never needed here: the summary shows a preview
+        # and the retry rows copy them over inside SQLite
+        failed = self.get_failed_nodes(run_id, preview_only=True)
 
         if not failed:
             return {"message": "No failed nodes to retry", "nodes": []}
@@ -191,7 +451,7 @@ class ReplayManager:
                 "node_id": node["node_id"],
                 "node_name": node["node_name"],
                 "error_message": node.get("error_message"),
-                "original_prompt": node.get("prompt", "")[:200] + "..."
+                "original_prompt": (node["prompt"] or "") + "..."
             }
             result["nodes"].append(node_info)
 
@@ -204,20 +464,9 @@ class ReplayManager:
         result["new_run_id"] = new_run_id
 
         # Mark which nodes to retry
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            for node in failed:
-                cursor.execute("""
-                    INSERT INTO node_executions
-                    (run_id, node_id, node_name, node_type, prompt, status)
-                    VALUES (?, ?, ?, ?, ?, 'pending')
-                """, (
-                    new_run_id,
-                    node["node_id"],
-                    node["node_name"],
-                    node.get("node_type", "single"),
-                    node.get("prompt", "")
-                ))
+        ids = json_dumps([node["id"] for node in failed])
+        with self._get_write_connection() as conn:
+            conn.execute(_SQL_INSERT_RETRY_NODES, (new_run_id, ids))
 
         return result
 
@@ -235,13 +484,13 @@ class ReplayManager:
         Returns:
             New run ID
         """
-        original = self.get_run_info(run_id)
+        original = self.get_run_info(run_id, load_executions=False)
         if not original:
             raise ValueError(f"Run {run_id} not found")
 
         modifications = modifications or {}
 
-        with self._get_connection() as conn:
+        with self._get_write_connection() as conn:
             cursor = conn.cursor()
 
             # Merge modifications
@@ -249,81 +498,94 @@ class ReplayManager:
             new_input.update(modifications.get("input", {}))
 
             # Create cloned run
-            cursor.execute("""
-                INSERT INTO workflow_runs
-                (workflow_id, workflow_name, status, phase, input_json, started_at)
-                VALUES (?, ?, 'pending', 'init', ?, ?)
-            """, (
+            cursor.execute(_SQL_INSERT_RUN, (
                 original.get("workflow_id"),
                 f"clone-{original.get('workflow_name', 'unknown')}",
-                json.dumps(new_input),
-                datetime.now().isoformat()
+                "init",
+                json_dumps(new_input)
             ))
 
-            new_run_id = cursor.lastrowid
+            new_run_id = cursor.fetchone()[0]
 
             # Log the clone
-            cursor.execute("""
-                INSERT INTO conductor_decisions
-                (run_id, decision_type, decision_data, reason)
-                VALUES (?, 'clone', ?, ?)
-            """, (
+            cursor.execute(_SQL_INSERT_CLONE_DECISION, (
                 new_run_id,
-                json.dumps({
-                    "original_run_id": run_id,
-                    "modifications": modifications
-                }),
+                run_id,
+                json_dumps(modifications),
                 f"Clone of run {run_id}"
             ))
 
             return new_run_id
 
-    def get_replay_plan(self, run_id: int, from_node: str = None) -> Dict:
+    def _merge_completed_results(self, conn: sqlite3.Connection, run_id: int,
+                                 context: Dict, before: Optional[tuple] = None) -> Dict:
         """
-        Get a preview of what would be replayed.
+        Merge completed nodes' results into context, in execution order.
 
-        Returns execution plan without actually executing.
+        Only result_json of completed rows is read, and with before given as
+        (created_at, id) only rows ahead of that execution; malformed
+        results are skipped.
         """
-        original = self.get_run_info(run_id)
-        if not original:
-            raise ValueError(f"Run {run_id} not found")
-
-        plan = {
-            "original_run_id": run_id,
-            "from_node": from_node,
-            "total_nodes": len(original.get("executions", [])),
-            "nodes_to_skip": [],
-            "nodes_to_replay": [],
-            "context_at_start": {}
-        }
+        if before is None:
+            cursor = conn.execute(_SQL_COMPLETED_RESULTS, (run_id,))
+        else:
+            cursor = conn.execute(_SQL_COMPLETED_RESULTS_BEFORE, (run_id, *before))
+        for (result_json,) in cursor:
+            if not result_json:
+                continue
+            try:
+                context.update(json_loads(result_json))
+            except json.JSONDecodeError:
+                pass
+        return context
 
-        found_start = from_node is None
-        context = original.get("input", {}).copy()
+    def get_replay_plan(self, run_id: int, from_node: str = None) -> Dict:
+        """
+        Get a preview of what would be replayed.
 
-        for exec_record in original.get("executions", []):
-            node_info = {
-                "node_id": exec_record["node_id"],
-                "node_name": exec_record["node_name"],
-                "original_status": exec_record["status"],
-                "duration_ms": exec_record.get("duration_ms")
+        Returns execution plan without actually executing. Execution rows
+        are read without their result blobs; results are parsed only for
+        the completed nodes ahead of from_node that make up the context.
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(_SQL_RUN_INPUT, (run_id,)).fetchone()
+            if not row:
+                raise ValueError(f"Run {run_id} not found")
+
+            # Streamed in chunks so long histories are never held as one list
+            cursor = conn.execute(_SQL_PLAN_EXECUTIONS, (run_id,))
+            cursor.arraysize = _FETCH_CHUNK
+
+            plan = {
+                "original_run_id": run_id,
+                "from_node": from_node,
+                "total_nodes": 0,
+                "nodes_to_skip": [],
+                "nodes_to_replay": [],
+                "context_at_start": {}
             }
 
-            if not found_start:
-                if exec_record["node_id"] == from_node:
+            found_start = from_node is None
+            for exec_record in _iter_chunks(cursor):
+                plan["total_nodes"] += 1
+                node_info = {
+                    "node_id": exec_record["node_id"],
+                    "node_name": exec_record["node_name"],
+                    "original_status": exec_record["status"],
+                    "duration_ms": exec_record["duration_ms"]
+                }
+
+                if not found_start and exec_record["node_id"] == from_node:
                     found_start = True
-                    plan["context_at_start"] = context.copy()
+                    # Context built up from the completed nodes skipped so far
+                    plan["context_at_start"] = self._merge_completed_results(
+                        conn, run_id, json_loads(row["input_json"] or "{}"),
+                        before=(exec_record["created_at"], exec_record["id"]))
+
+                if found_start:
                     plan["nodes_to_replay"].append(node_info)
                 else:
-                    # Build up context from completed nodes
-                    if exec_record["status"] == "completed":
-                        try:
-                            result = json.loads(exec_record.get("result_json", "{}"))
-                            context.update(result)
-                        except json.JSONDecodeError:
-                            pass
                     plan["nodes_to_skip"].append(node_info)
-            else:
-                plan["nodes_to_replay"].append(node_info)
 
         return plan
 
@@ -338,29 +600,16 @@ class ReplayManager:
         Returns:
             True if node was reset
         """
-        with self._get_connection() as conn:
+        with self._get_write_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("""
-                UPDATE node_executions
-                SET status = 'pending',
-                    result_json = '{}',
-                    result_text = NULL,
-                    error_message = NULL,
-                    completed_at = NULL,
-                    retry_count = retry_count + 1
-                WHERE run_id = ? AND node_id = ?
-            """, (run_id, node_id))
+            cursor.execute(_SQL_RESET_NODE, (run_id, node_id))
 
             if cursor.rowcount > 0:
                 # Log the reset
-                cursor.execute("""
-                    INSERT INTO conductor_decisions
-                    (run_id, decision_type, decision_data, reason)
-                    VALUES (?, 'reset_node', ?, ?)
-                """, (
+                cursor.execute(_SQL_INSERT_RESET_DECISION, (
                     run_id,
-                    json.dumps({"node_id": node_id}),
+                    node_id,
                     f"Reset node {node_id} for re-execution"
                 ))
                 return True
@@ -368,6 +617,10 @@ class ReplayManager:
             return False
 
 
+# Icons for skipped nodes; anything that did not complete shows as failed
+_SKIP_ICONS = {"completed": "✓", "failed": "✗"}
+
+
 def format_plan(plan: Dict) -> str:
     """Format replay plan for display."""
     lines = [
@@ -376,34 +629,72 @@ def format_plan(plan: Dict) -> str:
         f"Total Nodes: {plan['total_nodes']}",
         ""
     ]
+    append = lines.append
 
     if plan["nodes_to_skip"]:
-        lines.append("Nodes to SKIP (already completed):")
+        append("Nodes to SKIP (already completed):")
         for n in plan["nodes_to_skip"]:
-            status_icon = "✓" if n["original_status"] == "completed" else "✗"
-            lines.append(f"  {status_icon} {n['node_name']} ({n['node_id']})")
-        lines.append("")
+            status_icon = _SKIP_ICONS.get(n["original_status"], "✗")
+            append(f"  {status_icon} {n['node_name']} ({n['node_id']})")
+        append("")
 
     if plan["nodes_to_replay"]:
-        lines.append("Nodes to REPLAY:")
+        append("Nodes to REPLAY:")
         for n in plan["nodes_to_replay"]:
-            status_icon = "→"
-            lines.append(f"  {status_icon} {n['node_name']} ({n['node_id']})")
-        lines.append("")
+            append(f"  → {n['node_name']} ({n['node_id']})")
+        append("")
 
     if plan["context_at_start"]:
-        lines.append("Context at start:")
+        append("Context at start:")
         for k, v in list(plan["context_at_start"].items())[:5]:
-            val_str = str(v)[:50] + "..." if len(str(v)) > 50 else str(v)
-            lines.append(f"  {k}: {val_str}")
+            val_str = str(v)
+            if len(val_str) > 50:
+                val_str = f"{val_str[:50]}..."
+            append(f"  {k}: {val_str}")
 
     return "\n".join(lines)
 
 
+def _run_ids(value: str) -> List[int]:
+    """argparse type for --run-id: one ID or a comma-separated list."""
+    try:
+        return [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid run ID list: {value!r}")
+
+
+async def _retry_runs(manager: ReplayManager, run_ids: List[int], dry_run: bool) -> List:
+    """
+    Retry several runs concurrently, one worker thread each.
+
+    Reads go through the manager's reader pool in parallel; the writes
+    queue on its write lock. A failing run yields its exception in place
+    of a result instead of cancelling the others.
+    """
+    return await asyncio.gather(
+        *[asyncio.to_thread(manager.retry_failed_nodes, rid, dry_run) for rid in run_ids],
+        return_exceptions=True
+    )
+
+
+def _print_retry(result: Dict):
+    """Print a retry_failed_nodes() result as text."""
+    if "message" in result:
+        print(result["message"])
+    elif result.get("dry_run"):
+        print("DRY RUN - Would retry these nodes:")
+    else:
+        print(f"Created retry run #{result.get('new_run_id')}")
+
+    for n in result.get("nodes", []):
+        print(f"  - {n['node_name']}: {n.get('error_message', 'Unknown error')[:50]}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Replay workflows from specific nodes")
 
-    parser.add_argument("--run-id", type=int, required=True, help="Workflow run ID")
+    parser.add_argument("--run-id", type=_run_ids, required=True,
+                        help="Workflow run ID (comma-separated list with --retry-failed)")
     parser.add_argument("--from-node", help="Node ID to replay from")
     parser.add_argument("--retry-failed", action="store_true", help="Retry all failed nodes")
     parser.add_argument("--reset-node", help="Reset a specific node to pending")
@@ -414,17 +705,47 @@ def main():
 
     args = parser.parse_args()
 
+    # Repeated IDs would retry the same run twice
+    run_ids = list(dict.fromkeys(args.run_id))
+    if not run_ids:
+        parser.error("--run-id requires at least one run ID")
+    if len(run_ids) > 1 and not args.retry_failed:
+        parser.error("multiple run IDs are only supported with --retry-failed")
+    args.run_id = run_ids[0]
+
     manager = ReplayManager()
 
     try:
+        if len(run_ids) > 1:
+            results = asyncio.run(_retry_runs(manager, run_ids, args.dry_run))
+            failed = False
+            if args.format == "json":
+                output = {}
+                for rid, result in zip(run_ids, results):
+                    if isinstance(result, Exception):
+                        failed = True
+                        result = {"error": str(result)}
+                    output[str(rid)] = result
+                print(dumps_pretty(output))
+            else:
+                for rid, result in zip(run_ids, results):
+                    print(f"Run #{rid}:")
+                    if isinstance(result, Exception):
+                        failed = True
+                        print(f"  Error: {result}")
+                    else:
+                        _print_retry(result)
+            return 1 if failed else 0
+
         if args.info:
-            run = manager.get_run_info(args.run_id)
+            # Text output only shows counts and statuses
+            run = manager.get_run_info(args.run_id, load_json=args.format == "json")
             if not run:
                 print(f"Run {args.run_id} not found")
                 return 1
 
             if args.format == "json":
-                print(json.dumps(run, indent=2, default=str))
+                print(dumps_pretty(run))
             else:
                 print(f"Run #{run['id']}: {run.get('workflow_name', 'Unknown')}")
                 print(f"Status: {run['status']}")
@@ -440,15 +761,9 @@ def main():
         elif args.retry_failed:
             result = manager.retry_failed_nodes(args.run_id, dry_run=args.dry_run)
             if args.format == "json":
-                print(json.dumps(result, indent=2))
+                print(dumps_pretty(result))
             else:
-                if result.get("dry_run"):
-                    print("DRY RUN - Would retry these nodes:")
-                else:
-                    print(f"Created retry run #{result.get('new_run_id')}")
-
-                for n in result.get("nodes", []):
-                    print(f"  - {n['node_name']}: {n.get('error_message', 'Unknown error')[:50]}")
+                _print_retry(result)
 
         elif args.reset_node:
             if manager.reset_node(args.run_id, args.reset_node):
@@ -464,7 +779,7 @@ def main():
         elif args.from_node or args.dry_run:
             plan = manager.get_replay_plan(args.run_id, args.from_node)
             if args.format == "json":
-                print(json.dumps(plan, indent=2))
+                print(dumps_pretty(plan))
             else:
                 print(format_plan(plan))
 
@@ -480,6 +795,8 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
         return 1
+    finally:
+        manager.close()
 
     return 0
 
@@ -1,6 +1,9 @@
 -- Conductor Schema Additions for Agent Coordination
 -- These tables extend the existing index.db schema for workflow orchestration
 -- Apply with: sqlite3 ~/.claude/emergent-learning/memory/index.db < schema.sql
+-- Existing databases are upgraded once by migrations.py, which re-applies the
+-- CREATE ... IF NOT EXISTS statements below; bump its SCHEMA_VERSION when
+-- adding DDL here that older databases need.
 
 -- ============================================================================
 -- WORKFLOW DEFINITIONS
@@ -72,6 +75,7 @@ CREATE TABLE IF NOT EXISTS workflow_runs (
 CREATE INDEX IF NOT EXISTS idx_runs_workflow ON workflow_runs(workflow_id);
 CREATE INDEX IF NOT EXISTS idx_runs_status ON workflow_runs(status);
 CREATE INDEX IF NOT EXISTS idx_runs_created ON workflow_runs(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_status_started ON workflow_runs(status, started_at DESC);
 
 -- ============================================================================
 -- NODE EXECUTIONS
@@ -117,6 +121,10 @@ CREATE INDEX IF NOT EXISTS idx_node_exec_status ON node_executions(status);
 CREATE INDEX IF NOT EXISTS idx_node_exec_created ON node_executions(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_node_exec_node_id ON node_executions(node_id);
 CREATE INDEX IF NOT EXISTS idx_node_exec_prompt_hash ON node_executions(prompt_hash);
+CREATE INDEX IF NOT EXISTS idx_node_exec_status_created ON node_executions(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_node_exec_run_created ON node_executions(run_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_node_exec_run_status ON node_executions(run_id, status, created_at);
+CREATE INDEX IF NOT EXISTS idx_node_exec_run_node_created ON node_executions(run_id, node_id, created_at DESC);
 
 -- ============================================================================
 -- PHEROMONE TRAILS
@@ -144,11 +152,109 @@ CREATE TABLE IF NOT EXISTS trails (
 );
 
 CREATE INDEX IF NOT EXISTS idx_trails_run ON trails(run_id);
+CREATE INDEX IF NOT EXISTS idx_trails_run_loc ON trails(run_id, location);
 CREATE INDEX IF NOT EXISTS idx_trails_location ON trails(location);
+CREATE INDEX IF NOT EXISTS idx_trails_loc_strength ON trails(location, strength DESC);
 CREATE INDEX IF NOT EXISTS idx_trails_scent ON trails(scent);
 CREATE INDEX IF NOT EXISTS idx_trails_strength ON trails(strength DESC);
+CREATE INDEX IF NOT EXISTS idx_trails_scent_str ON trails(scent, strength DESC, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_trails_scent_created ON trails(scent, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_trails_created ON trails(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_trails_agent ON trails(agent_id);
+-- trails_fts (trigram FTS5 index over location) is created by migrations.py
+-- on SQLite 3.34.0 or later with FTS5. Its triggers then require the same of
+-- every process writing trails; see TRAILS_FTS_SCHEMA.
+
+-- ============================================================================
+-- TRAIL HOT SPOTS
+-- Per-location trail summary maintained by triggers on every insert, update
+-- and delete of trails, whichever process writes them, so hot spot lookups
+-- avoid re-aggregating the whole trails table.
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS trail_hotspots (
+    location TEXT PRIMARY KEY,
+    trail_count INTEGER NOT NULL DEFAULT 0,
+    max_strength REAL,
+    total_strength REAL NOT NULL DEFAULT 0,
+    scents TEXT,                       -- Comma-separated distinct scents
+    agents TEXT,                       -- Comma-separated distinct agent IDs
+    last_activity DATETIME
+);
+
+CREATE INDEX IF NOT EXISTS idx_hotspots_strength ON trail_hotspots(total_strength DESC);
+
+CREATE TRIGGER IF NOT EXISTS trg_trails_hotspots_insert
+AFTER INSERT ON trails
+BEGIN
+    INSERT INTO trail_hotspots
+        (location, trail_count, max_strength, total_strength,
+         scents, agents, last_activity)
+    VALUES
+        (NEW.location, 1, NEW.strength, IFNULL(NEW.strength, 0),
+         NEW.scent, NEW.agent_id, NEW.created_at)
+    ON CONFLICT(location) DO UPDATE SET
+        trail_count = trail_count + 1,
+        max_strength = MAX(IFNULL(max_strength, excluded.max_strength),
+                           IFNULL(excluded.max_strength, max_strength)),
+        total_strength = total_strength + excluded.total_strength,
+        scents = CASE
+            WHEN instr(',' || scents || ',', ',' || excluded.scents || ',') > 0 THEN scents
+            ELSE scents || ',' || excluded.scents END,
+        agents = CASE
+            WHEN excluded.agents IS NULL THEN agents
+            WHEN agents IS NULL THEN excluded.agents
+            WHEN instr(',' || agents || ',', ',' || excluded.agents || ',') > 0 THEN agents
+            ELSE agents || ',' || excluded.agents END,
+        last_activity = MAX(IFNULL(last_activity, ''), IFNULL(excluded.last_activity, ''));
+END;
+
+-- Strength-only changes (decay) adjust the total in place; the new maximum
+-- is one idx_trails_loc_strength lookup.
+CREATE TRIGGER IF NOT EXISTS trg_trails_hotspots_strength
+AFTER UPDATE OF strength ON trails
+WHEN OLD.location = NEW.location AND OLD.scent = NEW.scent
+     AND OLD.agent_id IS NEW.agent_id AND OLD.created_at IS NEW.created_at
+BEGIN
+    UPDATE trail_hotspots SET
+        total_strength = total_strength - IFNULL(OLD.strength, 0) + IFNULL(NEW.strength, 0),
+        max_strength = (SELECT MAX(strength) FROM trails WHERE location = NEW.location)
+    WHERE location = NEW.location;
+END;
+
+-- Any other update, and every delete, can drop a scent, an agent or the
+-- maximum, which cannot be undone incrementally: the affected locations are
+-- re-aggregated from their own trails via idx_trails_location.
+CREATE TRIGGER IF NOT EXISTS trg_trails_hotspots_update
+AFTER UPDATE OF location, scent, agent_id, created_at ON trails
+WHEN OLD.location != NEW.location OR OLD.scent != NEW.scent
+     OR OLD.agent_id IS NOT NEW.agent_id OR OLD.created_at IS NOT NEW.created_at
+BEGIN
+    DELETE FROM trail_hotspots WHERE location IN (OLD.location, NEW.location);
+    INSERT INTO trail_hotspots
+        (location, trail_count, max_strength, total_strength,
+         scents, agents, last_activity)
+    SELECT location, COUNT(*), MAX(strength), IFNULL(SUM(strength), 0),
+           GROUP_CONCAT(DISTINCT scent), GROUP_CONCAT(DISTINCT agent_id),
+           MAX(created_at)
+    FROM trails
+    WHERE location IN (OLD.location, NEW.location)
+    GROUP BY location;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_trails_hotspots_delete
+AFTER DELETE ON trails
+BEGIN
+    DELETE FROM trail_hotspots WHERE location = OLD.location;
+    INSERT INTO trail_hotspots
+        (location, trail_count, max_strength, total_strength,
+         scents, agents, last_activity)
+    SELECT location, COUNT(*), MAX(strength), IFNULL(SUM(strength), 0),
+           GROUP_CONCAT(DISTINCT scent), GROUP_CONCAT(DISTINCT agent_id),
+           MAX(created_at)
+    FROM trails
+    WHERE location = OLD.location
+    GROUP BY location;
+END;
 
 -- ============================================================================
 -- CONDUCTOR DECISIONS
@@ -165,6 +271,7 @@ CREATE TABLE IF NOT EXISTS conductor_decisions (
 );
 
 CREATE INDEX IF NOT EXISTS idx_decisions_run ON conductor_decisions(run_id);
+CREATE INDEX IF NOT EXISTS idx_decisions_run_created ON conductor_decisions(run_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_decisions_type ON conductor_decisions(decision_type);
 
 -- ============================================================================
@@ -18,11 +18,13 @@ USAGE:
 
 import json
 import os
+import shutil
 import sys
 import sqlite3
 import tempfile
 import unittest
 from pathlib import Path
+from typing import Optional, Tuple
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -32,6 +34,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "plugins" /
 
 from conductor import Conductor, Node, NodeType, Edge
 from replay import ReplayManager
+import migrations
 
 # DashboardGenerator doesn't exist - conductor/dashboard.py is missing
 # The actual dashboard is at query/dashboard.py with a different API
@@ -46,6 +49,12 @@ except ImportError:
 def init_test_db(db_path: Path):
     """Initialize test database with schema."""
     conn = sqlite3.connect(str(db_path))
+    _apply_schema(conn)
+    conn.close()
+
+
+def _apply_schema(conn: sqlite3.Connection):
+    """Create the conductor schema on an open connection."""
     # Create prerequisite table that conductor schema references
     conn.execute("""
         CREATE TABLE IF NOT EXISTS schema_version (
@@ -58,7 +67,67 @@ def init_test_db(db_path: Path):
     if schema_path.exists():
         conn.executescript(schema_path.read_text())
     conn.commit()
-    conn.close()
+
+
+# Schema-initialized database built once per test process and copied into
+# each test's temp dir, instead of re-running schema.sql for every test.
+# It lives in its own mkdtemp() dir, so parallel runners never share one.
+_TEMPLATE_DIR: Optional[str] = None
+
+# The same schema in a private in-memory database, backed up into a named
+# shared-cache memory database for tests that never need a file on disk.
+_MEMORY_TEMPLATE: Optional[sqlite3.Connection] = None
+
+
+def _template_db() -> Path:
+    """Path of the template database, building it on first use."""
+    global _TEMPLATE_DIR
+    if _TEMPLATE_DIR is None:
+        _TEMPLATE_DIR = tempfile.mkdtemp(prefix="conductor_schema_")
+        init_test_db(Path(_TEMPLATE_DIR) / "index.db")
+    return Path(_TEMPLATE_DIR) / "index.db"
+
+
+def copy_test_db(db_path: Path):
+    """Initialize a test database by copying the schema template."""
+    shutil.copyfile(_template_db(), db_path)
+
+
+def _memory_template() -> sqlite3.Connection:
+    """In-memory template database, building it on first use."""
+    global _MEMORY_TEMPLATE
+    if _MEMORY_TEMPLATE is None:
+        _MEMORY_TEMPLATE = sqlite3.connect(":memory:")
+        _apply_schema(_MEMORY_TEMPLATE)
+    return _MEMORY_TEMPLATE
+
+
+def open_memory_db(name: str) -> Tuple[str, sqlite3.Connection]:
+    """
+    Create a shared-cache in-memory database holding the schema.
+
+    Returns its URI (for Conductor's db_uri) and a connection that keeps it
+    alive; the database is dropped when that connection is closed.
+    """
+    uri = f"file:{name}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(uri, uri=True)
+    _memory_template().backup(keeper)
+    return uri, keeper
+
+
+def setUpModule():
+    _template_db()
+    _memory_template()
+
+
+def tearDownModule():
+    global _TEMPLATE_DIR, _MEMORY_TEMPLATE
+    if _TEMPLATE_DIR is not None:
+        shutil.rmtree(_TEMPLATE_DIR, ignore_errors=True)
+        _TEMPLATE_DIR = None
+    if _MEMORY_TEMPLATE is not None:
+        _MEMORY_TEMPLATE.close()
+        _MEMORY_TEMPLATE = None
 
 
 class TestDatabaseSetup(unittest.TestCase):
@@ -71,13 +140,14 @@ class TestDatabaseSetup(unittest.TestCase):
         self.db_path.parent.mkdir(parents=True)
 
         # Initialize schema using helper
-        init_test_db(self.db_path)
+        copy_test_db(self.db_path)
 
         # Create conductor with temp path
         self.conductor = Conductor(base_path=self.temp_dir)
 
     def tearDown(self):
         """Clean up temp directory."""
+        self.conductor.close()
         import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
@@ -127,24 +197,124 @@ class TestDatabaseSetup(unittest.TestCase):
         self.assertEqual(len(workflow["nodes"]), 2)
         self.assertEqual(len(workflow["edges"]), 3)
 
+    def test_workflow_cache(self):
+        """Test that cached workflows are isolated from callers and invalidated on create."""
+        self.conductor.create_workflow(
+            name="cached", nodes=[{"id": "n1", "name": "N1", "node_type": "single",
+                                   "prompt_template": "P"}], edges=[])
+
+        first = self.conductor.get_workflow("cached")
+        first["nodes"].append({"id": "mutated"})
+        first["nodes"][0]["name"] = "changed"
+        first["config"]["changed"] = True
+        second = self.conductor.get_workflow("cached")
+        self.assertEqual(len(second["nodes"]), 1)
+        self.assertEqual(second["nodes"][0]["name"], "N1")
+        self.assertEqual(second["config"], {})
+        self.assertEqual(self.conductor._load_workflow("cached")["nodes"][0]["name"], "N1")
+
+        self.assertEqual(len(self.conductor.list_workflows()), 1)
+        self.conductor.create_workflow(name="another", nodes=[], edges=[])
+        self.assertEqual(len(self.conductor.list_workflows()), 2)
+
+    def test_open_readonly(self):
+        """Test that a read-only conductor can query but not write."""
+        self.conductor.create_workflow(name="ro-workflow", nodes=[], edges=[])
+
+        with Conductor.open_readonly(base_path=self.temp_dir) as reader:
+            self.assertEqual([w["name"] for w in reader.list_workflows()], ["ro-workflow"])
+            with self.assertRaises(sqlite3.OperationalError):
+                reader.start_run(workflow_name="ro-workflow")
+
+    def test_migrates_legacy_database_once(self):
+        """Test that an older database is upgraded once and then left alone."""
+        self.conductor.lay_trail(None, "src/app.py", "hot", strength=0.5)
+        self.conductor.close()
+
+        # Roll the database back to a pre-upgrade state
+        conn = sqlite3.connect(str(self.db_path))
+        conn.executescript("""
+            DROP INDEX idx_node_exec_run_node_created;
+            DROP TRIGGER trg_trails_hotspots_insert;
+            DROP TABLE trail_hotspots;
+            PRAGMA user_version = 0;
+        """)
+        conn.close()
+
+        self.conductor = Conductor(base_path=self.temp_dir)
+        conn = sqlite3.connect(str(self.db_path))
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], migrations.SCHEMA_VERSION)
+        self.assertIsNotNone(conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'idx_node_exec_run_node_created'").fetchone())
+        self.assertEqual(conn.execute("SELECT location FROM trail_hotspots").fetchall(),
+                         [("src/app.py",)])
+
+        # Up to date: opening again must not need the write lock
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            with patch("sys.stderr") as stderr:
+                Conductor(base_path=self.temp_dir).close()
+            stderr.write.assert_not_called()
+        finally:
+            conn.rollback()
+            conn.close()
+
+    def test_skips_trails_fts_on_old_sqlite(self):
+        """Test that no FTS index or triggers are created below the minimum SQLite version."""
+        self.conductor.close()
+        conn = sqlite3.connect(str(self.db_path))
+        conn.executescript("""
+            DROP TABLE IF EXISTS trails_fts;
+            DROP TRIGGER IF EXISTS trg_trails_fts_insert;
+            DROP TRIGGER IF EXISTS trg_trails_fts_delete;
+            DROP TRIGGER IF EXISTS trg_trails_fts_update;
+            PRAGMA user_version = 0;
+        """)
+        conn.close()
+
+        with patch("migrations.sqlite3.sqlite_version_info", (3, 33, 0)):
+            self.conductor = Conductor(base_path=self.temp_dir)
+        self.conductor.lay_trail(None, "src/app.py", "hot")
+
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            self.assertEqual(conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE name LIKE '%trails_fts%'").fetchone()[0], 0)
+        finally:
+            conn.close()
+        self.assertEqual(len(self.conductor.get_trails(location="app")), 1)
+
+    def test_skips_database_without_conductor_tables(self):
+        """Test that opening a database without conductor tables neither writes nor warns."""
+        other_dir = tempfile.mkdtemp()
+        try:
+            db_path = Path(other_dir) / "memory" / "index.db"
+            db_path.parent.mkdir(parents=True)
+            sqlite3.connect(str(db_path)).close()
+
+            with patch("sys.stderr") as stderr:
+                Conductor(base_path=other_dir).close()
+            stderr.write.assert_not_called()
+
+            conn = sqlite3.connect(str(db_path))
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0], 0)
+            conn.close()
+        finally:
+            shutil.rmtree(other_dir, ignore_errors=True)
+
 
 class TestWorkflowExecution(unittest.TestCase):
     """Test workflow execution."""
 
     def setUp(self):
-        """Create temp database and conductor."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "memory" / "index.db"
-        self.db_path.parent.mkdir(parents=True)
-
-        # Initialize schema using helper
-        init_test_db(self.db_path)
-
-        self.conductor = Conductor(base_path=self.temp_dir)
+        """Create in-memory database and conductor."""
+        self.db_uri, self.db_keeper = open_memory_db(self.id())
+        # base_path is unused once db_uri is given
+        self.conductor = Conductor(base_path=tempfile.gettempdir(), db_uri=self.db_uri)
 
     def tearDown(self):
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.conductor.close()
+        self.db_keeper.close()
 
     def test_start_run(self):
         """Test starting a workflow run."""
@@ -219,23 +389,336 @@ class TestWorkflowExecution(unittest.TestCase):
         self.assertEqual(executions[0]["status"], "failed")
         self.assertEqual(executions[0]["error_message"], "Test error")
 
+    def test_run_workflow_follows_conditions(self):
+        """Test that run_workflow only traverses edges whose condition holds."""
+        self.conductor.create_workflow(
+            name="branching",
+            nodes=[
+                {"id": "route", "name": "Route", "node_type": "single",
+                 "prompt_template": "Pick a branch"},
+                {"id": "left", "name": "Left", "node_type": "single",
+                 "prompt_template": "Go left"},
+                {"id": "right", "name": "Right", "node_type": "single",
+                 "prompt_template": "Go right"}
+            ],
+            edges=[
+                {"from_node": "__start__", "to_node": "route"},
+                {"from_node": "route", "to_node": "left",
+                 "condition": "context.get('branch') == 'left'"},
+                {"from_node": "route", "to_node": "right",
+                 "condition": "context.get('branch') == 'right'"},
+                {"from_node": "left", "to_node": "__end__"},
+                {"from_node": "right", "to_node": "__end__"}
+            ]
+        )
+
+        def executor(node, context):
+            if node.id == "route":
+                return "routed", {"branch": "left"}
+            return f"ran {node.id}", {f"{node.id}_done": True}
+
+        self.conductor.set_node_executor(executor)
+        completed = []
+        run_id = self.conductor.run_workflow(
+            "branching",
+            on_node_complete=lambda node_id, success, result: completed.append(node_id)
+        )
+
+        self.assertEqual(completed, ["route", "left"])
+        run = self.conductor.get_run(run_id)
+        self.assertEqual(run["status"], "completed")
+        self.assertTrue(run["output"]["left_done"])
+        self.assertNotIn("right_done", run["output"])
+
+        # A second run reuses the cached graph
+        graph = self.conductor._get_graph(self.conductor.get_workflow("branching"))
+        self.conductor.run_workflow("branching")
+        self.assertIs(self.conductor._get_graph(self.conductor.get_workflow("branching")), graph)
+
+    def test_run_workflow_join_waits_for_all_predecessors(self):
+        """Test that a join node runs once, after every branch into it has finished."""
+        import threading
+        import time
+        self.conductor.create_workflow(
+            name="diamond",
+            nodes=[{"id": i, "name": i.upper(), "node_type": "single", "prompt_template": i}
+                   for i in ("a", "b", "c")],
+            edges=[
+                {"from_node": "__start__", "to_node": "a"},
+                {"from_node": "__start__", "to_node": "b"},
+                {"from_node": "a", "to_node": "c"},
+                {"from_node": "b", "to_node": "c"},
+                {"from_node": "c", "to_node": "__end__"}
+            ]
+        )
+        a_done = threading.Event()
+        seen = []
+
+        def executor(node, context):
+            if node.id == "a":
+                a_done.set()
+            elif node.id == "b":
+                # Finish well after a, so c would start early if it only waited for a
+                a_done.wait(5)
+                time.sleep(0.2)
+            else:
+                seen.append((context.get("a_out"), context.get("b_out")))
+            return node.id, {f"{node.id}_out": node.id}
+
+        self.conductor.set_node_executor(executor)
+        run_id = self.conductor.run_workflow("diamond")
+
+        self.assertEqual(seen, [("a", "b")])
+        self.assertEqual(self.conductor.get_run(run_id)["output"]["c_out"], "c")
+
+    def test_run_workflow_join_after_pruned_branch(self):
+        """Test that a join still runs when one branch into it is skipped, and cycles do not stall."""
+        self.conductor.create_workflow(
+            name="pruned",
+            nodes=[{"id": i, "name": i.title(), "node_type": "single", "prompt_template": i}
+                   for i in ("route", "left", "right", "join")],
+            edges=[
+                {"from_node": "__start__", "to_node": "route"},
+                {"from_node": "route", "to_node": "left",
+                 "condition": "context.get('branch') == 'left'"},
+                {"from_node": "route", "to_node": "right",
+                 "condition": "context.get('branch') == 'right'"},
+                {"from_node": "left", "to_node": "join"},
+                {"from_node": "right", "to_node": "join"},
+                {"from_node": "join", "to_node": "route",
+                 "condition": "context.get('again')"}
+            ]
+        )
+        ran = []
+
+        def executor(node, context):
+            ran.append(node.id)
+            return node.id, {"branch": "left", "again": True}
+
+        self.conductor.set_node_executor(executor)
+        self.conductor.run_workflow("pruned")
+
+        self.assertEqual(ran, ["route", "left", "join"])
+
+    def test_run_workflow_reraises_callback_error(self):
+        """Test that a failing progress callback surfaces once the run is recorded."""
+        self.conductor.create_workflow(
+            name="noisy",
+            nodes=[
+                {"id": "first", "name": "First", "node_type": "single",
+                 "prompt_template": "One"},
+                {"id": "second", "name": "Second", "node_type": "single",
+                 "prompt_template": "Two"}
+            ],
+            edges=[
+                {"from_node": "__start__", "to_node": "first"},
+                {"from_node": "first", "to_node": "second"},
+                {"from_node": "second", "to_node": "__end__"}
+            ]
+        )
+        self.conductor.set_node_executor(lambda node, context: ("ok", {node.id: True}))
+        calls = []
+
+        def callback(node_id, success, result):
+            calls.append(node_id)
+            raise RuntimeError("progress display broke")
+
+        with patch("sys.stderr"), self.assertRaisesRegex(RuntimeError, "progress display broke"):
+            self.conductor.run_workflow("noisy", on_node_complete=callback)
+
+        self.assertEqual(calls, ["first"])
+        statuses = self.db_keeper.execute(
+            "SELECT status FROM workflow_runs WHERE workflow_name = 'noisy'").fetchall()
+        self.assertEqual(statuses, [("completed",)])
+
+    def test_run_workflow_records_executions(self):
+        """Test that buffered executions are persisted when the run ends."""
+        self.conductor.create_workflow(
+            name="recorded",
+            nodes=[
+                {"id": "ok", "name": "Ok", "node_type": "single", "prompt_template": "Ok"},
+                {"id": "boom", "name": "Boom", "node_type": "single", "prompt_template": "Boom"}
+            ],
+            edges=[
+                {"from_node": "__start__", "to_node": "ok"},
+                {"from_node": "ok", "to_node": "boom"},
+                {"from_node": "boom", "to_node": "__end__"}
+            ]
+        )
+
+        def executor(node, context):
+            if node.id == "boom":
+                raise RuntimeError("exploded")
+            return "fine", {"findings": [{"type": "fact", "content": "ok ran"}]}
+
+        self.conductor.set_node_executor(executor)
+        run_id = self.conductor.run_workflow("recorded")
+
+        executions = {e["node_id"]: e for e in self.conductor.get_node_executions(run_id)}
+        self.assertEqual(executions["ok"]["status"], "completed")
+        self.assertEqual(executions["ok"]["findings"][0]["content"], "ok ran")
+        self.assertEqual(executions["boom"]["status"], "failed")
+        self.assertEqual(executions["boom"]["error_message"], "exploded")
+
+        run = self.conductor.get_run(run_id)
+        self.assertEqual((run["total_nodes"], run["completed_nodes"], run["failed_nodes"]), (2, 1, 1))
+        decision_types = [d["decision_type"] for d in self.conductor.get_decisions(run_id)]
+        self.assertEqual(decision_types.count("fire_node"), 2)
+        self.assertIn("node_failed", decision_types)
+
+    def test_run_workflow_records_invalid_result_as_failure(self):
+        """Test that a non-dict executor result fails its node, not the whole batch."""
+        self.conductor.create_workflow(
+            name="invalid-result",
+            nodes=[
+                {"id": "a", "name": "A", "node_type": "single", "prompt_template": "A"},
+                {"id": "b", "name": "B", "node_type": "single", "prompt_template": "B"}
+            ],
+            edges=[
+                {"from_node": "__start__", "to_node": "a"},
+                {"from_node": "a", "to_node": "b"},
+                {"from_node": "b", "to_node": "__end__"}
+            ]
+        )
+
+        def executor(node, context):
+            if node.id == "b":
+                return "text", None
+            return "fine", {"a": 1}
+
+        self.conductor.set_node_executor(executor)
+        run_id = self.conductor.run_workflow("invalid-result")
+
+        executions = {e["node_id"]: e for e in self.conductor.get_node_executions(run_id)}
+        self.assertEqual(executions["a"]["status"], "completed")
+        self.assertEqual(executions["b"]["status"], "failed")
+        self.assertIn("NoneType", executions["b"]["error_message"])
+
+        run = self.conductor.get_run(run_id)
+        self.assertEqual(run["status"], "completed")
+        self.assertEqual((run["completed_nodes"], run["failed_nodes"]), (1, 1))
+
+    def test_failed_flush_keeps_buffered_executions(self):
+        """Test that executions stay buffered when their batch cannot be written."""
+        run_id = self.conductor.start_run(workflow_name="flush-retry")
+        node = Node(id="n", name="N", node_type=NodeType.SINGLE, prompt_template="P")
+        self.conductor.execute_node(run_id, node, {}, buffered=True)
+
+        with patch.object(self.conductor, "_write_executions",
+                          side_effect=sqlite3.OperationalError("database is locked")):
+            with self.assertRaises(sqlite3.OperationalError):
+                self.conductor._flush_executions()
+
+        self.conductor._flush_executions()
+        self.assertEqual([e["status"] for e in self.conductor.get_node_executions(run_id)],
+                         ["completed"])
+
+    def test_run_workflow_runs_siblings_concurrently(self):
+        """Test that sibling nodes in run_workflow execute at the same time."""
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+        self.conductor.create_workflow(
+            name="fan-out",
+            nodes=[
+                {"id": "a", "name": "A", "node_type": "single", "prompt_template": "A"},
+                {"id": "b", "name": "B", "node_type": "single", "prompt_template": "B"}
+            ],
+            edges=[
+                {"from_node": "__start__", "to_node": "a", "priority": 1},
+                {"from_node": "__start__", "to_node": "b", "priority": 2},
+                {"from_node": "a", "to_node": "__end__"},
+                {"from_node": "b", "to_node": "__end__"}
+            ]
+        )
+
+        def executor(node, context):
+            barrier.wait()  # Deadlocks (and times out) if siblings run serially
+            return node.id, {"last": node.id}
+
+        self.conductor.set_node_executor(executor)
+        completed = []
+        run_id = self.conductor.run_workflow(
+            "fan-out",
+            on_node_complete=lambda node_id, success, result: completed.append(node_id)
+        )
+
+        self.assertCountEqual(completed, ["a", "b"])
+        self.assertIn(self.conductor.get_run(run_id)["output"]["last"], ("a", "b"))
+
+    def test_run_workflow_streams_successors(self):
+        """Test that a successor starts without waiting for its parent's slow sibling."""
+        import threading
+        successor_started = threading.Event()
+        self.conductor.create_workflow(
+            name="streaming",
+            nodes=[
+                {"id": "fast", "name": "Fast", "node_type": "single", "prompt_template": "F"},
+                {"id": "slow", "name": "Slow", "node_type": "single", "prompt_template": "S"},
+                {"id": "next", "name": "Next", "node_type": "single", "prompt_template": "N"}
+            ],
+            edges=[
+                {"from_node": "__start__", "to_node": "fast"},
+                {"from_node": "__start__", "to_node": "slow"},
+                {"from_node": "fast", "to_node": "next"},
+                {"from_node": "slow", "to_node": "__end__"},
+                {"from_node": "next", "to_node": "__end__"}
+            ]
+        )
+
+        def executor(node, context):
+            if node.id == "slow":
+                # Only finishes once "next" has started
+                self.assertTrue(successor_started.wait(timeout=5))
+            elif node.id == "next":
+                successor_started.set()
+            return node.id, {node.id: True}
+
+        self.conductor.set_node_executor(executor)
+        completed = []
+        run_id = self.conductor.run_workflow(
+            "streaming",
+            on_node_complete=lambda node_id, success, result: completed.append((node_id, success))
+        )
+
+        # "slow" only succeeds if "next" started while it was still running
+        self.assertCountEqual(completed, [("fast", True), ("next", True), ("slow", True)])
+        self.assertEqual(self.conductor.get_run(run_id)["status"], "completed")
+
+    def test_execute_parallel_node(self):
+        """Test that parallel nodes run concurrently and merge in order."""
+        import threading
+        barrier = threading.Barrier(3, timeout=5)
+
+        def executor(node, context):
+            barrier.wait()  # Only passes if all three run at once
+            return node.id, {"winner": node.id, node.id: True}
+
+        self.conductor.set_node_executor(executor)
+        run_id = self.conductor.start_run(workflow_name="parallel-test")
+        nodes = [
+            Node(id=f"p{i}", name=f"P{i}", node_type=NodeType.SINGLE, prompt_template="P")
+            for i in range(3)
+        ]
+
+        success, merged = self.conductor.execute_parallel_node(run_id, nodes, {})
+
+        self.assertTrue(success)
+        self.assertEqual(merged["winner"], "p2")
+        self.assertTrue(merged["p0"] and merged["p1"] and merged["p2"])
+        self.assertEqual(len(self.conductor.get_node_executions(run_id)), 3)
+
 
 class TestTrails(unittest.TestCase):
     """Test pheromone trail functionality."""
 
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "memory" / "index.db"
-        self.db_path.parent.mkdir(parents=True)
-
-        # Initialize schema using helper
-        init_test_db(self.db_path)
-
-        self.conductor = Conductor(base_path=self.temp_dir)
+        self.db_uri, self.db_keeper = open_memory_db(self.id())
+        # base_path is unused once db_uri is given
+        self.conductor = Conductor(base_path=tempfile.gettempdir(), db_uri=self.db_uri)
 
     def tearDown(self):
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.conductor.close()
+        self.db_keeper.close()
 
     def test_lay_trail(self):
         """Test laying a pheromone trail."""
@@ -255,6 +738,17 @@ class TestTrails(unittest.TestCase):
         self.assertEqual(trails[0]["scent"], "discovery")
         self.assertEqual(trails[0]["strength"], 0.8)
 
+    def test_exact_location_filter(self):
+        """Test exact location matching skips substring matches."""
+        run_id = self.conductor.start_run(workflow_name="exact-test")
+
+        self.conductor.lay_trail(run_id, "src/main.py", "discovery")
+        self.conductor.lay_trail(run_id, "main.py", "warning")
+
+        trails = self.conductor.get_trails(location="main.py", exact_location=True)
+        self.assertEqual(len(trails), 1)
+        self.assertEqual(trails[0]["scent"], "warning")
+
     def test_hot_spots(self):
         """Test hot spots aggregation."""
         run_id = self.conductor.start_run(workflow_name="hotspot-test")
@@ -274,6 +768,66 @@ class TestTrails(unittest.TestCase):
         self.assertEqual(hot_spots[0]["trail_count"], 3)
         self.assertAlmostEqual(hot_spots[0]["total_strength"], 1.5, places=2)
 
+    def test_hot_spots_summary(self):
+        """Test the unfiltered hot spot summary tracks inserts and decay."""
+        run_id = self.conductor.start_run(workflow_name="summary-test")
+
+        for i, scent in enumerate(["warning", "warning", "blocker"]):
+            self.conductor.lay_trail(run_id, "src/critical.py", scent,
+                                     strength=0.5, agent_id=f"agent-{i}")
+        self.conductor.lay_trail(run_id, "src/other.py", "discovery", strength=0.2)
+
+        hot_spots = self.conductor.get_hot_spots()
+        self.assertEqual([h["location"] for h in hot_spots],
+                         ["src/critical.py", "src/other.py"])
+        self.assertEqual(hot_spots[0]["trail_count"], 3)
+        self.assertAlmostEqual(hot_spots[0]["total_strength"], 1.5, places=2)
+        self.assertEqual(hot_spots[0]["scents"], "warning,blocker")
+        self.assertEqual(hot_spots[0]["agents"], "agent-0,agent-1,agent-2")
+        self.assertIsNone(hot_spots[1]["agents"])
+
+        # Decay drops the weak trail and halves the rest
+        self.conductor.decay_trails(decay_rate=0.5)
+        hot_spots = self.conductor.get_hot_spots()
+        self.assertEqual(len(hot_spots), 2)
+        self.assertAlmostEqual(hot_spots[0]["total_strength"], 0.75, places=2)
+
+        self.conductor.decay_trails(decay_rate=0.99)
+        self.assertEqual(self.conductor.get_hot_spots(), [])
+
+    def test_hot_spots_track_outside_updates_and_deletes(self):
+        """Test the summary follows trail updates and deletes from other writers."""
+        run_id = self.conductor.start_run(workflow_name="writers-test")
+        for scent, strength in [("warning", 0.9), ("blocker", 0.4), ("warning", 0.3)]:
+            self.conductor.lay_trail(run_id, "src/a.py", scent, strength=strength, agent_id="x")
+
+        def summary():
+            return {h["location"]: (h["trail_count"], round(h["max_strength"], 6),
+                                    round(h["total_strength"], 6), set(h["scents"].split(",")))
+                    for h in self.conductor.get_hot_spots()}
+
+        writer = sqlite3.connect(self.db_uri, uri=True)
+        try:
+            with writer:
+                writer.execute("UPDATE trails SET strength = 0.5 WHERE strength = 0.9")
+            self.assertEqual(summary(), {"src/a.py": (3, 0.5, 1.2, {"warning", "blocker"})})
+
+            with writer:
+                writer.execute("DELETE FROM trails WHERE scent = 'blocker'")
+            self.assertEqual(summary(), {"src/a.py": (2, 0.5, 0.8, {"warning"})})
+
+            with writer:
+                writer.execute("UPDATE trails SET location = 'src/b.py', scent = 'hot' "
+                               "WHERE strength = 0.3")
+            self.assertEqual(summary(), {"src/a.py": (1, 0.5, 0.5, {"warning"}),
+                                         "src/b.py": (1, 0.3, 0.3, {"hot"})})
+
+            with writer:
+                writer.execute("DELETE FROM trails WHERE location = 'src/a.py'")
+            self.assertEqual(summary(), {"src/b.py": (1, 0.3, 0.3, {"hot"})})
+        finally:
+            writer.close()
+
     def test_trail_decay(self):
         """Test trail strength decay."""
         run_id = self.conductor.start_run(workflow_name="decay-test")
@@ -301,12 +855,14 @@ class TestReplay(unittest.TestCase):
         self.db_path.parent.mkdir(parents=True)
 
         # Initialize schema using helper
-        init_test_db(self.db_path)
+        copy_test_db(self.db_path)
 
         self.conductor = Conductor(base_path=self.temp_dir)
         self.replay = ReplayManager(base_path=self.temp_dir)
 
     def tearDown(self):
+        self.replay.close()
+        self.conductor.close()
         import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
@@ -349,6 +905,48 @@ class TestReplay(unittest.TestCase):
         self.assertEqual(result["failed_nodes"], 1)
         self.assertEqual(result["nodes"][0]["node_id"], "failure")
 
+    def test_execution_lookups_return_dicts(self):
+        """Test that execution lookups return plain dicts."""
+        run_id = self.conductor.start_run(workflow_name="dict-test")
+        node = Node(id="failure", name="Failure", node_type=NodeType.SINGLE, prompt_template="P")
+        exec_id = self.conductor.record_node_start(run_id, node, "P")
+        self.conductor.record_node_failure(exec_id, "Test error")
+
+        lookups = {
+            "get_failed_nodes": self.replay.get_failed_nodes(run_id)[0],
+            "get_failed_nodes preview": self.replay.get_failed_nodes(run_id, preview_only=True)[0],
+            "get_node_by_id": self.replay.get_node_by_id(run_id, "failure"),
+            "get_run_info": self.replay.get_run_info(run_id)["executions"][0],
+        }
+        for name, execution in lookups.items():
+            with self.subTest(lookup=name):
+                self.assertIsInstance(execution, dict)
+                self.assertEqual(execution.get("node_id"), "failure")
+                json.dumps(execution)
+        self.assertIsNone(self.replay.get_node_by_id(run_id, "missing"))
+
+    def test_retry_runs_concurrently(self):
+        """Test retrying several runs at once from the CLI helper."""
+        import asyncio
+        from replay import _retry_runs
+
+        run_ids = []
+        for i in range(3):
+            run_id = self.conductor.start_run(workflow_name=f"retry-{i}")
+            node = Node(id="failure", name="Failure", node_type=NodeType.SINGLE, prompt_template="P")
+            exec_id = self.conductor.record_node_start(run_id, node, "P")
+            self.conductor.record_node_failure(exec_id, "Test error")
+            run_ids.append(run_id)
+
+        results = asyncio.run(_retry_runs(self.replay, run_ids + [9999], dry_run=False))
+
+        new_run_ids = {r["new_run_id"] for r in results[:3]}
+        self.assertEqual(len(new_run_ids), 3)
+        self.assertEqual(results[3]["nodes"], [])
+        for new_run_id in new_run_ids:
+            executions = self.replay.get_run_info(new_run_id)["executions"]
+            self.assertEqual([e["status"] for e in executions], ["pending"])
+
 
 @unittest.skipUnless(DASHBOARD_AVAILABLE, "DashboardGenerator not available - conductor/dashboard.py missing")
 class TestDashboard(unittest.TestCase):
@@ -360,12 +958,13 @@ class TestDashboard(unittest.TestCase):
         self.db_path.parent.mkdir(parents=True)
 
         # Initialize schema using helper
-        init_test_db(self.db_path)
+        copy_test_db(self.db_path)
 
         self.conductor = Conductor(base_path=self.temp_dir)
         self.dashboard = DashboardGenerator(base_path=self.temp_dir)
 
     def tearDown(self):
+        self.conductor.close()
         import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
@@ -396,7 +995,7 @@ class TestSQLiteBridge(unittest.TestCase):
         self.db_path.parent.mkdir(parents=True)
 
         # Initialize schema using helper
-        init_test_db(self.db_path)
+        copy_test_db(self.db_path)
 
     def tearDown(self):
         import shutil
@@ -415,6 +1014,208 @@ class TestSQLiteBridge(unittest.TestCase):
             self.skipTest("sqlite_bridge not in path")
 
 
+class TestCLIExecutor(unittest.TestCase):
+    """Test CLI executor output parsing."""
+
+    def setUp(self):
+        from executor import CLIExecutor
+        self.temp_dir = tempfile.mkdtemp()
+        self.executor = CLIExecutor(project_root=self.temp_dir)
+
+    def tearDown(self):
+        import shutil
+        self.executor.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_extract_findings(self):
+        """Test that findings are parsed from the FINDINGS section only."""
+        output = (
+            "intro\n"
+            "## FINDINGS\n"
+            "- [fact:auth,db:high] Tokens are cached\n"
+            "- [warning] Slow query\n"
+            "- no brackets here\n"
+            "## NEXT\n"
+            "- [fact] Not a finding\n"
+        )
+        findings = self.executor._extract_findings(output)
+
+        self.assertEqual(findings, [
+            {"type": "fact", "tags": ["auth", "db"], "importance": "high",
+             "content": "Tokens are cached"},
+            {"type": "warning", "tags": [], "importance": "normal",
+             "content": "Slow query"},
+        ])
+
+    def test_extract_files_keeps_first_mention_order(self):
+        """Test that modified files are deduplicated in mention order."""
+        output = "Modified b.py then created a.py.\nUpdated `b.py` again. File 'c.md' too."
+        self.assertEqual(self.executor._extract_files(output), ["b.py", "a.py", "c.md"])
+
+    def test_spawn_task_keeps_stderr_out_of_parsed_output(self):
+        """Test that stderr is reported separately and truncation is recorded."""
+        script = (
+            "import sys\n"
+            "sys.stdin.read()\n"
+            "print('x' * 100000)\n"
+            "print('## FINDINGS')\n"
+            "print('- [fact] From stdout')\n"
+            "print('- [warning] From stderr', file=sys.stderr)\n"
+        )
+        self.executor._base_cmd = (sys.executable, "-c", script)
+
+        result_text, result_dict = self.executor._spawn_claude_task("n1", "prompt")
+
+        self.assertEqual([f["content"] for f in result_dict["findings"]], ["From stdout"])
+        self.assertTrue(result_dict["output_truncated"])
+        self.assertTrue(result_text.endswith("[STDERR]\n- [warning] From stderr\n"))
+
+    def test_safe_format_keeps_unknown_placeholders(self):
+        """Test that prompt formatting fills known keys and leaves the rest."""
+        from executor import _safe_format
+        context = {"task": "T"}
+
+        self.assertEqual(_safe_format("do {task} with {other}", context), "do T with {other}")
+        self.assertEqual(_safe_format('emit {"type": "x"} for {task}', context),
+                         'emit {"type": "x"} for T')
+        self.assertEqual(_safe_format("unbalanced { {task}", context), "unbalanced { {task}")
+
+    def test_truncate_utf8_respects_character_boundaries(self):
+        """Test that result text is cut by UTF-8 bytes without splitting characters."""
+        from executor import _truncate_utf8
+
+        self.assertEqual(_truncate_utf8("short", 10), "short")
+        self.assertEqual(_truncate_utf8("a" * 20, 10), "a" * 10)
+        self.assertEqual(_truncate_utf8("\u20ac" * 5, 7), "\u20ac" * 2)
+
+
+class TestHookSignalExecutor(unittest.TestCase):
+    """Test the file-signal executor."""
+
+    def setUp(self):
+        from executor import HookSignalExecutor
+        self.temp_dir = tempfile.mkdtemp()
+        self.executor = HookSignalExecutor(project_root=self.temp_dir)
+
+    def tearDown(self):
+        import shutil
+        self.executor.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _run_with_hook(self):
+        """Execute a node while a hook thread completes its signal file."""
+        import threading
+        node = Node(id="hooked", name="Hooked", node_type=NodeType.SINGLE,
+                    prompt_template="Do {task}")
+        signal_file = Path(self.temp_dir) / ".coordination" / "conductor-signal-hooked.json"
+
+        def hook():
+            while not signal_file.exists():
+                threading.Event().wait(0.01)
+            instruction = json.loads(signal_file.read_text())
+            self.assertEqual(instruction["prompt"], "Do it")
+            signal_file.write_text(json.dumps(
+                {"status": "completed", "result_text": "done", "result_dict": {"ok": True}}))
+
+        thread = threading.Thread(target=hook)
+        thread.start()
+        result = self.executor.execute(node, {"task": "it"})
+        thread.join()
+
+        self.assertEqual(result, ("done", {"ok": True}))
+        self.assertFalse(signal_file.exists())
+
+    def test_execute_waits_for_hook_result(self):
+        """Test that a result written by the hook is picked up."""
+        self._run_with_hook()
+
+    def test_execute_polls_without_inotify(self):
+        """Test that the executor falls back to polling when no watch can be made."""
+        with patch("executor._SignalWatcher.create", return_value=None):
+            self._run_with_hook()
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux-only")
+    def test_signal_watcher_wakes_only_for_its_file(self):
+        """Test that the inotify watcher ignores writes to other signal files."""
+        from executor import _SignalWatcher
+        watcher = _SignalWatcher.create(Path(self.temp_dir))
+        self.assertIsNotNone(watcher)
+        try:
+            (Path(self.temp_dir) / "other.json").write_text("{}")
+            self.assertFalse(watcher.wait("mine.json", 0.05))
+            (Path(self.temp_dir) / "mine.json").write_text("{}")
+            self.assertTrue(watcher.wait("mine.json", 1.0))
+        finally:
+            watcher.close()
+
+
+class TestQueryConductorCLI(unittest.TestCase):
+    """Test the query_conductor command-line entry point."""
+
+    def test_fast_args_match_parser_defaults(self):
+        """Fast-path commands parse exactly like the full parser."""
+        import query_conductor
+
+        for flag in query_conductor._FAST_COMMANDS:
+            with self.subTest(flag=flag):
+                expected = query_conductor._build_parser().parse_args([flag])
+                self.assertEqual(vars(query_conductor._fast_args([flag])), vars(expected))
+
+        self.assertIsNone(query_conductor._fast_args(["--stats", "--format", "json"]))
+
+
+class TestConductorQuery(unittest.TestCase):
+    """Test the ConductorQuery read API."""
+
+    def setUp(self):
+        from query_conductor import ConductorQuery
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = Path(self.temp_dir) / "memory" / "index.db"
+        self.db_path.parent.mkdir(parents=True)
+        copy_test_db(self.db_path)
+
+        with Conductor(base_path=self.temp_dir) as conductor:
+            run_id = conductor.start_run(workflow_name="query-test")
+            node = Node(id="n1", name="N1", node_type=NodeType.SINGLE, prompt_template="P")
+            conductor.record_node_failure(conductor.record_node_start(run_id, node, "P"), "broke")
+            conductor.lay_trail(run_id, "src/app.py", "blocker", message="stuck")
+
+        self.query = ConductorQuery(base_path=self.temp_dir)
+
+    def tearDown(self):
+        self.query.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_row_queries_return_lists_of_dicts(self):
+        """Row queries return materialized lists of plain dicts."""
+        results = {
+            "list_workflows": self.query.list_workflows(),
+            "get_active_runs": self.query.get_active_runs(),
+            "get_failed_nodes": self.query.get_failed_nodes(),
+            "get_blockers": self.query.get_blockers(),
+            "get_trails": self.query.get_trails(location="app"),
+            "get_hotspots": self.query.get_hotspots(),
+            "get_recent_executions": self.query.get_recent_executions(),
+        }
+        for name, rows in results.items():
+            with self.subTest(method=name):
+                self.assertIsInstance(rows, list)
+                self.assertEqual(len(rows), 1)
+                self.assertIsInstance(rows[0], dict)
+                json.dumps(rows)
+
+        self.assertEqual(results["get_failed_nodes"][0].get("error_message"), "broke")
+        self.assertEqual(results["get_trails"][0]["location"], "src/app.py")
+
+    def test_missing_database_raises_at_call(self):
+        """A missing database fails when the query is called, not on iteration."""
+        os.remove(self.db_path)
+        self.query.close()
+        with self.assertRaises(FileNotFoundError):
+            self.query.get_active_runs()
+
+
 class TestEndToEnd(unittest.TestCase):
     """Full end-to-end integration test."""
 
@@ -424,11 +1225,12 @@ class TestEndToEnd(unittest.TestCase):
         self.db_path.parent.mkdir(parents=True)
 
         # Initialize schema using helper
-        init_test_db(self.db_path)
+        copy_test_db(self.db_path)
 
         self.conductor = Conductor(base_path=self.temp_dir)
 
     def tearDown(self):
+        self.conductor.close()
         import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
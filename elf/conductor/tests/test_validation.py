@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from validation import (
     validate_identifier,
     validate_node_id,
+    validate_node_ids_bulk,
     validate_workflow_id,
     validate_run_id,
     validate_agent_id,
@@ -61,6 +62,7 @@ class TestValidation(unittest.TestCase):
             "node\\id",          # Backslash
             "node/id",           # Forward slash
             "node\nid",          # Newline
+            "node\n",            # Trailing newline
             "node\tid",          # Tab
             "node<id",           # Less than
             "node>id",           # Greater than
@@ -107,6 +109,22 @@ class TestValidation(unittest.TestCase):
         with self.assertRaises(ValidationError):
             validate_identifier(123, "test_id")
 
+    def test_bulk_node_ids_match_single_validator(self):
+        """Test that bulk node ID checks agree with validate_node_id."""
+        node_ids = [
+            "node123", "a", "a" * 100, "a" * 101, "", "_node", "node-",
+            "node;id", "node\n", "node id", "../node", "n-1_b", None, 42,
+        ]
+
+        def accepted(node_id):
+            try:
+                validate_node_id(node_id)
+                return True
+            except ValidationError:
+                return False
+
+        self.assertEqual(validate_node_ids_bulk(node_ids), [accepted(n) for n in node_ids])
+
     def test_specific_id_validators(self):
         """Test specific ID validators (node_id, workflow_id, etc.)."""
         # Valid IDs
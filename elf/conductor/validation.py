@@ -7,6 +7,17 @@ when handling user-provided identifiers like node_id, workflow_id, run_id, etc.
 """
 
 import re
+from typing import Iterable, List
+
+
+# Character whitelists, compiled once. Checked with fullmatch() so a
+# trailing newline cannot slip past the way it does with '$'.
+_IDENTIFIER_RE = re.compile(r'[a-zA-Z0-9_-]+')
+_AGENT_TYPE_RE = re.compile(r'[a-zA-Z0-9 _-]+')
+_FILENAME_RE = re.compile(r'[a-zA-Z0-9_.-]+')
+# Every validate_node_id rule in one pattern: 1-100 whitelisted characters,
+# not starting or ending with a hyphen or underscore
+_NODE_ID_RE = re.compile(r'[a-zA-Z0-9](?:[a-zA-Z0-9_-]{0,98}[a-zA-Z0-9])?')
 
 
 class ValidationError(ValueError):
@@ -53,7 +64,7 @@ def validate_identifier(value: str, name: str = "identifier", max_length: int =
         raise ValidationError(f"Invalid {name}: too long (max {max_length} chars, got {len(value)})")
 
     # Only allow alphanumeric, underscore, and hyphen
-    if not re.match(r'^[a-zA-Z0-9_-]+$', value):
+    if not _IDENTIFIER_RE.fullmatch(value):
         raise ValidationError(
             f"Invalid {name}: must contain only alphanumeric, underscore, or hyphen (got: {value!r})"
         )
@@ -81,6 +92,24 @@ def validate_node_id(node_id: str) -> str:
     return validate_identifier(node_id, "node_id", max_length=100)
 
 
+def validate_node_ids_bulk(node_ids: Iterable[str]) -> List[bool]:
+    """
+    Check many node IDs at once.
+
+    Applies the same rules as validate_node_id() through a single compiled
+    pattern, without raising, so large batches avoid per-ID exception
+    handling.
+
+    Args:
+        node_ids: Node IDs to check
+
+    Returns:
+        One bool per input, True where validate_node_id() would accept it
+    """
+    match = _NODE_ID_RE.fullmatch
+    return [isinstance(node_id, str) and match(node_id) is not None for node_id in node_ids]
+
+
 def validate_workflow_id(workflow_id: str) -> str:
     """
     Validate a workflow ID.
@@ -154,7 +183,7 @@ def validate_agent_type(agent_type: str) -> str:
         raise ValidationError(f"Invalid agent_type: too long (max 50 chars, got {len(agent_type)})")
 
     # Allow alphanumeric, spaces, underscores, and hyphens
-    if not re.match(r'^[a-zA-Z0-9 _-]+$', agent_type):
+    if not _AGENT_TYPE_RE.fullmatch(agent_type):
         raise ValidationError(
             f"Invalid agent_type: must contain only alphanumeric, spaces, underscores, or hyphens (got: {agent_type!r})"
         )
@@ -204,7 +233,7 @@ def validate_filename_safe(filename: str, name: str = "filename") -> str:
         raise ValidationError(f"Invalid {name}: cannot use reserved name '{filename}'")
 
     # Only allow safe filename characters
-    if not re.match(r'^[a-zA-Z0-9_.-]+$', filename):
+    if not _FILENAME_RE.fullmatch(filename):
         raise ValidationError(
             f"Invalid {name}: must contain only alphanumeric, underscore, hyphen, or period (got: {filename!r})"
         )